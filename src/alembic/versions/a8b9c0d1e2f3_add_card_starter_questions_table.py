@@ -0,0 +1,43 @@
+"""add card_starter_questions table
+
+Revision ID: a8b9c0d1e2f3
+Revises: f7a8b9c0d1e2
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a8b9c0d1e2f3"
+down_revision: str | Sequence[str] | None = "f7a8b9c0d1e2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create card_starter_questions.
+
+    No backfill here: run ``scripts/generate_starter_questions.py`` to precompute
+    rows, otherwise they're filled in as tutors are opened.
+    """
+    op.create_table(
+        "card_starter_questions",
+        sa.Column("card_id", sa.Integer(), nullable=False),
+        sa.Column("content_hash", sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False),
+        sa.Column("questions", sa.JSON(), nullable=False),
+        sa.Column("model", sqlmodel.sql.sqltypes.AutoString(length=100), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("card_id"),
+        sa.ForeignKeyConstraint(["card_id"], ["vocabulary_cards.id"], ondelete="CASCADE"),
+    )
+
+
+def downgrade() -> None:
+    """Drop card_starter_questions."""
+    op.drop_table("card_starter_questions")
@@ -0,0 +1,34 @@
+"""add rolling summary to word_tutor_threads
+
+Revision ID: b9c0d1e2f3a4
+Revises: a8b9c0d1e2f3
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b9c0d1e2f3a4"
+down_revision: str | Sequence[str] | None = "a8b9c0d1e2f3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add summary and summarized_until to word_tutor_threads.
+
+    No backfill: existing threads get a summary once they outgrow the history budget.
+    """
+    op.add_column("word_tutor_threads", sa.Column("summary", sa.Text(), nullable=True))
+    op.add_column("word_tutor_threads", sa.Column("summarized_until", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop the word_tutor_threads summary columns."""
+    op.drop_column("word_tutor_threads", "summarized_until")
+    op.drop_column("word_tutor_threads", "summary")
@@ -0,0 +1,85 @@
+"""add review_logs table
+
+Revision ID: c4d5e6f7a8b9
+Revises: 898ba0c66334
+Create Date: 2025-12-20 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d5e6f7a8b9"
+down_revision: str | Sequence[str] | None = "898ba0c66334"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create review_logs and backfill it from user_card_progress.quality_history."""
+    op.create_table(
+        "review_logs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("card_id", sa.Integer(), nullable=False),
+        sa.Column("reviewed_at", sa.DateTime(), nullable=False),
+        sa.Column("is_correct", sa.Boolean(), nullable=False),
+        sa.Column("interval", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("stability", sa.Float(), nullable=True),
+        sa.Column("difficulty", sa.Float(), nullable=True),
+        sa.Column(
+            "card_state",
+            postgresql.ENUM(
+                "NEW",
+                "LEARNING",
+                "REVIEW",
+                "RELEARNING",
+                name="cardstate",
+                create_type=False,
+            ),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["user_id"], ["profiles.id"]),
+        sa.ForeignKeyConstraint(["card_id"], ["vocabulary_cards.id"]),
+    )
+    op.create_index("ix_review_logs_user_id_reviewed_at", "review_logs", ["user_id", "reviewed_at"])
+    op.create_index("ix_review_logs_card_id", "review_logs", ["card_id"])
+
+    # Backfill: one row per well-formed quality_history entry
+    op.execute(
+        """
+        INSERT INTO review_logs (
+            user_id, card_id, reviewed_at, is_correct,
+            interval, stability, difficulty, card_state
+        )
+        SELECT
+            ucp.user_id,
+            ucp.card_id,
+            (entry->>'date')::timestamp,
+            COALESCE((entry->>'is_correct')::boolean, false),
+            COALESCE((entry->>'interval')::integer, 0),
+            (entry->>'stability')::double precision,
+            (entry->>'difficulty')::double precision,
+            COALESCE(entry->>'state', ucp.card_state::text)::cardstate
+        FROM user_card_progress AS ucp
+        CROSS JOIN LATERAL jsonb_array_elements(ucp.quality_history::jsonb) AS entry
+        WHERE ucp.quality_history IS NOT NULL
+          AND jsonb_typeof(ucp.quality_history::jsonb) = 'array'
+          AND jsonb_typeof(entry) = 'object'
+          AND entry->>'date' ~ '^\\d{4}-\\d{2}-\\d{2}'
+        ORDER BY ucp.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop review_logs (quality_history is left as-is)."""
+    op.drop_index("ix_review_logs_card_id", table_name="review_logs")
+    op.drop_index("ix_review_logs_user_id_reviewed_at", table_name="review_logs")
+    op.drop_table("review_logs")
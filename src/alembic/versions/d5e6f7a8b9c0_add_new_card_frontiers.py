@@ -0,0 +1,48 @@
+"""add new_card_frontiers table
+
+Revision ID: d5e6f7a8b9c0
+Revises: c4d5e6f7a8b9
+Create Date: 2025-12-21 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d5e6f7a8b9c0"
+down_revision: str | Sequence[str] | None = "c4d5e6f7a8b9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create new_card_frontiers and the (deck, rank, id) index it reads along.
+
+    No backfill: frontiers are created lazily on a user's first review in a deck.
+    """
+    op.create_table(
+        "new_card_frontiers",
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("deck_id", sa.Integer(), nullable=False),
+        sa.Column("next_rank", sa.Integer(), nullable=True),
+        sa.Column("next_card_id", sa.Integer(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("user_id", "deck_id"),
+        sa.ForeignKeyConstraint(["user_id"], ["profiles.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["deck_id"], ["decks.id"], ondelete="CASCADE"),
+    )
+    op.create_index(
+        "ix_vocabulary_cards_deck_rank_id",
+        "vocabulary_cards",
+        ["deck_id", sa.text("coalesce(frequency_rank, 2147483647)"), "id"],
+    )
+
+
+def downgrade() -> None:
+    """Drop new_card_frontiers and the new-card order index."""
+    op.drop_index("ix_vocabulary_cards_deck_rank_id", table_name="vocabulary_cards")
+    op.drop_table("new_card_frontiers")
@@ -0,0 +1,52 @@
+"""add due-card indexes to user_card_progress
+
+Revision ID: e6f7a8b9c0d1
+Revises: d5e6f7a8b9c0
+Create Date: 2025-12-22 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6f7a8b9c0d1"
+down_revision: str | Sequence[str] | None = "d5e6f7a8b9c0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add composite and partial indexes for user_id + next_review_date lookups."""
+    op.create_index(
+        "ix_user_card_progress_user_id_next_review_date",
+        "user_card_progress",
+        ["user_id", "next_review_date"],
+    )
+    op.create_index(
+        "ix_user_card_progress_user_id_card_state_next_review_date",
+        "user_card_progress",
+        ["user_id", "card_state", "next_review_date"],
+    )
+    op.create_index(
+        "ix_user_card_progress_due",
+        "user_card_progress",
+        ["user_id", "next_review_date"],
+        postgresql_where=sa.text("card_state <> 'NEW'"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the due-card indexes."""
+    op.drop_index("ix_user_card_progress_due", table_name="user_card_progress")
+    op.drop_index(
+        "ix_user_card_progress_user_id_card_state_next_review_date",
+        table_name="user_card_progress",
+    )
+    op.drop_index(
+        "ix_user_card_progress_user_id_next_review_date",
+        table_name="user_card_progress",
+    )
@@ -0,0 +1,91 @@
+"""add user_daily_stats table
+
+Revision ID: f7a8b9c0d1e2
+Revises: e6f7a8b9c0d1
+Create Date: 2025-12-23 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f7a8b9c0d1e2"
+down_revision: str | Sequence[str] | None = "e6f7a8b9c0d1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create user_daily_stats and backfill it from review_logs and study_sessions."""
+    op.create_table(
+        "user_daily_stats",
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("stat_date", sa.Date(), nullable=False),
+        sa.Column("cards_studied", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("correct_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("sessions_completed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("study_time_seconds", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("session_cards_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("new_cards_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("review_cards_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("review_correct_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("user_id", "stat_date"),
+        sa.ForeignKeyConstraint(["user_id"], ["profiles.id"], ondelete="CASCADE"),
+    )
+
+    # Reviews, bucketed by review day
+    op.execute(
+        """
+        INSERT INTO user_daily_stats (user_id, stat_date, cards_studied, correct_count)
+        SELECT user_id, reviewed_at::date, count(*), count(*) FILTER (WHERE is_correct)
+        FROM review_logs
+        GROUP BY user_id, reviewed_at::date
+        """
+    )
+
+    # Completed sessions, bucketed by the day they started
+    op.execute(
+        """
+        INSERT INTO user_daily_stats (
+            user_id, stat_date, sessions_completed, study_time_seconds, session_cards_count,
+            new_cards_count, review_cards_count, review_correct_count
+        )
+        SELECT
+            user_id,
+            started_at::date,
+            count(*),
+            coalesce(sum(greatest(extract(epoch FROM completed_at - started_at), 0)), 0)::int,
+            sum(correct_count + wrong_count),
+            sum(new_cards_count),
+            sum(review_cards_count),
+            sum(
+                CASE WHEN correct_count + wrong_count > 0
+                    THEN floor(
+                        review_cards_count * correct_count::float
+                        / (correct_count + wrong_count)
+                    )::int
+                    ELSE 0
+                END
+            )
+        FROM study_sessions
+        WHERE completed_at IS NOT NULL
+        GROUP BY user_id, started_at::date
+        ON CONFLICT (user_id, stat_date) DO UPDATE SET
+            sessions_completed = EXCLUDED.sessions_completed,
+            study_time_seconds = EXCLUDED.study_time_seconds,
+            session_cards_count = EXCLUDED.session_cards_count,
+            new_cards_count = EXCLUDED.new_cards_count,
+            review_cards_count = EXCLUDED.review_cards_count,
+            review_correct_count = EXCLUDED.review_correct_count
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop user_daily_stats."""
+    op.drop_table("user_daily_stats")
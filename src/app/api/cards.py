@@ -4,11 +4,11 @@
 영어 단어 카드의 생성, 조회, 수정, 삭제를 처리합니다.
 """
 
-import io
+from pathlib import Path as PathType
 from typing import Annotated, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.dependencies import CurrentActiveProfile
@@ -155,7 +155,10 @@ async def get_vocabulary_card(
 @router.get(
     "/{card_id}/audio",
     summary="단어 카드 발음 오디오 생성",
-    description="TTS를 사용하여 단어 카드의 발음 오디오를 실시간으로 생성하여 제공합니다.",
+    description=(
+        "TTS로 생성한 단어 카드의 발음 오디오 파일을 제공합니다. 한 번 생성된 오디오는 서버에 저장되어 재사용됩니다. "
+        "stream=true이면 아직 생성되지 않은 오디오를 생성되는 대로 청크 단위(chunked)로 전송합니다."
+    ),
     responses={
         200: {"description": "오디오 스트림 반환 성공"},
         401: {"description": "인증 실패 - 유효한 토큰이 필요함"},
@@ -172,6 +175,10 @@ async def get_vocabulary_card_audio(
         description="오디오 포맷 (mp3 또는 ogg)",
     ),
     voice: str | None = Query(default=None, description="TTS 보이스 (기본: 서버 설정)"),
+    stream: bool = Query(
+        default=False,
+        description="새로 생성하는 오디오를 완성되기 전부터 스트리밍으로 전송",
+    ),
     session: Annotated[AsyncSession, Depends(get_session)] = None,
     current_profile: CurrentActiveProfile = None,
 ):
@@ -182,18 +189,31 @@ async def get_vocabulary_card_audio(
             detail="Vocabulary card not found",
         )
 
-    audio_bytes = await TTSService.generate_audio(
-        profile_id=current_profile.id,
-        text=card.english_word,
-        audio_format=audio_format,
-        voice=voice,
-    )
-
     media_type = "audio/mpeg" if audio_format == "mp3" else "audio/ogg"
-    response = StreamingResponse(io.BytesIO(audio_bytes), media_type=media_type)
-    response.headers["Cache-Control"] = "public, max-age=86400"
-    response.headers["Content-Disposition"] = f'inline; filename="card-{card_id}.{audio_format}"'
-    return response
+    headers = {
+        "Cache-Control": "public, max-age=86400",
+        "Content-Disposition": f'inline; filename="card-{card_id}.{audio_format}"',
+    }
+
+    if stream:
+        audio = await TTSService.stream_audio(
+            profile_id=current_profile.id,
+            text=card.english_word,
+            audio_format=audio_format,
+            voice=voice,
+        )
+        if not isinstance(audio, PathType):
+            return StreamingResponse(audio, media_type=media_type, headers=headers)
+        audio_path = audio
+    else:
+        audio_path = await TTSService.get_audio_file(
+            profile_id=current_profile.id,
+            text=card.english_word,
+            audio_format=audio_format,
+            voice=voice,
+        )
+
+    return FileResponse(audio_path, media_type=media_type, headers=headers)
 
 
 @router.patch(
@@ -22,6 +22,7 @@ from app.models import (
     SelectDecksResponse,
 )
 from app.services.deck_service import DeckService
+from app.services.profile_service import ProfileService
 
 TAG = "decks"
 TAG_METADATA = {
@@ -111,6 +112,7 @@ async def update_selected_decks(
     success, selected_deck_ids, error_message = await DeckService.update_selected_decks(
         session, current_profile.id, request.select_all, request.deck_ids
     )
+    ProfileService.invalidate_cached_profile(current_profile.id)
 
     if not success:
         if "not found" in error_message:
@@ -16,6 +16,10 @@ from app.database import get_session
 from app.models import (
     AnswerRequest,
     AnswerResponse,
+    BatchAnswerRequest,
+    BatchAnswerResponse,
+    CardBatchRequest,
+    CardBatchResponse,
     CardRequest,
     CardResponse,
     SessionAbandonRequest,
@@ -56,7 +60,9 @@ TAG_METADATA = {
 **세션 플로우:**
 1. `POST /session/start` → session_id 발급
 2. `POST /session/card` → quiz_type 지정하여 카드 조회 (반복)
+   - 또는 `POST /session/{session_id}/cards:batch` → 여러 장을 한 번에 미리 조회
 3. `POST /session/answer` → 정답 제출, FSRS 자동 업데이트 (반복)
+   - 또는 `POST /session/{session_id}/answers:batch` → 여러 답안을 한 번에 제출
 4. `POST /session/complete` → 세션 완료, XP/스트릭/일일목표 반영
 
 **퀴즈 유형:** word_to_meaning, meaning_to_word, cloze, listening""",
@@ -216,6 +222,55 @@ async def get_next_card(
     )
 
 
+@router.post(
+    "/session/{session_id}/cards:batch",
+    response_model=CardBatchResponse,
+    summary="카드 일괄 조회",
+    description="세션의 다음 카드 N장을 한 번에 조회합니다. 지연이 큰 네트워크에서 세션 카드를 미리 받아둘 때 사용합니다.",
+    responses={
+        200: {"description": "카드 일괄 조회 성공. 포맷팅된 문제와 선택지 목록 반환"},
+        401: {"description": "인증 실패 - 유효한 토큰이 필요함"},
+        404: {"description": "세션 또는 카드를 찾을 수 없음"},
+        422: {"description": "유효성 검사 실패"},
+    },
+)
+async def get_next_cards_batch(
+    request: CardBatchRequest,
+    session_id: UUID = Path(description="세션 ID"),
+    session: Annotated[AsyncSession, Depends(get_session)] = None,
+    current_profile: CurrentActiveProfile = None,
+) -> CardBatchResponse:
+    """
+    다음 학습할 카드 여러 장을 한 번에 조회합니다.
+
+    **인증 필요:** Bearer 토큰
+
+    **파라미터:**
+    - `session_id`: 세션 UUID
+
+    **요청 본문:**
+    - `quiz_type`: 모든 카드에 적용할 퀴즈 유형
+    - `count`: 받을 카드 수 (기본값: 10, 최대: 50)
+
+    **반환 정보:**
+    - `cards`: 포맷팅된 카드 목록 (세션 순서, `/session/card`의 `card`와 동일한 형식)
+    - `cards_remaining`: 이번 묶음 이후 남은 카드 수
+    - `cards_completed`: 이번 묶음 이전에 완료한 카드 수
+
+    **참고:**
+    - 반환된 카드는 조회된 것으로 처리되어 `/session/card`에서 다시 반환되지 않습니다
+    - 정답은 카드별로 `/session/answer`에 제출합니다
+    - `cards`가 빈 배열이면 `/session/complete`를 호출하여 세션 종료
+    """
+    return await StudySessionService.get_next_cards(
+        session=session,
+        user_id=current_profile.id,
+        session_id=session_id,
+        quiz_type=request.quiz_type,
+        count=request.count,
+    )
+
+
 @router.post(
     "/session/answer",
     response_model=AnswerResponse,
@@ -281,6 +336,58 @@ async def submit_answer(
     )
 
 
+@router.post(
+    "/session/{session_id}/answers:batch",
+    response_model=BatchAnswerResponse,
+    summary="정답 일괄 제출",
+    description="여러 카드의 정답을 한 번에 제출합니다. 오프라인/대기열 클라이언트용이며 하나의 트랜잭션으로 반영됩니다.",
+    responses={
+        200: {"description": "일괄 처리 완료. 답안별 결과 반환 (일부 답안은 실패할 수 있음)"},
+        401: {"description": "인증 실패 - 유효한 토큰이 필요함"},
+        404: {"description": "세션을 찾을 수 없음"},
+        422: {"description": "유효성 검사 실패"},
+    },
+)
+async def submit_answers_batch(
+    request: BatchAnswerRequest,
+    session_id: UUID = Path(description="세션 ID"),
+    session: Annotated[AsyncSession, Depends(get_session)] = None,
+    current_profile: CurrentActiveProfile = None,
+) -> BatchAnswerResponse:
+    """
+    여러 카드의 정답을 한 번에 제출합니다.
+
+    **인증 필요:** Bearer 토큰
+
+    **파라미터:**
+    - `session_id`: 세션 UUID
+
+    **요청 본문:**
+    - `answers`: 답안 목록 (풀이한 순서, 1~100개)
+      - 각 항목은 `/session/answer` 요청 본문에서 `session_id`를 뺀 형식
+
+    **처리 내용:**
+    - 답안마다 `/session/answer`와 동일한 채점/FSRS 규칙 적용
+    - 학습 진행, 복습 로그, 오답 노트, 세션 통계를 하나의 트랜잭션으로 저장
+    - 같은 카드의 답안이 여러 개면 순서대로 누적 반영
+
+    **반환 정보:**
+    - `results`: 답안별 결과 (요청 순서)
+      - `index`: 요청 배열에서의 위치
+      - `card_id`: 카드 ID
+      - `result`: 성공 시 `/session/answer` 응답과 동일한 결과
+      - `error`: 실패 시 사유 (세션에 없는 카드 등)
+    - `accepted_count`: 반영된 답안 수
+    - `rejected_count`: 반영되지 않은 답안 수
+    """
+    return await StudySessionService.submit_answers_batch(
+        session=session,
+        user_id=current_profile.id,
+        session_id=session_id,
+        answers=request.answers,
+    )
+
+
 @router.post(
     "/session/complete",
     response_model=SessionCompleteResponse,
@@ -1,18 +1,24 @@
 """Word tutor chat endpoints (study-session scoped)."""
 
+import json
+from collections.abc import AsyncIterator
 from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Path, Query
+from fastapi.responses import StreamingResponse
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.dependencies import CurrentActiveProfile
+from app.core.exceptions import LoopsAPIException
+from app.core.logging import logger
 from app.database import get_session
 from app.models import (
     TutorHistoryResponse,
     TutorMessageRequest,
     TutorMessageResponse,
     TutorStartResponse,
+    TutorStreamToken,
 )
 from app.services.word_tutor_service import WordTutorService
 
@@ -67,6 +73,63 @@ async def send_word_tutor_message(
     )
 
 
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _tutor_sse(
+    events: AsyncIterator[TutorStreamToken | TutorMessageResponse],
+) -> AsyncIterator[str]:
+    try:
+        async for event in events:
+            if isinstance(event, TutorStreamToken):
+                yield _sse("token", event.model_dump())
+            else:
+                yield _sse("done", event.model_dump(mode="json"))
+    except Exception as e:
+        # The 200 response has already started; report the failure in-stream
+        logger.exception("Tutor stream failed")
+        if isinstance(e, LoopsAPIException):
+            yield _sse("error", {"error": e.error_type, "message": e.message})
+        else:
+            yield _sse(
+                "error", {"error": "internal_error", "message": "답변 생성 중 오류가 발생했습니다."}
+            )
+
+
+@router.post(
+    "/session/{session_id}/cards/{card_id}/tutor/message/stream",
+    summary="단어 튜터 챗 메시지 전송 (스트리밍)",
+    description=(
+        "답변을 생성되는 대로 Server-Sent Events로 전송합니다.\n\n"
+        '- `token`: 답변 조각 `{"text": ...}`\n'
+        "- `done`: 저장된 최종 답변과 후속 추천 질문 (`TutorMessageResponse`와 동일)\n"
+        '- `error`: 스트리밍 도중 실패 `{"error": ..., "message": ...}` (대화는 저장되지 않음)'
+    ),
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}, "description": "SSE 스트림"}},
+)
+async def stream_word_tutor_message(
+    request: TutorMessageRequest,
+    session_id: UUID = Path(description="학습 세션 ID"),
+    card_id: int = Path(description="카드 ID"),
+    session: Annotated[AsyncSession, Depends(get_session)] = None,
+    current_profile: CurrentActiveProfile = None,
+) -> StreamingResponse:
+    events = await WordTutorService.stream_message(
+        session=session,
+        user_id=current_profile.id,
+        session_id=session_id,
+        card_id=card_id,
+        request=request,
+    )
+    return StreamingResponse(
+        _tutor_sse(events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get(
     "/session/{session_id}/cards/{card_id}/tutor/history",
     response_model=TutorHistoryResponse,
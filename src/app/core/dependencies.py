@@ -6,6 +6,7 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -41,8 +42,9 @@ async def get_current_profile(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    # Verify Supabase token and get user id
-    supabase_uid = verify_supabase_token(credentials.credentials)
+    # Verify Supabase token and get user id.
+    # Runs in a worker thread: remote verification and JWKS refreshes do blocking HTTP.
+    supabase_uid = await run_in_threadpool(verify_supabase_token, credentials.credentials)
     if supabase_uid is None:
         raise credentials_exception
 
@@ -51,6 +53,8 @@ async def get_current_profile(
     if profile is None:
         raise credentials_exception
 
+    # Share the loaded profile with services for the rest of the request
+    ProfileService.set_request_profile(profile)
     return profile
 
 
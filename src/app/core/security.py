@@ -1,16 +1,37 @@
 """
 Security utilities for Supabase token verification.
+
+Two verification modes are supported (``settings.supabase_jwt_verification``):
+
+- ``remote``: ask Supabase Auth (``auth.get_user``) for every token.
+- ``local``: validate the JWT signature and claims in-process using the project's
+  JWKS (asymmetric keys) or JWT secret (legacy HS256). Remote verification is only
+  used as a fallback when the token is signed with a key we don't know yet.
 """
 
+import threading
+import time
+
+import httpx
+import jwt
 from supabase import Client, create_client
 
 from app.config import settings
+from app.core.logging import logger
 
 # Supabase client with publishable key (for auth operations)
 _supabase_client: Client | None = None
 # Supabase client with secret key (for admin/storage operations)
 _supabase_admin_client: Client | None = None
 
+# Algorithms accepted for locally verified Supabase JWTs
+_ASYMMETRIC_ALGORITHMS = {"RS256", "ES256", "EdDSA"}
+_SYMMETRIC_ALGORITHMS = {"HS256"}
+
+
+class UnknownSigningKeyError(Exception):
+    """Raised when a token is signed with a key that is not in the JWKS cache."""
+
 
 def get_supabase_client() -> Client:
     """Get Supabase client with publishable key for auth operations."""
@@ -36,16 +57,132 @@ def get_supabase_admin_client() -> Client:
     return _supabase_admin_client
 
 
-def verify_supabase_token(token: str) -> str | None:
+class JWKSCache:
+    """Thread-safe cache of the Supabase project's JSON Web Key Set.
+
+    Keys are refreshed when the TTL expires or when a token references an unknown
+    ``kid`` (key rotation). Refreshes triggered by unknown kids are throttled so a
+    flood of forged tokens can't turn into a flood of JWKS fetches.
     """
-    Verify a Supabase token using the Supabase client.
 
-    Args:
-        token: The JWT token from Authorization header
+    def __init__(self) -> None:
+        self._keys: dict[str, jwt.PyJWK] = {}
+        self._fetched_at: float | None = None
+        self._lock = threading.Lock()
 
-    Returns:
-        Supabase user ID if valid, None if invalid
-    """
+    @staticmethod
+    def jwks_url() -> str:
+        return f"{settings.supabase_url.rstrip('/')}/auth/v1/.well-known/jwks.json"
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys = {}
+            self._fetched_at = None
+
+    def get_key(self, kid: str) -> jwt.PyJWK:
+        """Return the signing key for ``kid``, refreshing the key set if needed."""
+        now = time.monotonic()
+        ttl = max(0, int(settings.supabase_jwks_ttl_seconds))
+        min_refresh = max(0, int(settings.supabase_jwks_min_refresh_seconds))
+
+        with self._lock:
+            expired = self._fetched_at is None or now - self._fetched_at >= ttl
+            key = self._keys.get(kid)
+            if key is not None and not expired:
+                return key
+
+            can_refresh = self._fetched_at is None or now - self._fetched_at >= min_refresh
+            if expired or can_refresh:
+                try:
+                    self._keys = self._fetch_keys()
+                    self._fetched_at = now
+                except Exception as e:
+                    # Keep serving the previous key set if the refresh fails
+                    logger.warning("JWKS refresh failed", error=str(e))
+
+            key = self._keys.get(kid)
+            if key is None:
+                raise UnknownSigningKeyError(kid)
+            return key
+
+    def _fetch_keys(self) -> dict[str, jwt.PyJWK]:
+        response = httpx.get(
+            self.jwks_url(),
+            headers={"apikey": settings.supabase_publishable_key},
+            timeout=5.0,
+        )
+        response.raise_for_status()
+
+        keys: dict[str, jwt.PyJWK] = {}
+        for jwk in response.json().get("keys", []):
+            kid = jwk.get("kid")
+            if not kid:
+                continue
+            try:
+                keys[kid] = jwt.PyJWK(jwk)
+            except jwt.PyJWTError:
+                # Skip keys using algorithms we can't handle
+                continue
+        return keys
+
+
+class VerifiedTokenCache:
+    """Short-TTL cache of token -> user ID for already verified tokens."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> str | None:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return None
+            expires_at, user_id = entry
+            if expires_at <= now:
+                self._entries.pop(token, None)
+                return None
+            return user_id
+
+    def set(self, token: str, user_id: str, token_exp: float | None) -> None:
+        ttl = max(0, int(settings.supabase_token_cache_ttl_seconds))
+        if ttl == 0:
+            return
+
+        now = time.time()
+        # Never cache a token beyond its own expiry
+        expires_at = now + ttl if token_exp is None else min(now + ttl, token_exp)
+        if expires_at <= now:
+            return
+
+        with self._lock:
+            self._entries[token] = (expires_at, user_id)
+            if len(self._entries) > max(1, int(settings.supabase_token_cache_max_entries)):
+                self._prune_locked(now)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+
+    def _prune_locked(self, now: float) -> None:
+        # Remove expired first
+        expired_keys = [k for k, (exp, _) in self._entries.items() if exp <= now]
+        for k in expired_keys:
+            self._entries.pop(k, None)
+
+        # Hard cap fallback: drop oldest inserted items until within limit
+        max_entries = max(1, int(settings.supabase_token_cache_max_entries))
+        while len(self._entries) > max_entries:
+            self._entries.pop(next(iter(self._entries)))
+
+
+jwks_cache = JWKSCache()
+verified_token_cache = VerifiedTokenCache()
+
+
+def _verify_token_remotely(token: str) -> str | None:
+    """Verify a token by asking Supabase Auth (one HTTP round-trip)."""
     try:
         supabase = get_supabase_client()
         response = supabase.auth.get_user(token)
@@ -54,3 +191,75 @@ def verify_supabase_token(token: str) -> str | None:
         return None
     except Exception:
         return None
+
+
+def decode_supabase_token(token: str) -> dict:
+    """
+    Validate a Supabase JWT locally and return its claims.
+
+    Raises:
+        UnknownSigningKeyError: If the token's signing key is not known locally
+        jwt.PyJWTError: If the token is malformed, expired or has a bad signature
+    """
+    header = jwt.get_unverified_header(token)
+    algorithm = header.get("alg")
+
+    if algorithm in _SYMMETRIC_ALGORITHMS:
+        if not settings.supabase_jwt_secret:
+            raise UnknownSigningKeyError("jwt secret not configured")
+        key: str | jwt.PyJWK = settings.supabase_jwt_secret
+    elif algorithm in _ASYMMETRIC_ALGORITHMS:
+        kid = header.get("kid")
+        if not kid:
+            raise jwt.InvalidTokenError("Missing kid header")
+        key = jwks_cache.get_key(kid)
+    else:
+        raise jwt.InvalidAlgorithmError(f"Unsupported algorithm: {algorithm}")
+
+    return jwt.decode(
+        token,
+        key=key,
+        algorithms=[algorithm],
+        audience=settings.supabase_jwt_audience,
+        issuer=f"{settings.supabase_url.rstrip('/')}/auth/v1",
+        leeway=settings.supabase_jwt_leeway_seconds,
+        options={"require": ["exp", "sub"]},
+    )
+
+
+def verify_supabase_token(token: str) -> str | None:
+    """
+    Verify a Supabase token.
+
+    In ``local`` mode the signature and claims are checked in-process and results
+    are cached briefly; Supabase Auth is only called when the signing key is
+    unknown. In ``remote`` mode every call goes to Supabase Auth.
+
+    Args:
+        token: The JWT token from Authorization header
+
+    Returns:
+        Supabase user ID if valid, None if invalid
+    """
+    if settings.supabase_jwt_verification != "local":
+        return _verify_token_remotely(token)
+
+    cached_user_id = verified_token_cache.get(token)
+    if cached_user_id is not None:
+        return cached_user_id
+
+    try:
+        claims = decode_supabase_token(token)
+    except UnknownSigningKeyError:
+        user_id = _verify_token_remotely(token)
+        if user_id is not None:
+            # Supabase Auth checked the signature; the claims only cap the cache entry
+            token_exp = jwt.decode(token, options={"verify_signature": False}).get("exp")
+            verified_token_cache.set(token, user_id, token_exp)
+        return user_id
+    except jwt.PyJWTError:
+        return None
+
+    user_id = claims["sub"]
+    verified_token_cache.set(token, user_id, claims.get("exp"))
+    return user_id
@@ -1,9 +1,10 @@
 import os
 import ssl
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
 from pathlib import Path
 
 import certifi
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import sessionmaker
@@ -70,6 +71,16 @@ async def init_db() -> None:
         await conn.run_sync(SQLModel.metadata.create_all)
 
 
+def dialect_insert(session: AsyncSession) -> Callable[..., postgresql.Insert | sqlite.Insert]:
+    """``insert`` for the session's database, for ``on_conflict_do_*`` upserts.
+
+    Postgres in production, SQLite in tests; both support ``ON CONFLICT``.
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        return postgresql.insert
+    return sqlite.insert
+
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency to get database session.
@@ -16,7 +16,11 @@ from app.api import router as api_router
 from app.config import settings
 from app.core.exceptions import LoopsAPIException
 from app.core.logging import logger, setup_logging
-from app.database import engine
+from app.database import async_session_maker, engine
+from app.services.catalog_cache import CatalogCache
+from app.services.distractor_index import DistractorIndex
+from app.services.openai_clients import OpenAIClients
+from app.services.word_tutor_service import WordTutorService
 
 # Track application start time for uptime calculation
 APP_START_TIME = time()
@@ -29,10 +33,22 @@ async def lifespan(app: FastAPI):
     setup_logging()
     logger.info("Application starting", version=settings.app_version)
 
+    # Warm the quiz distractor index and catalog snapshot; both fall back to a lazy
+    # build on first use
+    try:
+        async with async_session_maker() as session:
+            await DistractorIndex.build(session)
+            await CatalogCache.build(session)
+    except Exception as e:
+        logger.warning("In-memory index warm-up failed", error=str(e))
+
     yield
 
-    # Shutdown: Dispose database engine
+    # Shutdown: Let background tutor summaries finish (they use both), then close the
+    # shared OpenAI connection pool and dispose database engine
     logger.info("Application shutting down")
+    await WordTutorService.wait_for_summary_refreshes()
+    await OpenAIClients.aclose()
     await engine.dispose()
 
 
@@ -9,6 +9,12 @@ from app.models.schemas import (
     AccuracyByPeriod,
     AnswerRequest,
     AnswerResponse,
+    BatchAnswerItem,
+    BatchAnswerRequest,
+    BatchAnswerResponse,
+    BatchAnswerResult,
+    CardBatchRequest,
+    CardBatchResponse,
     CardRequest,
     CardResponse,
     CardSummary,
@@ -72,6 +78,7 @@ from app.models.schemas import (
     TutorMessageRequest,
     TutorMessageResponse,
     TutorStartResponse,
+    TutorStreamToken,
     UserCardProgressCreate,
     UserCardProgressRead,
     UserSelectedDeckCreate,
@@ -90,15 +97,19 @@ from app.models.schemas import (
 
 # Tables (DB Models) - includes Base classes
 from app.models.tables import (
+    CardStarterQuestions,
     Deck,
     DeckBase,
     Favorite,
+    NewCardFrontier,
     Profile,
     ProfileBase,
+    ReviewLog,
     StudySession,
     StudySessionBase,
     UserCardProgress,
     UserCardProgressBase,
+    UserDailyStats,
     UserSelectedDeck,
     VocabularyCard,
     VocabularyCardBase,
@@ -122,6 +133,10 @@ __all__ = [
     "Profile",
     "VocabularyCard",
     "UserCardProgress",
+    "ReviewLog",
+    "NewCardFrontier",
+    "UserDailyStats",
+    "CardStarterQuestions",
     "Deck",
     "Favorite",
     "UserSelectedDeck",
@@ -196,12 +211,18 @@ __all__ = [
     "SessionPreviewResponse",
     "SessionPreviewAvailable",
     "SessionPreviewAllocation",
+    "CardBatchRequest",
+    "CardBatchResponse",
     "CardRequest",
     "CardResponse",
     "StudyCard",
     "ClozeQuestion",
     "AnswerRequest",
     "AnswerResponse",
+    "BatchAnswerItem",
+    "BatchAnswerRequest",
+    "BatchAnswerResponse",
+    "BatchAnswerResult",
     "SessionCompleteRequest",
     "SessionCompleteResponse",
     "SessionSummary",
@@ -217,6 +238,7 @@ __all__ = [
     "TutorMessageResponse",
     "TutorMessageRead",
     "TutorHistoryResponse",
+    "TutorStreamToken",
     # Session Status & Abandon Schemas
     "SessionDailyGoalInfo",
     "SessionStatusResponse",
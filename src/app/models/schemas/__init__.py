@@ -35,7 +35,13 @@ from app.models.schemas.study import (
     AnswerRequest,
     AnswerResponse,
     AvailableCards,
+    BatchAnswerItem,
+    BatchAnswerRequest,
+    BatchAnswerResponse,
+    BatchAnswerResult,
     CardAllocation,
+    CardBatchRequest,
+    CardBatchResponse,
     CardRequest,
     CardResponse,
     ClozeQuestion,
@@ -96,6 +102,7 @@ from app.models.schemas.word_tutor import (
     TutorMessageRequest,
     TutorMessageResponse,
     TutorStartResponse,
+    TutorStreamToken,
 )
 from app.models.schemas.wrong_answer import (
     WrongAnswerCardInfo,
@@ -169,12 +176,18 @@ __all__ = [
     "SessionPreviewResponse",
     "SessionPreviewAvailable",
     "SessionPreviewAllocation",
+    "CardBatchRequest",
+    "CardBatchResponse",
     "CardRequest",
     "CardResponse",
     "StudyCard",
     "ClozeQuestion",
     "AnswerRequest",
     "AnswerResponse",
+    "BatchAnswerItem",
+    "BatchAnswerRequest",
+    "BatchAnswerResponse",
+    "BatchAnswerResult",
     "SessionCompleteRequest",
     "SessionCompleteResponse",
     "SessionSummary",
@@ -190,6 +203,7 @@ __all__ = [
     "TutorMessageResponse",
     "TutorMessageRead",
     "TutorHistoryResponse",
+    "TutorStreamToken",
     # Session Preview (aliases)
     "AvailableCards",
     "CardAllocation",
@@ -136,6 +136,23 @@ class CardResponse(SQLModel):
     cards_completed: int = Field(description="완료한 카드 수")
 
 
+class CardBatchRequest(SQLModel):
+    """카드 일괄 요청 스키마 (세션 카드 미리 받기)."""
+
+    quiz_type: QuizType = Field(description="이번 묶음의 카드에 적용할 퀴즈 유형")
+    count: int = Field(default=10, ge=1, le=50, description="받을 카드 수 (1~50)")
+
+
+class CardBatchResponse(SQLModel):
+    """카드 일괄 응답 스키마."""
+
+    cards: list[StudyCard] = Field(
+        description="학습 카드 목록 (세션 순서). 비어 있으면 모든 카드 완료"
+    )
+    cards_remaining: int = Field(description="이번 묶음 이후 남은 카드 수")
+    cards_completed: int = Field(description="이번 묶음 이전에 완료한 카드 수")
+
+
 # ============================================================
 # Answer Request/Response
 # ============================================================
@@ -178,6 +195,46 @@ class AnswerResponse(SQLModel):
     card_state: CardState = Field(description="카드 상태 (NEW/LEARNING/REVIEW/RELEARNING)")
 
 
+class BatchAnswerItem(SQLModel):
+    """일괄 제출의 개별 답안 스키마 (AnswerRequest에서 session_id 제외)."""
+
+    card_id: int = Field(description="카드 ID")
+    answer: str = Field(description="사용자 입력 정답")
+    response_time_ms: int | None = Field(default=None, ge=0, description="응답 시간 (밀리초)")
+    hint_count: int = Field(default=0, ge=0, description="사용한 힌트 횟수 (0=미사용)")
+    revealed_answer: bool = Field(default=False, description="정답보기로 정답 공개했는지 여부")
+    quiz_type: str | None = Field(
+        default=None,
+        description="퀴즈 유형 (word_to_meaning/meaning_to_word/cloze/listening)",
+    )
+
+
+class BatchAnswerRequest(SQLModel):
+    """정답 일괄 제출 요청 스키마 (오프라인/대기열 클라이언트용)."""
+
+    answers: list[BatchAnswerItem] = Field(
+        min_length=1, max_length=100, description="제출할 답안 목록 (풀이 순서, 1~100개)"
+    )
+
+
+class BatchAnswerResult(SQLModel):
+    """일괄 제출의 답안별 처리 결과."""
+
+    index: int = Field(description="요청 answers 배열에서의 위치")
+    card_id: int = Field(description="카드 ID")
+    result: AnswerResponse | None = Field(default=None, description="처리 결과 (성공 시)")
+    error: str | None = Field(default=None, description="처리되지 않은 이유 (실패 시)")
+
+
+class BatchAnswerResponse(SQLModel):
+    """정답 일괄 제출 응답 스키마."""
+
+    session_id: UUID = Field(description="세션 ID")
+    results: list[BatchAnswerResult] = Field(description="답안별 결과 (요청 순서)")
+    accepted_count: int = Field(description="반영된 답안 수")
+    rejected_count: int = Field(description="반영되지 않은 답안 수")
+
+
 # ============================================================
 # Session Complete
 # ============================================================
@@ -40,6 +40,12 @@ class TutorMessageResponse(SQLModel):
     follow_up_questions: list[str] = Field(description="후속 추천 질문")
 
 
+class TutorStreamToken(SQLModel):
+    """Part of the assistant reply, streamed as it is generated."""
+
+    text: str = Field(description="답변 조각")
+
+
 class TutorHistoryResponse(SQLModel):
     """Conversation history."""
 
@@ -1,8 +1,12 @@
+from app.models.tables.card_starter_questions import CardStarterQuestions
 from app.models.tables.deck import Deck, DeckBase
 from app.models.tables.favorite import Favorite
+from app.models.tables.new_card_frontier import NewCardFrontier
 from app.models.tables.profile import Profile, ProfileBase
+from app.models.tables.review_log import ReviewLog
 from app.models.tables.study_session import StudySession, StudySessionBase
 from app.models.tables.user_card_progress import UserCardProgress, UserCardProgressBase
+from app.models.tables.user_daily_stats import UserDailyStats
 from app.models.tables.user_selected_deck import UserSelectedDeck
 from app.models.tables.vocabulary_card import VocabularyCard, VocabularyCardBase
 from app.models.tables.word_tutor_message import WordTutorMessage, WordTutorMessageBase
@@ -14,6 +18,10 @@ __all__ = [
     "Profile",
     "VocabularyCard",
     "UserCardProgress",
+    "ReviewLog",
+    "NewCardFrontier",
+    "UserDailyStats",
+    "CardStarterQuestions",
     "Deck",
     "Favorite",
     "UserSelectedDeck",
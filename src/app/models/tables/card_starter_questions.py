@@ -0,0 +1,32 @@
+"""Card starter questions model: shared tutor starter questions per vocabulary card."""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, ForeignKey, Integer
+from sqlmodel import Column, Field, SQLModel
+
+
+class CardStarterQuestions(SQLModel, table=True):
+    """Card starter questions database model.
+
+    Starter questions depend only on the card content the tutor prompt sees, so
+    they're generated once per card and shared by every tutor thread for it.
+    ``content_hash`` covers the prompt and that content; a row whose hash no
+    longer matches the card is stale and gets regenerated.
+    """
+
+    __tablename__ = "card_starter_questions"
+
+    card_id: int = Field(
+        sa_column=Column(
+            Integer,
+            ForeignKey("vocabulary_cards.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False,
+        ),
+    )
+    content_hash: str = Field(max_length=64, nullable=False)
+    questions: list[str] = Field(default_factory=list, sa_column=Column(JSON, nullable=False))
+    model: str | None = Field(default=None, max_length=100)
+
+    updated_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
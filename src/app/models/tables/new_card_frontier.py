@@ -0,0 +1,38 @@
+"""New-card frontier model: per-user, per-deck cursor for unseen card selection."""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import ForeignKey, Integer, Uuid
+from sqlmodel import Column, Field, SQLModel
+
+
+class NewCardFrontier(SQLModel, table=True):
+    """New-card frontier database model.
+
+    Cards in a deck are ordered by ``(coalesce(frequency_rank, RANK_NULLS_LAST), id)``.
+    ``(next_rank, next_card_id)`` is the position of the first card in that order the
+    user hasn't seen yet: every card before it has progress, so new-card selection
+    can start reading there instead of anti-joining the whole deck. Cards after the
+    frontier may still be seen (reviewed out of order) and are filtered as usual.
+
+    ``next_card_id`` is NULL once every card in the deck has been seen.
+    """
+
+    __tablename__ = "new_card_frontiers"
+
+    user_id: UUID = Field(
+        sa_column=Column(
+            Uuid, ForeignKey("profiles.id", ondelete="CASCADE"), primary_key=True, nullable=False
+        ),
+    )
+    deck_id: int = Field(
+        sa_column=Column(
+            Integer, ForeignKey("decks.id", ondelete="CASCADE"), primary_key=True, nullable=False
+        ),
+    )
+
+    next_rank: int | None = Field(default=None)
+    next_card_id: int | None = Field(default=None)
+
+    updated_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
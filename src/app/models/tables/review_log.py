@@ -0,0 +1,40 @@
+"""Review log model: one append-only row per card review."""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import ForeignKey, Index, Uuid
+from sqlmodel import Column, Enum, Field, SQLModel
+
+from app.models.enums import CardState
+
+
+class ReviewLog(SQLModel, table=True):
+    """Review log database model.
+
+    Written once per review and never updated. Replaces the ever-growing
+    ``user_card_progress.quality_history`` JSON column for history queries.
+    """
+
+    __tablename__ = "review_logs"
+    __table_args__ = (Index("ix_review_logs_user_id_reviewed_at", "user_id", "reviewed_at"),)
+
+    id: int | None = Field(default=None, primary_key=True, nullable=False)
+    user_id: UUID = Field(
+        sa_column=Column(Uuid, ForeignKey("profiles.id"), nullable=False),
+    )
+    card_id: int = Field(foreign_key="vocabulary_cards.id", index=True)
+
+    reviewed_at: datetime = Field(nullable=False)
+    is_correct: bool = Field(nullable=False)
+
+    # FSRS state after the review
+    interval: int = Field(default=0)
+    stability: float | None = Field(default=None)
+    difficulty: float | None = Field(default=None)
+    card_state: CardState = Field(
+        sa_column=Column(
+            Enum(CardState, values_callable=lambda x: [e.value for e in x]),
+            nullable=False,
+        ),
+    )
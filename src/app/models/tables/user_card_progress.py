@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, Uuid
+from sqlalchemy import ForeignKey, Index, Uuid, text
 from sqlmodel import JSON, Column, Enum, Field, SQLModel, UniqueConstraint
 
 from app.models.base import TimestampMixin
@@ -37,7 +37,25 @@ class UserCardProgress(UserCardProgressBase, TimestampMixin, table=True):
     """UserCardProgress database model for tracking FSRS progress."""
 
     __tablename__ = "user_card_progress"
-    __table_args__ = (UniqueConstraint("user_id", "card_id", name="uq_user_card"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "card_id", name="uq_user_card"),
+        # Due-card lookups: user_id = ? AND next_review_date <= now [AND card_state ...]
+        Index("ix_user_card_progress_user_id_next_review_date", "user_id", "next_review_date"),
+        Index(
+            "ix_user_card_progress_user_id_card_state_next_review_date",
+            "user_id",
+            "card_state",
+            "next_review_date",
+        ),
+        # Rows stay NEW only until their first review is applied; due queries skip them
+        Index(
+            "ix_user_card_progress_due",
+            "user_id",
+            "next_review_date",
+            postgresql_where=text("card_state <> 'NEW'"),
+            sqlite_where=text("card_state <> 'NEW'"),
+        ),
+    )
 
     id: int | None = Field(default=None, primary_key=True, nullable=False)
 
@@ -53,4 +71,5 @@ class UserCardProgress(UserCardProgressBase, TimestampMixin, table=True):
         ),
     )
 
+    # Legacy per-review history (no longer written; see ReviewLog / review_logs table)
     quality_history: dict[str, Any] | list[Any] | None = Field(default=None, sa_column=Column(JSON))
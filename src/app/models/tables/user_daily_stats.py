@@ -0,0 +1,42 @@
+"""User daily stats model: per-user, per-day learning rollup."""
+
+from datetime import date, datetime
+from uuid import UUID
+
+from sqlalchemy import Date, ForeignKey, Uuid
+from sqlmodel import Column, Field, SQLModel
+
+
+class UserDailyStats(SQLModel, table=True):
+    """User daily stats database model.
+
+    One row per (user, UTC day), incremented as reviews are recorded and sessions
+    are completed, so stats endpoints read O(days) rows instead of re-aggregating
+    review logs and study sessions on every call.
+
+    Review counters are bucketed by review time; session counters by the
+    session's ``started_at`` date (matching how sessions were reported before).
+    """
+
+    __tablename__ = "user_daily_stats"
+
+    user_id: UUID = Field(
+        sa_column=Column(
+            Uuid, ForeignKey("profiles.id", ondelete="CASCADE"), primary_key=True, nullable=False
+        ),
+    )
+    stat_date: date = Field(sa_column=Column(Date, primary_key=True, nullable=False))
+
+    # Reviews (one per answered card)
+    cards_studied: int = Field(default=0)
+    correct_count: int = Field(default=0)
+
+    # Completed study sessions
+    sessions_completed: int = Field(default=0)
+    study_time_seconds: int = Field(default=0)
+    session_cards_count: int = Field(default=0)
+    new_cards_count: int = Field(default=0)
+    review_cards_count: int = Field(default=0)
+    review_correct_count: int = Field(default=0)
+
+    updated_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Any
 
+from sqlalchemy import Index, text
 from sqlmodel import JSON, Column, Field, SQLModel
 
 from app.models.base import TimestampMixin
@@ -54,6 +55,15 @@ class VocabularyCard(VocabularyCardBase, TimestampMixin, table=True):
     """VocabularyCard database model."""
 
     __tablename__ = "vocabulary_cards"
+    # New-card selection order within a deck (see NewCardFrontier)
+    __table_args__ = (
+        Index(
+            "ix_vocabulary_cards_deck_rank_id",
+            "deck_id",
+            text("coalesce(frequency_rank, 2147483647)"),
+            "id",
+        ),
+    )
 
     id: int | None = Field(default=None, primary_key=True, nullable=False)
 
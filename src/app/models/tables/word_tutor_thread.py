@@ -1,9 +1,10 @@
 """Word tutor chat thread model."""
 
+from datetime import datetime
 from uuid import UUID, uuid4
 
 import sqlalchemy as sa
-from sqlalchemy import JSON, ForeignKey, Uuid
+from sqlalchemy import JSON, ForeignKey, Text, Uuid
 from sqlmodel import Column, Field, SQLModel, UniqueConstraint
 
 from app.models.base import TimestampMixin
@@ -42,3 +43,8 @@ class WordTutorThread(WordTutorThreadBase, TimestampMixin, table=True):
         default_factory=uuid4,
         sa_column=Column(Uuid, primary_key=True, nullable=False),
     )
+
+    # Rolling summary of the messages created up to ``summarized_until``; the tutor
+    # prompt gets this summary plus the most recent messages after it
+    summary: str | None = Field(default=None, sa_column=Column(Text))
+    summarized_until: datetime | None = Field(default=None)
@@ -0,0 +1,118 @@
+"""
+Persistent, content-addressed store for synthesized TTS audio.
+
+Files are named by the TTS cache key (SHA-256 of model/voice/format/text), so the
+same word is only synthesized once per store and entries never go stale: new
+model/voice/text produces a new key. Layout::
+
+    {settings.tts_audio_dir}/ab/abcdef....mp3
+
+Writes go to a temp file in the same directory and are renamed into place, so
+readers never see a partial file and concurrent writers of the same key are
+harmless. Streamed audio is written the same way through an ``AudioWriter``, chunk
+by chunk. Served with ``FileResponse`` (sendfile) rather than read into memory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO
+
+from app.config import settings
+
+
+class AudioStore:
+    """On-disk audio files keyed by TTS cache key."""
+
+    @staticmethod
+    def path_for(key: str, audio_format: str) -> Path:
+        if len(key) < 3 or not key.isalnum():
+            raise ValueError(f"Invalid audio key: {key!r}")
+        return Path(settings.tts_audio_dir) / key[:2] / f"{key}.{audio_format}"
+
+    @staticmethod
+    async def get(key: str, audio_format: str) -> Path | None:
+        """Path of the stored audio, or None if it hasn't been generated yet."""
+        path = AudioStore.path_for(key, audio_format)
+        return path if await asyncio.to_thread(path.is_file) else None
+
+    @staticmethod
+    async def put(key: str, audio_format: str, audio: bytes) -> Path:
+        """Store audio under its key and return the file path."""
+        path = AudioStore.path_for(key, audio_format)
+        await asyncio.to_thread(AudioStore._write_atomic, path, audio)
+        return path
+
+    @staticmethod
+    def writer(key: str, audio_format: str) -> AudioWriter:
+        """Writer that stores audio under its key as it arrives; use as ``async with``."""
+        return AudioWriter(AudioStore.path_for(key, audio_format))
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+
+class AudioWriter:
+    """Temp file next to ``path``, renamed into place by ``commit``.
+
+    Leaving the ``async with`` block without committing removes the temp file, so a
+    failed or cancelled stream never leaves partial audio in the store.
+    """
+
+    _file: BinaryIO
+    _tmp_path: Path
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._committed = False
+
+    async def __aenter__(self) -> AudioWriter:
+        await asyncio.to_thread(self._open)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if not self._committed:
+            await asyncio.to_thread(self._discard)
+
+    async def write(self, chunk: bytes) -> None:
+        await asyncio.to_thread(self._file.write, chunk)
+
+    async def commit(self) -> Path:
+        """Move the written audio into place and return its path."""
+        await asyncio.to_thread(self._commit)
+        return self.path
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+        )
+        self._tmp_path = Path(tmp_name)
+        self._file = os.fdopen(fd, "wb")
+
+    def _commit(self) -> None:
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+        self._committed = True
+
+    def _discard(self) -> None:
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
@@ -0,0 +1,108 @@
+"""
+In-process read-through cache for vocabulary card content.
+
+Cards are read on nearly every study call (next card, answer grading, tutor
+context) but rarely written, so the columns those paths read
+(``CACHED_CARD_COLUMNS``) are kept in a bounded LRU keyed by card id. Misses for a
+whole batch are loaded with one ``IN`` query.
+
+Card writes call ``invalidate(card_id)``, which drops the entry and bumps the
+cache version; a load that started before the bump doesn't store its rows, so an
+older read can't overwrite a newer write. Writes made by other workers or scripts
+are picked up when entries expire (``settings.card_cache_ttl_seconds``).
+
+Cards are returned as read-only ``CachedCard`` snapshots holding exactly the
+cached columns (see ``card_projections``).
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.config import settings
+from app.models import VocabularyCard
+from app.services.card_projections import CACHED_CARD_COLUMNS, CachedCard
+
+
+class CardCache:
+    """Process-wide LRU of card id -> (load time, snapshot)."""
+
+    _entries: OrderedDict[int, tuple[float, CachedCard]] = OrderedDict()
+    _version: int = 0
+    _hits: int = 0
+    _misses: int = 0
+
+    @classmethod
+    def invalidate(cls, card_id: int) -> None:
+        """Drop a card after a write; loads already in flight won't re-add it."""
+        cls._entries.pop(card_id, None)
+        cls._version += 1
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop every entry and reset the counters (mainly for tests)."""
+        cls._entries = OrderedDict()
+        cls._version += 1
+        cls._hits = 0
+        cls._misses = 0
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        """Hit/miss counters and current size."""
+        return {"hits": cls._hits, "misses": cls._misses, "size": len(cls._entries)}
+
+    @classmethod
+    async def get(cls, session: AsyncSession, card_id: int) -> CachedCard | None:
+        """Get one card, or None if it doesn't exist."""
+        cards = await cls.get_many(session, [card_id])
+        return cards.get(card_id)
+
+    @classmethod
+    async def get_many(
+        cls, session: AsyncSession, card_ids: Iterable[int]
+    ) -> dict[int, CachedCard]:
+        """Get cards by id; missing cards are loaded with one query, unknown ids are omitted."""
+        now = time.monotonic()
+        ttl = max(0, int(settings.card_cache_ttl_seconds))
+
+        cards_by_id: dict[int, CachedCard] = {}
+        missing_ids: list[int] = []
+        for card_id in dict.fromkeys(card_ids):
+            entry = cls._entries.get(card_id)
+            if entry is not None and (ttl == 0 or now - entry[0] < ttl):
+                cls._entries.move_to_end(card_id)
+                cards_by_id[card_id] = entry[1]
+                cls._hits += 1
+            else:
+                missing_ids.append(card_id)
+                cls._misses += 1
+
+        if missing_ids:
+            version = cls._version
+            result = await session.exec(
+                select(*CACHED_CARD_COLUMNS).where(VocabularyCard.id.in_(missing_ids))
+            )
+            loaded = [CachedCard(**row._asdict()) for row in result.all()]
+            for card in loaded:
+                cards_by_id[card.id] = card
+
+            # A write landed while we were reading; don't cache what may be stale
+            if cls._version == version:
+                cls._store(loaded, now)
+
+        return cards_by_id
+
+    @classmethod
+    def _store(cls, cards: list[CachedCard], loaded_at: float) -> None:
+        for card in cards:
+            cls._entries[card.id] = (loaded_at, card)
+            cls._entries.move_to_end(card.id)
+
+        max_entries = max(1, int(settings.card_cache_max_entries))
+        while len(cls._entries) > max_entries:
+            cls._entries.popitem(last=False)
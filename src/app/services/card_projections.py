@@ -0,0 +1,76 @@
+"""
+The vocabulary card columns kept by ``CardCache``, and the snapshot type it returns.
+
+Quiz formatting, answer grading, the new-card frontier and the tutor read a
+handful of card columns, but card rows also carry JSON (``related_words``,
+``tags``) and image-generation columns. ``CardCache`` selects only
+``CACHED_CARD_COLUMNS`` and returns them as read-only ``CachedCard`` snapshots.
+
+A snapshot has exactly these fields: reading any other column (``card.tags``)
+raises ``AttributeError`` instead of silently returning the model default. A
+caller that needs another column either adds it here (to the column list and
+``CachedCard``) or loads the ``VocabularyCard`` itself.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from app.models import QuizType, VocabularyCard
+
+# Building blocks of CACHED_CARD_COLUMNS.
+# Identity and frontier position, read by grading and the new-card frontier
+CARD_KEY_COLUMNS = (
+    VocabularyCard.id,
+    VocabularyCard.english_word,
+    VocabularyCard.korean_meaning,
+    VocabularyCard.deck_id,
+    VocabularyCard.frequency_rank,
+)
+
+# Fields rendered on every StudyCard, plus the distractor pool keys
+STUDY_CARD_COLUMNS = (
+    *CARD_KEY_COLUMNS,
+    VocabularyCard.part_of_speech,
+    VocabularyCard.difficulty_level,
+    VocabularyCard.pronunciation_ipa,
+    VocabularyCard.definition_en,
+    VocabularyCard.example_sentences,
+    VocabularyCard.audio_url,
+    VocabularyCard.image_url,
+)
+
+# Extra columns a quiz type reads on top of STUDY_CARD_COLUMNS
+QUIZ_TYPE_COLUMNS = {
+    QuizType.CLOZE: (VocabularyCard.cloze_sentences,),
+}
+
+# The blocks above combined: everything quiz formatting (any quiz type),
+# grading and the tutor read; this is what CardCache keeps per card
+CACHED_CARD_COLUMNS = tuple(
+    dict.fromkeys(
+        (*STUDY_CARD_COLUMNS, *(column for extra in QUIZ_TYPE_COLUMNS.values() for column in extra))
+    )
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CachedCard:
+    """Read-only snapshot of a card's ``CACHED_CARD_COLUMNS``; never added to a session."""
+
+    id: int
+    english_word: str
+    korean_meaning: str
+    deck_id: int | None
+    frequency_rank: int | None
+    part_of_speech: str | None
+    difficulty_level: str | None
+    pronunciation_ipa: str | None
+    definition_en: str | None
+    example_sentences: dict[str, Any] | list[Any] | None
+    audio_url: str | None
+    image_url: str | None
+    cloze_sentences: dict[str, Any] | list[Any] | None
+
+
+# What the study path and the tutor accept: a cached snapshot or a loaded row
+CardContent = VocabularyCard | CachedCard
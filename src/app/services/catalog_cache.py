@@ -0,0 +1,131 @@
+"""
+In-memory catalog aggregates for deck and category listings.
+
+Category pages used to run a deck count and a deck-id query per category, plus a
+card count per deck. The catalog (decks and their card counts) only changes when
+it is edited, so one snapshot of every deck with its card count is kept in memory
+and per-user views are filtered from it.
+
+The snapshot is tagged with the catalog version it was built from. Card writes
+call ``bump()``, which makes any snapshot built before the write stale, even one
+whose build query was already in flight. Writes made by other workers or scripts
+are picked up by the periodic refresh (``settings.catalog_cache_refresh_seconds``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import NamedTuple
+from uuid import UUID
+
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.config import settings
+from app.models import Deck, VocabularyCard
+
+
+class CatalogDeck(NamedTuple):
+    """Deck fields needed by listings, with its card count."""
+
+    id: int
+    name: str
+    description: str | None
+    category: str | None
+    is_public: bool
+    creator_id: UUID | None
+    total_cards: int
+
+    def is_accessible_by(self, user_id: UUID) -> bool:
+        return self.is_public or self.creator_id == user_id
+
+
+class CatalogCache:
+    """Process-wide snapshot of every deck and its card count."""
+
+    _by_category: dict[str, list[CatalogDeck]] = {}
+    _version: int = 0
+    _built_version: int | None = None
+    _built_at: float | None = None
+    _lock = asyncio.Lock()
+
+    @classmethod
+    def version(cls) -> int:
+        return cls._version
+
+    @classmethod
+    def bump(cls) -> None:
+        """Record a catalog write; snapshots built before it are rebuilt on next use."""
+        cls._version += 1
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop the snapshot (mainly for tests)."""
+        cls._by_category = {}
+        cls._built_version = None
+        cls._built_at = None
+
+    @classmethod
+    def is_fresh(cls) -> bool:
+        if cls._built_at is None or cls._built_version != cls._version:
+            return False
+        refresh = max(0, int(settings.catalog_cache_refresh_seconds))
+        return refresh == 0 or time.monotonic() - cls._built_at < refresh
+
+    @classmethod
+    async def build(cls, session: AsyncSession) -> None:
+        """Load every deck with its card count and replace the snapshot."""
+        version = cls._version
+        statement = (
+            select(
+                Deck.id,
+                Deck.name,
+                Deck.description,
+                Deck.category,
+                Deck.is_public,
+                Deck.creator_id,
+                func.count(VocabularyCard.id),
+            )
+            .outerjoin(VocabularyCard, VocabularyCard.deck_id == Deck.id)
+            .group_by(Deck.id)
+            .order_by(Deck.id)
+        )
+        result = await session.exec(statement)
+        cls.load_rows(result.all(), version)
+
+    @classmethod
+    def load_rows(
+        cls,
+        rows: list[tuple[int, str, str | None, str | None, bool, UUID | None, int]],
+        version: int,
+    ) -> None:
+        """Replace the snapshot with deck rows read at catalog ``version``."""
+        by_category: dict[str, list[CatalogDeck]] = {}
+        for row in rows:
+            deck = CatalogDeck(*row)
+            if deck.category is not None:
+                by_category.setdefault(deck.category, []).append(deck)
+
+        cls._by_category = by_category
+        cls._built_version = version
+        cls._built_at = time.monotonic()
+
+    @classmethod
+    async def ensure_loaded(cls, session: AsyncSession) -> None:
+        """Build the snapshot if it is missing, outdated or due for a refresh."""
+        if cls.is_fresh():
+            return
+
+        async with cls._lock:
+            # Another request may have rebuilt it while we waited
+            if cls.is_fresh():
+                return
+            await cls.build(session)
+
+    @classmethod
+    def category_decks(cls, category_id: str, user_id: UUID) -> list[CatalogDeck]:
+        """Decks in a category the user can access, in id order."""
+        return [
+            deck for deck in cls._by_category.get(category_id, []) if deck.is_accessible_by(user_id)
+        ]
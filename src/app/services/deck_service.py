@@ -2,12 +2,14 @@
 Deck service for calculating deck progress statistics.
 """
 
+from datetime import datetime
 from uuid import UUID
 
 from sqlmodel import delete, func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.constants.categories import get_all_category_ids, get_category_metadata
+from app.database import dialect_insert
 from app.models import (
     CategoryDetail,
     CategorySelectionState,
@@ -25,6 +27,7 @@ from app.models import (
     VocabularyCard,
 )
 from app.models.enums import CardState
+from app.services.catalog_cache import CatalogCache
 
 
 class DeckService:
@@ -59,10 +62,13 @@ class DeckService:
         result = await session.exec(count_query)
         total_count = result.one()
 
-        # Calculate progress for each deck
+        # Calculate progress for the whole page in one query
+        progress_by_deck = await DeckService.calculate_decks_progress(
+            session, user_id, [deck.id for deck in decks]
+        )
         decks_with_progress = []
         for deck in decks:
-            progress = await DeckService.calculate_deck_progress(session, user_id, deck.id)
+            progress = progress_by_deck[deck.id]
             deck_dict = {
                 "id": deck.id,
                 "name": deck.name,
@@ -114,85 +120,71 @@ class DeckService:
                 "progress_percent": float
             }
         """
-        # Count total cards in deck
-        total_cards_query = select(func.count(VocabularyCard.id)).where(
-            VocabularyCard.deck_id == deck_id
-        )
-        result = await session.exec(total_cards_query)
-        total_cards = result.one()
+        progress_by_deck = await DeckService.calculate_decks_progress(session, user_id, [deck_id])
+        return progress_by_deck[deck_id]
+
+    @staticmethod
+    async def calculate_decks_progress(
+        session: AsyncSession,
+        user_id: UUID,
+        deck_ids: list[int],
+    ) -> dict[int, dict]:
+        """
+        Calculate learning progress for several decks at once.
+
+        Cards are grouped by deck and left-joined to the user's progress rows, so
+        every deck's counts come from a single query.
 
-        # Handle empty deck
-        if total_cards == 0:
-            return {
+        Returns:
+            {deck_id: progress} with the same keys as ``calculate_deck_progress``;
+            decks without cards get all-zero progress.
+        """
+        progress_by_deck = {
+            deck_id: {
                 "total_cards": 0,
                 "learned_cards": 0,
                 "learning_cards": 0,
                 "new_cards": 0,
                 "progress_percent": 0.0,
             }
-
-        # Count cards by state using JOIN
-        # Count REVIEW (learned) cards
-        learned_query = (
-            select(func.count(UserCardProgress.id))
-            .select_from(VocabularyCard)
-            .join(
-                UserCardProgress,
-                (VocabularyCard.id == UserCardProgress.card_id)
-                & (UserCardProgress.user_id == user_id),
-            )
-            .where(
-                VocabularyCard.deck_id == deck_id,
-                UserCardProgress.card_state == CardState.REVIEW,
-            )
-        )
-        result = await session.exec(learned_query)
-        learned_cards = result.one()
-
-        # Count LEARNING + RELEARNING cards
-        learning_query = (
-            select(func.count(UserCardProgress.id))
-            .select_from(VocabularyCard)
-            .join(
-                UserCardProgress,
-                (VocabularyCard.id == UserCardProgress.card_id)
-                & (UserCardProgress.user_id == user_id),
-            )
-            .where(
-                VocabularyCard.deck_id == deck_id,
-                UserCardProgress.card_state.in_([CardState.LEARNING, CardState.RELEARNING]),
+            for deck_id in deck_ids
+        }
+        if not deck_ids:
+            return progress_by_deck
+
+        is_learned = UserCardProgress.card_state == CardState.REVIEW
+        is_learning = UserCardProgress.card_state.in_([CardState.LEARNING, CardState.RELEARNING])
+        query = (
+            select(
+                VocabularyCard.deck_id,
+                func.count(VocabularyCard.id),
+                func.count(UserCardProgress.id).filter(is_learned),
+                func.count(UserCardProgress.id).filter(is_learning),
+                func.count(UserCardProgress.id),
             )
-        )
-        result = await session.exec(learning_query)
-        learning_cards = result.one()
-
-        # Count cards with progress (any state)
-        cards_with_progress_query = (
-            select(func.count(UserCardProgress.id))
             .select_from(VocabularyCard)
-            .join(
+            .outerjoin(
                 UserCardProgress,
                 (VocabularyCard.id == UserCardProgress.card_id)
                 & (UserCardProgress.user_id == user_id),
             )
-            .where(VocabularyCard.deck_id == deck_id)
+            .where(VocabularyCard.deck_id.in_(deck_ids))
+            .group_by(VocabularyCard.deck_id)
         )
-        result = await session.exec(cards_with_progress_query)
-        cards_with_progress = result.one()
-
-        # Calculate new cards (cards without any progress)
-        new_cards = total_cards - cards_with_progress
-
-        # Calculate progress percentage (learned / total * 100)
-        progress_percent = (learned_cards / total_cards * 100) if total_cards > 0 else 0.0
+        result = await session.exec(query)
+
+        for deck_id, total_cards, learned_cards, learning_cards, cards_with_progress in result:
+            # Calculate progress percentage (learned / total * 100)
+            progress_percent = (learned_cards / total_cards * 100) if total_cards > 0 else 0.0
+            progress_by_deck[deck_id] = {
+                "total_cards": total_cards,
+                "learned_cards": learned_cards,
+                "learning_cards": learning_cards,
+                "new_cards": total_cards - cards_with_progress,
+                "progress_percent": round(progress_percent, 1),
+            }
 
-        return {
-            "total_cards": total_cards,
-            "learned_cards": learned_cards,
-            "learning_cards": learning_cards,
-            "new_cards": new_cards,
-            "progress_percent": round(progress_percent, 1),
-        }
+        return progress_by_deck
 
     @staticmethod
     async def update_selected_decks(
@@ -213,38 +205,36 @@ class DeckService:
         Returns:
             Tuple of (success, selected_deck_ids, error_message)
         """
-        # Clear existing selections
-        delete_stmt = delete(UserSelectedDeck).where(UserSelectedDeck.user_id == user_id)
-        await session.exec(delete_stmt)
+        if select_all:
+            # Clear existing selections
+            delete_stmt = delete(UserSelectedDeck).where(UserSelectedDeck.user_id == user_id)
+            await session.exec(delete_stmt)
+            await session.commit()
+            return True, [], None
 
-        selected_deck_ids: list[int] = []
+        if not deck_ids:
+            return False, [], "deck_ids must be provided when select_all is false"
 
-        # If select_all=false, validate and add specific decks
-        if not select_all:
-            if not deck_ids:
-                return False, [], "deck_ids must be provided when select_all is false"
+        selected_deck_ids = list(dict.fromkeys(deck_ids))
 
-            # Validate all deck IDs exist and are accessible
-            for deck_id in deck_ids:
-                deck_query = select(Deck).where(
-                    Deck.id == deck_id,
-                    (Deck.is_public == True) | (Deck.creator_id == user_id),  # noqa: E712
-                )
-                result = await session.exec(deck_query)
-                deck = result.one_or_none()
-
-                if not deck:
-                    return False, [], f"Deck with id {deck_id} not found or not accessible"
-
-            # Add selected decks to user_selected_decks table
-            for deck_id in deck_ids:
-                selected_deck = UserSelectedDeck(
-                    user_id=user_id,
-                    deck_id=deck_id,
-                )
-                session.add(selected_deck)
+        # Validate all deck IDs exist and are accessible in one query
+        deck_query = select(Deck.id).where(
+            Deck.id.in_(selected_deck_ids),
+            (Deck.is_public == True) | (Deck.creator_id == user_id),  # noqa: E712
+        )
+        result = await session.exec(deck_query)
+        accessible_ids = set(result.all())
+        for deck_id in selected_deck_ids:
+            if deck_id not in accessible_ids:
+                return False, [], f"Deck with id {deck_id} not found or not accessible"
 
-            selected_deck_ids = deck_ids
+        # Remove selections that are no longer wanted, then add the missing ones
+        delete_stmt = delete(UserSelectedDeck).where(
+            UserSelectedDeck.user_id == user_id,
+            UserSelectedDeck.deck_id.not_in(selected_deck_ids),
+        )
+        await session.exec(delete_stmt)
+        await DeckService._insert_selected_decks(session, user_id, selected_deck_ids)
 
         await session.commit()
         return True, selected_deck_ids, None
@@ -289,14 +279,19 @@ class DeckService:
         total_selected_cards = 0
         deck_objects: list[Deck] = []
 
+        decks_query = select(Deck).where(Deck.id.in_(deck_ids))
+        result = await session.exec(decks_query)
+        decks_by_id = {deck.id: deck for deck in result.all()}
+        progress_by_deck = await DeckService.calculate_decks_progress(
+            session, user_id, list(decks_by_id)
+        )
+
         for deck_id in deck_ids:
-            deck_query = select(Deck).where(Deck.id == deck_id)
-            result = await session.exec(deck_query)
-            deck = result.one_or_none()
+            deck = decks_by_id.get(deck_id)
 
             if deck:
                 deck_objects.append(deck)
-                progress = await DeckService.calculate_deck_progress(session, user_id, deck_id)
+                progress = progress_by_deck[deck_id]
                 total_selected_cards += progress["total_cards"]
 
                 deck_info = SelectedDeckInfo(
@@ -310,31 +305,22 @@ class DeckService:
         # Build category states
         category_states: list[CategorySelectionState] = []
         fully_selected_categories: list[dict] = []
+        await CatalogCache.ensure_loaded(session)
 
         for category_id in get_all_category_ids():
             metadata = get_category_metadata(category_id)
             if not metadata:
                 continue
 
-            # Count total decks in this category
-            total_query = select(func.count(Deck.id)).where(
-                Deck.category == category_id,
-                (Deck.is_public == True) | (Deck.creator_id == user_id),  # noqa: E712
-            )
-            result = await session.exec(total_query)
-            total_decks = result.one() or 0
+            # Decks in this category (from the catalog snapshot)
+            category_deck_ids = {
+                deck.id for deck in CatalogCache.category_decks(category_id, user_id)
+            }
+            total_decks = len(category_deck_ids)
 
             if total_decks == 0:
                 continue
 
-            # Get deck IDs in this category
-            decks_in_cat_query = select(Deck.id).where(
-                Deck.category == category_id,
-                (Deck.is_public == True) | (Deck.creator_id == user_id),  # noqa: E712
-            )
-            result = await session.exec(decks_in_cat_query)
-            category_deck_ids = set(result.all())
-
             # Count selected decks in this category
             selected_in_category = category_deck_ids & selected_deck_ids_set
             selected_count = len(selected_in_category)
@@ -488,26 +474,18 @@ class DeckService:
         result = await session.exec(selected_decks_query)
         selected_deck_ids = set(result.all())
 
+        await CatalogCache.ensure_loaded(session)
+
         for category_id in get_all_category_ids():
             metadata = get_category_metadata(category_id)
             if not metadata:
                 continue
 
-            # Count total decks in this category
-            total_query = select(func.count(Deck.id)).where(
-                Deck.category == category_id,
-                (Deck.is_public == True) | (Deck.creator_id == user_id),  # noqa: E712
-            )
-            result = await session.exec(total_query)
-            total_decks = result.one() or 0
-
-            # Get deck IDs in this category
-            decks_query = select(Deck.id).where(
-                Deck.category == category_id,
-                (Deck.is_public == True) | (Deck.creator_id == user_id),  # noqa: E712
-            )
-            result = await session.exec(decks_query)
-            category_deck_ids = set(result.all())
+            # Decks in this category (from the catalog snapshot)
+            category_deck_ids = {
+                deck.id for deck in CatalogCache.category_decks(category_id, user_id)
+            }
+            total_decks = len(category_deck_ids)
 
             # Count selected decks in this category
             selected_in_category = category_deck_ids & selected_deck_ids
@@ -565,13 +543,9 @@ class DeckService:
         result = await session.exec(selected_decks_query)
         selected_deck_ids = set(result.all())
 
-        # Get all decks in this category
-        decks_query = select(Deck).where(
-            Deck.category == category_id,
-            (Deck.is_public == True) | (Deck.creator_id == user_id),  # noqa: E712
-        )
-        result = await session.exec(decks_query)
-        decks = list(result.all())
+        # Get all decks in this category, with card counts
+        await CatalogCache.ensure_loaded(session)
+        decks = CatalogCache.category_decks(category_id, user_id)
 
         # Build deck list with is_selected
         decks_list = []
@@ -582,17 +556,11 @@ class DeckService:
             if is_selected:
                 selected_count += 1
 
-            cards_query = select(func.count(VocabularyCard.id)).where(
-                VocabularyCard.deck_id == deck.id
-            )
-            result = await session.exec(cards_query)
-            total_cards = result.one() or 0
-
             deck_info = DeckInCategory(
                 id=deck.id,
                 name=deck.name,
                 description=deck.description,
-                total_cards=total_cards,
+                total_cards=deck.total_cards,
                 is_selected=is_selected,
             )
             decks_list.append(deck_info)
@@ -634,26 +602,37 @@ class DeckService:
         result = await session.exec(decks_query)
         deck_ids = list(result.all())
 
-        # Get already selected decks
-        selected_query = select(UserSelectedDeck.deck_id).where(UserSelectedDeck.user_id == user_id)
-        result = await session.exec(selected_query)
-        already_selected = set(result.all())
-
-        # Add new selections
-        added_count = 0
-        for deck_id in deck_ids:
-            if deck_id not in already_selected:
-                new_selection = UserSelectedDeck(
-                    user_id=user_id,
-                    deck_id=deck_id,
-                )
-                session.add(new_selection)
-                added_count += 1
-
+        added_count = await DeckService._insert_selected_decks(session, user_id, deck_ids)
         await session.commit()
 
         return True, len(deck_ids), added_count, None
 
+    @staticmethod
+    async def _insert_selected_decks(
+        session: AsyncSession,
+        user_id: UUID,
+        deck_ids: list[int],
+    ) -> int:
+        """Select decks with one ``INSERT ... ON CONFLICT DO NOTHING``; returns rows added."""
+        if not deck_ids:
+            return 0
+
+        insert = dialect_insert(session)
+
+        now = datetime.utcnow()
+        table = UserSelectedDeck.__table__
+        statement = insert(table).values(
+            [
+                {"user_id": user_id, "deck_id": deck_id, "created_at": now, "updated_at": now}
+                for deck_id in deck_ids
+            ]
+        )
+        statement = statement.on_conflict_do_nothing(
+            index_elements=[table.c.user_id, table.c.deck_id]
+        )
+        result = await session.exec(statement)
+        return result.rowcount
+
     @staticmethod
     async def deselect_all_category_decks(
         session: AsyncSession,
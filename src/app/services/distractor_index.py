@@ -0,0 +1,180 @@
+"""
+In-memory distractor index for multiple-choice option generation.
+
+Instead of running ``ORDER BY random() LIMIT n`` over ``vocabulary_cards`` for every
+card served, the catalog's (id, english_word, korean_meaning) tuples are kept in
+memory, grouped by (difficulty_level, part_of_speech). Sampling distractors is then
+O(k) in the number of options and independent of the catalog size.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from typing import NamedTuple
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.config import settings
+from app.core.logging import logger
+from app.models import VocabularyCard
+
+# (difficulty_level, part_of_speech); None means "any"
+PoolKey = tuple[str | None, str | None]
+
+
+class DistractorEntry(NamedTuple):
+    """Minimal card data needed to render a distractor option."""
+
+    id: int
+    english_word: str
+    korean_meaning: str
+
+
+class DistractorIndex:
+    """Process-wide distractor pools keyed by (difficulty_level, part_of_speech).
+
+    Every card is registered in four pools: (difficulty, pos), (difficulty, any),
+    (any, pos) and (any, any), mirroring the optional filters of the old query.
+
+    The index is built at startup (or by the first request) and tagged with the
+    catalog version it was read at. Card writes call ``invalidate()``, which makes
+    any index built before the write stale, even one whose build was in flight.
+    A stale index (after a write, or every ``settings.distractor_index_refresh_seconds``
+    to pick up other workers' writes) keeps being served while a background task
+    rebuilds it, so study requests never wait on the catalog scan.
+    """
+
+    _pools: dict[PoolKey, list[DistractorEntry]] = {}
+    _version: int = 0
+    _built_version: int | None = None
+    _built_at: float | None = None
+    _lock: asyncio.Lock | None = None
+    _refresh_task: asyncio.Task[None] | None = None
+
+    @classmethod
+    def is_fresh(cls) -> bool:
+        if cls._built_at is None or cls._built_version != cls._version:
+            return False
+        refresh = max(0, int(settings.distractor_index_refresh_seconds))
+        return refresh == 0 or time.monotonic() - cls._built_at < refresh
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Record a card write; indexes built before it are rebuilt on next use."""
+        cls._version += 1
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all pools (mainly for tests)."""
+        cls._pools = {}
+        cls._built_version = None
+        cls._built_at = None
+        cls._lock = None
+        cls._refresh_task = None
+
+    @classmethod
+    async def build(cls, session: AsyncSession) -> None:
+        """Load every card's distractor fields and rebuild the pools."""
+        version = cls._version
+        statement = select(
+            VocabularyCard.id,
+            VocabularyCard.english_word,
+            VocabularyCard.korean_meaning,
+            VocabularyCard.difficulty_level,
+            VocabularyCard.part_of_speech,
+        )
+        result = await session.exec(statement)
+        rows = result.all()
+        # Grouping the whole catalog is CPU-bound; keep it off the event loop
+        pools = await asyncio.to_thread(cls._group_rows, rows)
+        cls._install(pools, version)
+
+    @classmethod
+    def load_rows(
+        cls,
+        rows: list[tuple[int, str, str, str | None, str | None]],
+    ) -> None:
+        """Rebuild the pools from (id, english_word, korean_meaning, difficulty, pos) rows."""
+        cls._install(cls._group_rows(rows), cls._version)
+
+    @classmethod
+    async def ensure_loaded(cls, session: AsyncSession) -> None:
+        """Build the index if it is missing; refresh it in the background if stale."""
+        if cls.is_fresh():
+            return
+
+        if cls._built_at is not None:
+            cls._start_refresh(session)
+            return
+
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        async with cls._lock:
+            # Another request may have built it while we waited
+            if cls._built_at is None:
+                await cls.build(session)
+
+    @classmethod
+    async def wait_for_refresh(cls) -> None:
+        """Wait for a running background refresh (tests and shutdown)."""
+        if cls._refresh_task is not None:
+            await asyncio.shield(cls._refresh_task)
+
+    @classmethod
+    def _start_refresh(cls, session: AsyncSession) -> None:
+        if cls._refresh_task is not None and not cls._refresh_task.done():
+            return
+
+        # Own session on the same engine: the request's session may close first
+        bind = session.bind
+
+        async def refresh() -> None:
+            try:
+                async with AsyncSession(bind, expire_on_commit=False) as refresh_session:
+                    await cls.build(refresh_session)
+            except Exception as e:
+                # Keep serving the old pools; the next request tries again
+                logger.warning("Distractor index refresh failed", error=str(e))
+
+        cls._refresh_task = asyncio.create_task(refresh())
+
+    @staticmethod
+    def _group_rows(
+        rows: list[tuple[int, str, str, str | None, str | None]],
+    ) -> dict[PoolKey, list[DistractorEntry]]:
+        pools: dict[PoolKey, list[DistractorEntry]] = {}
+        for card_id, english_word, korean_meaning, difficulty_level, part_of_speech in rows:
+            entry = DistractorEntry(card_id, english_word, korean_meaning)
+            difficulties = (None, difficulty_level) if difficulty_level else (None,)
+            parts_of_speech = (None, part_of_speech) if part_of_speech else (None,)
+            for difficulty in difficulties:
+                for pos in parts_of_speech:
+                    pools.setdefault((difficulty, pos), []).append(entry)
+        return pools
+
+    @classmethod
+    def _install(cls, pools: dict[PoolKey, list[DistractorEntry]], version: int) -> None:
+        cls._pools = pools
+        cls._built_version = version
+        cls._built_at = time.monotonic()
+
+    @classmethod
+    def sample(
+        cls,
+        *,
+        exclude_card_id: int | None,
+        difficulty_level: str | None,
+        part_of_speech: str | None,
+        k: int,
+    ) -> list[DistractorEntry]:
+        """Return up to ``k`` random entries from the matching pool."""
+        pool = cls._pools.get((difficulty_level or None, part_of_speech or None))
+        if not pool or k <= 0:
+            return []
+
+        # Draw one extra in case the card itself is picked
+        picked = random.sample(pool, min(len(pool), k + 1))
+        return [entry for entry in picked if entry.id != exclude_card_id][:k]
@@ -0,0 +1,266 @@
+"""
+New-card frontier maintenance and frontier-based unseen card selection.
+
+Picking new cards used to anti-join every candidate card against the user's
+progress rows, which grows with the number of cards the user has seen. Each
+(user, deck) pair now keeps a frontier (see ``NewCardFrontier``): the position of
+the first unseen card in frequency order. Selection reads each deck from its
+frontier onwards, so cards the user worked through long ago are skipped by an
+index range instead of being probed one by one.
+
+The frontier must never move past an unseen card:
+
+- ``advance`` is called after a card gets its first progress row.
+- ``lower_to_card`` is called when a card is created or moved/re-ranked, since
+  it may land before existing frontiers.
+- ``reset`` drops frontiers for bulk writes that bypass the services (scripts);
+  they are rebuilt lazily on the next review.
+"""
+
+from collections.abc import Iterable
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    and_,
+    delete,
+    literal_column,
+    or_,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.database import dialect_insert
+from app.models import (
+    Deck,
+    NewCardFrontier,
+    Profile,
+    UserCardProgress,
+    UserSelectedDeck,
+    VocabularyCard,
+)
+from app.services.card_projections import CardContent
+
+# Sort key used for cards without a frequency rank (keeps NULLS LAST ordering)
+RANK_NULLS_LAST = 2_147_483_647
+
+
+def card_rank_key() -> ColumnElement[int]:
+    """SQL expression for a card's rank in new-card order.
+
+    The constant is rendered inline so the expression matches
+    ``ix_vocabulary_cards_deck_rank_id`` (a bound parameter wouldn't).
+    """
+    return func.coalesce(VocabularyCard.frequency_rank, literal_column(str(RANK_NULLS_LAST)))
+
+
+def card_position(card: CardContent) -> tuple[int, int]:
+    """A card's (rank, id) position in new-card order."""
+    rank = card.frequency_rank if card.frequency_rank is not None else RANK_NULLS_LAST
+    return rank, card.id
+
+
+class NewCardFrontierService:
+    """Service for per-user, per-deck new-card frontiers."""
+
+    @staticmethod
+    async def get_unseen_cards(
+        session: AsyncSession,
+        profile: Profile,
+        limit: int,
+    ) -> list[VocabularyCard]:
+        """
+        Get up to ``limit`` unseen cards in frequency order, respecting deck selection.
+
+        Each deck is read separately from its frontier onwards (or from its start if
+        it has none yet), as an index range on ``ix_vocabulary_cards_deck_rank_id``
+        limited to ``limit`` cards; exhausted decks are skipped entirely. The per-deck
+        reads are merged by rank in one ``UNION ALL`` statement.
+        """
+        user_id = profile.id
+        rank_key = card_rank_key()
+
+        deck_query = select(
+            Deck.id,
+            NewCardFrontier.deck_id,
+            NewCardFrontier.next_rank,
+            NewCardFrontier.next_card_id,
+        ).outerjoin(
+            NewCardFrontier,
+            and_(NewCardFrontier.user_id == user_id, NewCardFrontier.deck_id == Deck.id),
+        )
+        # Apply deck filtering based on user preference
+        if profile.select_all_decks:
+            deck_query = deck_query.where(Deck.is_public == True)  # noqa: E712
+        else:
+            deck_query = deck_query.where(
+                Deck.id.in_(
+                    select(UserSelectedDeck.deck_id).where(UserSelectedDeck.user_id == user_id)
+                )
+            )
+        decks = (await session.exec(deck_query.order_by(Deck.id))).all()
+
+        def unseen_in(*conditions: ColumnElement[bool]) -> Select:
+            seen = (
+                select(UserCardProgress.id)
+                .where(
+                    UserCardProgress.user_id == user_id,
+                    UserCardProgress.card_id == VocabularyCard.id,
+                )
+                .exists()
+            )
+            return (
+                select(rank_key.label("rank"), VocabularyCard.id.label("id"))
+                .where(*conditions, ~seen)
+                .order_by(rank_key.asc(), VocabularyCard.id.asc())
+                .limit(limit)
+            )
+
+        branches: list[Select] = []
+        for deck_id, frontier_deck_id, next_rank, next_card_id in decks:
+            if frontier_deck_id is None:
+                branches.append(unseen_in(VocabularyCard.deck_id == deck_id))
+            elif next_card_id is not None:
+                branches.append(
+                    unseen_in(
+                        VocabularyCard.deck_id == deck_id,
+                        tuple_(rank_key, VocabularyCard.id) >= tuple_(next_rank, next_card_id),
+                    )
+                )
+        if profile.select_all_decks:
+            # Cards without a deck have no frontier
+            branches.append(unseen_in(VocabularyCard.deck_id.is_(None)))
+        if not branches:
+            return []
+
+        # Wrapped so each branch keeps its own ORDER BY/LIMIT (SQLite compound rules)
+        subqueries = [branch.subquery() for branch in branches]
+        candidates = union_all(*(select(sq.c.rank, sq.c.id) for sq in subqueries)).subquery()
+        query = (
+            select(VocabularyCard)
+            .join(candidates, VocabularyCard.id == candidates.c.id)
+            .order_by(candidates.c.rank.asc(), candidates.c.id.asc())
+            .limit(limit)
+        )
+
+        result = await session.exec(query)
+        return list(result.all())
+
+    @staticmethod
+    async def advance(
+        session: AsyncSession,
+        user_id: UUID,
+        cards: Iterable[CardContent],
+    ) -> None:
+        """
+        Move frontiers past cards that were just seen for the first time.
+
+        The cards' progress rows must already be flushed. Only decks whose
+        frontier sits on one of the cards (or that have no frontier yet) are
+        recomputed, with one indexed read per deck.
+        """
+        positions_by_deck: dict[int, set[tuple[int, int]]] = {}
+        for card in cards:
+            if card.deck_id is not None:
+                positions_by_deck.setdefault(card.deck_id, set()).add(card_position(card))
+
+        for deck_id, positions in positions_by_deck.items():
+            frontier = await session.get(NewCardFrontier, (user_id, deck_id))
+            if frontier is None:
+                # Concurrent first reviews in the deck may both get here
+                frontier = await NewCardFrontierService._create(session, user_id, deck_id)
+                start = None
+            elif frontier.next_card_id is None:
+                continue
+            elif (frontier.next_rank, frontier.next_card_id) not in positions:
+                # Seen out of order; the first unseen card is still where it was
+                continue
+            else:
+                start = (frontier.next_rank, frontier.next_card_id)
+
+            next_position = await NewCardFrontierService._first_unseen_position(
+                session, user_id, deck_id, start
+            )
+            frontier.next_rank, frontier.next_card_id = next_position or (None, None)
+            frontier.updated_at = datetime.utcnow()
+            session.add(frontier)
+
+    @staticmethod
+    async def _create(session: AsyncSession, user_id: UUID, deck_id: int) -> NewCardFrontier:
+        """Insert an empty frontier unless one exists, and return the stored row."""
+        insert = dialect_insert(session)
+
+        await session.exec(
+            insert(NewCardFrontier.__table__)
+            .values(user_id=user_id, deck_id=deck_id, updated_at=datetime.utcnow())
+            .on_conflict_do_nothing(
+                index_elements=[
+                    NewCardFrontier.__table__.c.user_id,
+                    NewCardFrontier.__table__.c.deck_id,
+                ]
+            )
+        )
+        result = await session.exec(
+            select(NewCardFrontier)
+            .where(NewCardFrontier.user_id == user_id, NewCardFrontier.deck_id == deck_id)
+            .execution_options(populate_existing=True)
+        )
+        return result.one()
+
+    @staticmethod
+    async def lower_to_card(session: AsyncSession, card: VocabularyCard) -> None:
+        """Pull frontiers in the card's deck back so they don't skip the card."""
+        if card.deck_id is None or card.id is None:
+            return
+
+        rank, card_id = card_position(card)
+        await session.exec(
+            update(NewCardFrontier)
+            .where(
+                NewCardFrontier.deck_id == card.deck_id,
+                or_(
+                    NewCardFrontier.next_card_id.is_(None),
+                    tuple_(NewCardFrontier.next_rank, NewCardFrontier.next_card_id)
+                    > tuple_(rank, card_id),
+                ),
+            )
+            .values(next_rank=rank, next_card_id=card_id, updated_at=datetime.utcnow())
+        )
+
+    @staticmethod
+    async def reset(session: AsyncSession, deck_id: int | None = None) -> None:
+        """Drop frontiers (for one deck, or all); they are rebuilt on the next review."""
+        statement = delete(NewCardFrontier)
+        if deck_id is not None:
+            statement = statement.where(NewCardFrontier.deck_id == deck_id)
+        await session.exec(statement)
+
+    @staticmethod
+    async def _first_unseen_position(
+        session: AsyncSession,
+        user_id: UUID,
+        deck_id: int,
+        start: tuple[int, int] | None,
+    ) -> tuple[int, int] | None:
+        rank_key = card_rank_key()
+        seen = (
+            select(UserCardProgress.id)
+            .where(
+                UserCardProgress.user_id == user_id,
+                UserCardProgress.card_id == VocabularyCard.id,
+            )
+            .exists()
+        )
+        query = select(rank_key, VocabularyCard.id).where(VocabularyCard.deck_id == deck_id, ~seen)
+        if start is not None:
+            query = query.where(tuple_(rank_key, VocabularyCard.id) >= tuple_(*start))
+        query = query.order_by(rank_key.asc(), VocabularyCard.id.asc()).limit(1)
+
+        result = await session.exec(query)
+        row = result.first()
+        return (int(row[0]), int(row[1])) if row else None
@@ -0,0 +1,97 @@
+"""
+Shared, pooled OpenAI clients for TTS and the word tutor.
+
+Building ``AsyncOpenAI``/``ChatOpenAI`` per call opens a fresh connection pool
+(and TLS handshake) every time. Instead every client here sits on one
+``httpx.AsyncClient`` with keep-alive and HTTP/2, sized by the ``openai_*``
+connection settings, and the pool is closed in ``main.lifespan`` on shutdown.
+
+Clients are rebuilt when the API key or base URL changes, or after ``aclose()``.
+"""
+
+from __future__ import annotations
+
+import httpx
+from langchain_openai import ChatOpenAI
+from openai import AsyncOpenAI
+
+from app.config import settings
+
+
+class OpenAIClients:
+    """Process-wide registry of OpenAI clients sharing one connection pool."""
+
+    _http_client: httpx.AsyncClient | None = None
+    _client: AsyncOpenAI | None = None
+    _client_key: tuple[str, str] = ("", "")
+    _chat_models: dict[tuple[str, str, str, float, float], ChatOpenAI] = {}
+
+    @classmethod
+    def http_client(cls) -> httpx.AsyncClient:
+        """The shared connection pool (recreated, with its clients, once closed)."""
+        if cls._http_client is None or cls._http_client.is_closed:
+            cls._client = None
+            cls._chat_models = {}
+            cls._http_client = httpx.AsyncClient(
+                http2=settings.openai_http2,
+                limits=httpx.Limits(
+                    max_connections=settings.openai_max_connections,
+                    max_keepalive_connections=settings.openai_max_keepalive_connections,
+                    keepalive_expiry=settings.openai_keepalive_expiry_seconds,
+                ),
+            )
+        return cls._http_client
+
+    @classmethod
+    def openai(cls) -> AsyncOpenAI:
+        """``AsyncOpenAI`` for the configured key, e.g. for TTS."""
+        http_client = cls.http_client()
+        key = (settings.openai_api_key, settings.openai_base_url)
+        if cls._client is None or cls._client_key != key:
+            cls._client = AsyncOpenAI(
+                api_key=settings.openai_api_key,
+                base_url=settings.openai_base_url or None,
+                http_client=http_client,
+            )
+            cls._client_key = key
+        return cls._client
+
+    @classmethod
+    def chat_model(cls, *, model: str, temperature: float, timeout: float) -> ChatOpenAI:
+        """LangChain chat model on the shared pool, one per model/parameters."""
+        http_client = cls.http_client()
+        key = (
+            settings.openai_api_key,
+            settings.openai_base_url,
+            model,
+            temperature,
+            timeout,
+        )
+        chat_model = cls._chat_models.get(key)
+        if chat_model is None:
+            chat_model = ChatOpenAI(
+                model=model,
+                # LangChain reads OPENAI_API_KEY from env too, but we pass it explicitly
+                api_key=settings.openai_api_key or None,
+                base_url=settings.openai_base_url or None,
+                temperature=temperature,
+                timeout=timeout,
+                http_async_client=http_client,
+            )
+            cls._chat_models[key] = chat_model
+        return chat_model
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the connection pool; the next call opens a new one."""
+        http_client = cls._http_client
+        cls.reset()
+        if http_client is not None:
+            await http_client.aclose()
+
+    @classmethod
+    def reset(cls) -> None:
+        """Forget every client without closing the pool (tests)."""
+        cls._http_client = None
+        cls._client = None
+        cls._chat_models = {}
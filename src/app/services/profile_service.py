@@ -1,15 +1,98 @@
+import time
+from contextvars import ContextVar
 from datetime import datetime, timedelta
+from typing import Any
 from uuid import UUID
 
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
 from sqlmodel import func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.config import settings
 from app.models import Profile, ProfileUpdate, UserCardProgress, VocabularyCard
 from app.models.enums import CardState
 
+# Request-scoped profile context.
+# Filled by the auth dependency (get_current_profile) so services reuse the profile
+# loaded for authentication instead of fetching it again.
+current_profile_ctx: ContextVar[Profile | None] = ContextVar("current_profile", default=None)
+
 
 class ProfileService:
-    """Service for profile CRUD operations."""
+    """Service for profile CRUD operations.
+
+    Profile lookups go through ``get_profile``, which checks (in order):
+    - the request-scoped profile context
+    - the session identity map
+    - an optional cross-request TTL cache (``settings.profile_cache_ttl_seconds``)
+    - the database
+
+    Notes:
+    - The cross-request cache is per process and disabled by default (TTL 0).
+      Writes through ProfileService invalidate it locally; other workers may serve
+      a stale profile for up to the TTL.
+    """
+
+    # profile_id -> (expires_at, column snapshot)
+    _cache: dict[UUID, tuple[float, dict[str, Any]]] = {}
+
+    @staticmethod
+    def set_request_profile(profile: Profile | None) -> None:
+        """Store the authenticated profile in the request-scoped context."""
+        current_profile_ctx.set(profile)
+
+    @classmethod
+    def invalidate_cached_profile(cls, profile_id: UUID) -> None:
+        """Drop a profile from the cross-request cache after it was modified."""
+        cls._cache.pop(profile_id, None)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop every cached profile."""
+        cls._cache.clear()
+
+    @classmethod
+    def _cache_profile(cls, profile: Profile) -> None:
+        ttl = max(0, int(settings.profile_cache_ttl_seconds))
+        if ttl == 0:
+            return
+
+        now = time.monotonic()
+        cls._cache[profile.id] = (now + ttl, profile.model_dump())
+        if len(cls._cache) > max(1, int(settings.profile_cache_max_entries)):
+            cls._prune_cache(now)
+
+    @classmethod
+    def _load_cached_profile(cls, session: AsyncSession, profile_id: UUID) -> Profile | None:
+        """Attach a cached profile snapshot to the session without querying the DB."""
+        cached = cls._cache.get(profile_id)
+        if cached is None:
+            return None
+
+        expires_at, data = cached
+        if expires_at <= time.monotonic():
+            cls._cache.pop(profile_id, None)
+            return None
+
+        profile = Profile(**data)
+        # Mark as loaded from the DB (clean, with identity) so the session tracks
+        # only subsequent changes, exactly as if it had been SELECTed.
+        make_transient_to_detached(profile)
+        session.add(profile)
+        return profile
+
+    @classmethod
+    def _prune_cache(cls, now: float) -> None:
+        # Remove expired first
+        expired_keys = [k for k, (exp, _) in cls._cache.items() if exp <= now]
+        for k in expired_keys:
+            cls._cache.pop(k, None)
+
+        # Hard cap fallback: drop oldest inserted items until within limit
+        max_entries = max(1, int(settings.profile_cache_max_entries))
+        while len(cls._cache) > max_entries:
+            cls._cache.pop(next(iter(cls._cache)))
 
     @staticmethod
     async def create_profile(
@@ -26,7 +109,26 @@ class ProfileService:
     @staticmethod
     async def get_profile(session: AsyncSession, profile_id: UUID) -> Profile | None:
         """Get a profile by ID (UUID from Supabase Auth)."""
-        return await session.get(Profile, profile_id)
+        # 1. Request-scoped context (profile loaded by the auth dependency)
+        profile = current_profile_ctx.get()
+        if profile is not None and profile.id == profile_id and profile in session:
+            return profile
+
+        # 2. Session identity map (already loaded in this session)
+        profile = session.identity_map.get(identity_key(Profile, profile_id))
+        if profile is not None:
+            return profile
+
+        # 3. Cross-request cache
+        profile = ProfileService._load_cached_profile(session, profile_id)
+        if profile is not None:
+            return profile
+
+        # 4. Database
+        profile = await session.get(Profile, profile_id)
+        if profile is not None:
+            ProfileService._cache_profile(profile)
+        return profile
 
     @staticmethod
     async def update_profile(
@@ -44,6 +146,7 @@ class ProfileService:
 
         session.add(profile)
         await session.commit()
+        ProfileService.invalidate_cached_profile(profile_id)
         await session.refresh(profile)
         return profile
 
@@ -56,6 +159,7 @@ class ProfileService:
 
         await session.delete(profile)
         await session.commit()
+        ProfileService.invalidate_cached_profile(profile_id)
         return True
 
     @staticmethod
@@ -97,7 +201,7 @@ class ProfileService:
                 "streak_status": "continued" | "started" | "broken"
             }
         """
-        profile = await session.get(Profile, profile_id)
+        profile = await ProfileService.get_profile(session, profile_id)
         if not profile:
             return None
 
@@ -139,6 +243,7 @@ class ProfileService:
         # 5. Save to database
         session.add(profile)
         await session.commit()
+        ProfileService.invalidate_cached_profile(profile_id)
         await session.refresh(profile)
 
         return {
@@ -269,6 +374,7 @@ class ProfileService:
 
         session.add(profile)
         await session.commit()
+        ProfileService.invalidate_cached_profile(profile.id)
         await session.refresh(profile)
         return profile
 
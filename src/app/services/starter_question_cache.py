@@ -0,0 +1,121 @@
+"""
+Card-level cache of word tutor starter questions.
+
+Starter questions only depend on the card content the prompt sees, so they're
+stored once per card in ``card_starter_questions`` and shared by every tutor
+thread, with a bounded in-process LRU in front of the table. Entries are keyed
+by card id and checked against a content hash computed by the caller
+(``word_tutor_graph.starter_content_hash``): a card edit or prompt change gives a
+new hash, so stale questions are never served and need no invalidation.
+
+Rows are precomputed by ``scripts/generate_starter_questions.py`` and otherwise
+filled in the first time a tutor is opened for the card.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from datetime import datetime
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.config import settings
+from app.database import dialect_insert
+from app.models import CardStarterQuestions
+
+
+class StarterQuestionCache:
+    """Process-wide LRU of card id -> (content hash, starter questions)."""
+
+    _entries: OrderedDict[int, tuple[str, list[str]]] = OrderedDict()
+    _hits: int = 0
+    _misses: int = 0
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop every in-memory entry and reset the counters (mainly for tests)."""
+        cls._entries = OrderedDict()
+        cls._hits = 0
+        cls._misses = 0
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        """Hit/miss counters (memory or table) and current in-memory size."""
+        return {"hits": cls._hits, "misses": cls._misses, "size": len(cls._entries)}
+
+    @classmethod
+    async def get(cls, session: AsyncSession, card_id: int, content_hash: str) -> list[str] | None:
+        """Starter questions for the card's current content, or None if not generated yet."""
+        entry = cls._entries.get(card_id)
+        if entry is None or entry[0] != content_hash:
+            result = await session.exec(
+                select(CardStarterQuestions.content_hash, CardStarterQuestions.questions).where(
+                    CardStarterQuestions.card_id == card_id
+                )
+            )
+            row = result.first()
+            entry = (row.content_hash, list(row.questions)) if row else None
+            if entry is not None:
+                cls._remember(card_id, entry)
+
+        if entry is None or entry[0] != content_hash:
+            cls._misses += 1
+            return None
+
+        cls._entries.move_to_end(card_id)
+        cls._hits += 1
+        return list(entry[1])
+
+    @classmethod
+    async def put(
+        cls,
+        session: AsyncSession,
+        card_id: int,
+        content_hash: str,
+        questions: list[str],
+        *,
+        model: str | None = None,
+    ) -> None:
+        """Upsert the card's starter questions.
+
+        The caller commits, then calls ``remember`` so a rolled-back row never
+        reaches the in-memory layer.
+        """
+        insert = dialect_insert(session)
+
+        values = {
+            "card_id": card_id,
+            "content_hash": content_hash,
+            "questions": list(questions),
+            "model": model,
+            "updated_at": datetime.utcnow(),
+        }
+        statement = insert(CardStarterQuestions.__table__).values(**values)
+        statement = statement.on_conflict_do_update(
+            index_elements=[CardStarterQuestions.__table__.c.card_id],
+            set_={key: statement.excluded[key] for key in values if key != "card_id"},
+        )
+        await session.exec(statement)
+
+    @classmethod
+    def remember(cls, card_id: int, content_hash: str, questions: list[str]) -> None:
+        """Keep committed starter questions in memory for the next ``get``."""
+        cls._remember(card_id, (content_hash, list(questions)))
+
+    @classmethod
+    async def get_hashes(cls, session: AsyncSession) -> dict[int, str]:
+        """Stored content hash per card id (for the batch job)."""
+        result = await session.exec(
+            select(CardStarterQuestions.card_id, CardStarterQuestions.content_hash)
+        )
+        return dict(result.all())
+
+    @classmethod
+    def _remember(cls, card_id: int, entry: tuple[str, list[str]]) -> None:
+        cls._entries[card_id] = entry
+        cls._entries.move_to_end(card_id)
+
+        max_entries = max(1, int(settings.starter_cache_max_entries))
+        while len(cls._entries) > max_entries:
+            cls._entries.popitem(last=False)
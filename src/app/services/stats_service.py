@@ -4,10 +4,11 @@ from datetime import datetime, timedelta
 from typing import Literal
 from uuid import UUID
 
+from sqlalchemy import and_, true
 from sqlmodel import func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.models import UserCardProgress, VocabularyCard
+from app.models import UserCardProgress, UserDailyStats, VocabularyCard
 from app.models.enums import CardState
 from app.models.schemas.stats import (
     AccuracyByPeriod,
@@ -19,7 +20,16 @@ from app.models.schemas.stats import (
     TodayVocabularyStats,
     TotalLearnedRead,
 )
-from app.models.tables.study_session import StudySession
+from app.services.user_daily_stats_service import UserDailyStatsService
+
+# Accuracy buckets: name -> (from N days ago, until N days ago); None = unbounded
+ACCURACY_WINDOWS: dict[str, tuple[int | None, int | None]] = {
+    "all": (None, None),
+    "7d": (7, None),
+    "30d": (30, None),
+    "90d": (90, None),
+    "prev_7d": (14, 7),  # trend baseline
+}
 
 
 class StatsService:
@@ -95,77 +105,30 @@ class StatsService:
             StatsHistoryRead with daily stats and summary
         """
         # Calculate date range based on period
-        now = datetime.utcnow()
+        today = datetime.utcnow().date()
         if period == "all":
             start_date = None
         else:
             period_days = {"7d": 7, "30d": 30, "1y": 365}
             days = period_days[period]
-            start_date = now - timedelta(days=days)
-
-        # Query for daily stats grouped by date from UserCardProgress
-        history_query = select(
-            func.date(UserCardProgress.last_review_date).label("review_date"),
-            func.sum(UserCardProgress.total_reviews).label("cards_studied"),
-            func.sum(UserCardProgress.correct_count).label("correct_count"),
-        ).where(
-            UserCardProgress.user_id == user_id,
-            UserCardProgress.last_review_date.isnot(None),
-        )
-
-        if start_date:
-            history_query = history_query.where(UserCardProgress.last_review_date >= start_date)
-
-        history_query = history_query.group_by(
-            func.date(UserCardProgress.last_review_date)
-        ).order_by(func.date(UserCardProgress.last_review_date).asc())
-
-        result = await session.exec(history_query)
-        rows = result.all()
-
-        # Query for daily study time from StudySession
-        study_time_query = select(
-            func.date(StudySession.started_at).label("session_date"),
-            func.sum(
-                func.extract(
-                    "epoch",
-                    StudySession.completed_at - StudySession.started_at,
-                )
-            ).label("total_seconds"),
-        ).where(
-            StudySession.user_id == user_id,
-            StudySession.completed_at.isnot(None),
-        )
-
-        if start_date:
-            study_time_query = study_time_query.where(StudySession.started_at >= start_date)
-
-        study_time_query = study_time_query.group_by(func.date(StudySession.started_at)).order_by(
-            func.date(StudySession.started_at).asc()
-        )
+            start_date = today - timedelta(days=days)
 
-        time_result = await session.exec(study_time_query)
-        time_rows = time_result.all()
+        # One rollup row per day with activity
+        daily_stats = await UserDailyStatsService.get_days(session, user_id, start_date=start_date)
 
-        # Build a map of date -> study_time_seconds
-        study_time_map = {row[0]: int(row[1] or 0) for row in time_rows}
-
-        # Build history items with study time
         history_data = []
-        for row in rows:
-            review_date, cards_studied, correct_count = row
-            cards_studied = cards_studied or 0
-            correct_count = correct_count or 0
-            accuracy = (correct_count / cards_studied * 100) if cards_studied > 0 else 0.0
-            study_time = study_time_map.get(review_date, 0)
+        for day in daily_stats:
+            if day.cards_studied <= 0:
+                continue
+            accuracy = day.correct_count / day.cards_studied * 100
 
             history_data.append(
                 StatsHistoryItem(
-                    date=review_date,
-                    cards_studied=cards_studied,
-                    correct_count=correct_count,
+                    date=day.stat_date,
+                    cards_studied=day.cards_studied,
+                    correct_count=day.correct_count,
                     accuracy_rate=round(accuracy, 1),
-                    study_time_seconds=study_time,
+                    study_time_seconds=day.study_time_seconds,
                 )
             )
 
@@ -202,50 +165,33 @@ class StatsService:
         Returns:
             StatsAccuracyRead with overall, period-based, and CEFR-level accuracy
         """
-        now = datetime.utcnow()
-
-        # Helper function to calculate accuracy for a period
-        async def get_accuracy_for_period(days: int | None) -> tuple[int, int]:
-            """Returns (total_reviews, correct_count) for the given period."""
-            query = select(
-                func.sum(UserCardProgress.total_reviews),
-                func.sum(UserCardProgress.correct_count),
-            ).where(UserCardProgress.user_id == user_id)
-
-            if days is not None:
-                start_date = now - timedelta(days=days)
-                query = query.where(UserCardProgress.last_review_date >= start_date)
-
-            result = await session.exec(query)
-            row = result.one()
-            return (row[0] or 0, row[1] or 0)
-
-        # Get all-time stats
-        total_reviews, total_correct = await get_accuracy_for_period(None)
-        overall_accuracy = (total_correct / total_reviews * 100) if total_reviews > 0 else 0.0
-
-        # Get period-based stats
-        reviews_7d, correct_7d = await get_accuracy_for_period(7)
-        reviews_30d, correct_30d = await get_accuracy_for_period(30)
-        reviews_90d, correct_90d = await get_accuracy_for_period(90)
-
-        accuracy_7d = (correct_7d / reviews_7d * 100) if reviews_7d > 0 else None
-        accuracy_30d = (correct_30d / reviews_30d * 100) if reviews_30d > 0 else None
-        accuracy_90d = (correct_90d / reviews_90d * 100) if reviews_90d > 0 else None
-
-        by_period = AccuracyByPeriod(
-            all_time=round(overall_accuracy, 1),
-            last_7_days=round(accuracy_7d, 1) if accuracy_7d is not None else None,
-            last_30_days=round(accuracy_30d, 1) if accuracy_30d is not None else None,
-            last_90_days=round(accuracy_90d, 1) if accuracy_90d is not None else None,
+        today = datetime.utcnow().date()
+
+        # Every period bucket (and the trend window) in one pass over the rollup
+        bucket_columns = []
+        for name, (since_days, until_days) in ACCURACY_WINDOWS.items():
+            conditions = []
+            if since_days is not None:
+                conditions.append(UserDailyStats.stat_date >= today - timedelta(days=since_days))
+            if until_days is not None:
+                conditions.append(UserDailyStats.stat_date < today - timedelta(days=until_days))
+            reviews = func.sum(UserDailyStats.cards_studied)
+            correct = func.sum(UserDailyStats.correct_count)
+            if conditions:
+                reviews = reviews.filter(and_(*conditions))
+                correct = correct.filter(and_(*conditions))
+            bucket_columns += [reviews.label(f"{name}_reviews"), correct.label(f"{name}_correct")]
+
+        periods = (
+            select(*bucket_columns).where(UserDailyStats.user_id == user_id).subquery("periods")
         )
 
-        # Get accuracy by CEFR level
-        by_level_query = (
+        # Accuracy by CEFR level, joined onto the single period row
+        by_level = (
             select(
-                VocabularyCard.cefr_level,
-                func.sum(UserCardProgress.total_reviews),
-                func.sum(UserCardProgress.correct_count),
+                VocabularyCard.cefr_level.label("cefr_level"),
+                func.sum(UserCardProgress.total_reviews).label("level_reviews"),
+                func.sum(UserCardProgress.correct_count).label("level_correct"),
             )
             .select_from(UserCardProgress)
             .join(VocabularyCard, VocabularyCard.id == UserCardProgress.card_id)
@@ -254,40 +200,54 @@ class StatsService:
                 VocabularyCard.cefr_level.isnot(None),
             )
             .group_by(VocabularyCard.cefr_level)
+            .subquery("by_level")
+        )
+
+        statement = select(periods, by_level).select_from(periods.outerjoin(by_level, true()))
+        result = await session.exec(statement)
+        rows = result.all()
+
+        buckets = {
+            name: (
+                int(getattr(rows[0], f"{name}_reviews") or 0),
+                int(getattr(rows[0], f"{name}_correct") or 0),
+            )
+            for name in ACCURACY_WINDOWS
+        }
+
+        def accuracy(name: str) -> float | None:
+            reviews, correct = buckets[name]
+            return correct / reviews * 100 if reviews > 0 else None
+
+        total_reviews, total_correct = buckets["all"]
+        overall_accuracy = accuracy("all") or 0.0
+        accuracy_7d = accuracy("7d")
+        accuracy_30d = accuracy("30d")
+        accuracy_90d = accuracy("90d")
+
+        by_period = AccuracyByPeriod(
+            all_time=round(overall_accuracy, 1),
+            last_7_days=round(accuracy_7d, 1) if accuracy_7d is not None else None,
+            last_30_days=round(accuracy_30d, 1) if accuracy_30d is not None else None,
+            last_90_days=round(accuracy_90d, 1) if accuracy_90d is not None else None,
         )
-        result = await session.exec(by_level_query)
-        by_level_rows = result.all()
 
         by_cefr_level = {}
-        for level, reviews, correct in by_level_rows:
-            if reviews and reviews > 0:
-                by_cefr_level[level] = round((correct or 0) / reviews * 100, 1)
+        for row in rows:
+            if row.cefr_level is not None and row.level_reviews and row.level_reviews > 0:
+                by_cefr_level[row.cefr_level] = round(
+                    (row.level_correct or 0) / row.level_reviews * 100, 1
+                )
 
-        # Determine trend (comparing last 7 days vs previous 7 days)
+        # Determine trend (comparing last 7 days vs the 7 days before)
         trend = "stable"
-        if accuracy_7d is not None:
-            # Get accuracy for 8-14 days ago
-            prev_start = now - timedelta(days=14)
-            prev_end = now - timedelta(days=7)
-            prev_query = select(
-                func.sum(UserCardProgress.total_reviews),
-                func.sum(UserCardProgress.correct_count),
-            ).where(
-                UserCardProgress.user_id == user_id,
-                UserCardProgress.last_review_date >= prev_start,
-                UserCardProgress.last_review_date < prev_end,
-            )
-            result = await session.exec(prev_query)
-            prev_row = result.one()
-            prev_reviews, prev_correct = prev_row[0] or 0, prev_row[1] or 0
-
-            if prev_reviews > 0:
-                prev_accuracy = prev_correct / prev_reviews * 100
-                diff = accuracy_7d - prev_accuracy
-                if diff > 5:
-                    trend = "improving"
-                elif diff < -5:
-                    trend = "declining"
+        prev_accuracy = accuracy("prev_7d")
+        if accuracy_7d is not None and prev_accuracy is not None:
+            diff = accuracy_7d - prev_accuracy
+            if diff > 5:
+                trend = "improving"
+            elif diff < -5:
+                trend = "declining"
 
         return StatsAccuracyRead(
             overall_accuracy=round(overall_accuracy, 1),
@@ -315,50 +275,23 @@ class StatsService:
         Returns:
             TodayStatsRead with today's learning details
         """
-        now = datetime.utcnow()
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        today_end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
-
-        # Query today's completed study sessions
-        sessions_query = select(StudySession).where(
-            StudySession.user_id == user_id,
-            StudySession.started_at >= today_start,
-            StudySession.started_at <= today_end,
-            StudySession.completed_at.isnot(None),
+        today = datetime.utcnow().date()
+
+        # Today's completed study sessions, pre-aggregated
+        days = await UserDailyStatsService.get_days(
+            session, user_id, start_date=today, end_date=today
         )
-        result = await session.exec(sessions_query)
-        sessions = result.all()
-
-        # Calculate totals
-        total_study_time_seconds = 0
-        total_cards_studied = 0
-        new_cards_count = 0
-        review_cards_count = 0
-        review_correct_count = 0
-
-        for study_session in sessions:
-            # Calculate study time
-            if study_session.completed_at and study_session.started_at:
-                duration = (study_session.completed_at - study_session.started_at).total_seconds()
-                total_study_time_seconds += int(duration)
-
-            # Sum cards
-            cards_in_session = study_session.correct_count + study_session.wrong_count
-            total_cards_studied += cards_in_session
-            new_cards_count += study_session.new_cards_count
-            review_cards_count += study_session.review_cards_count
-
-            # For review accuracy, approximate from session data
-            if study_session.review_cards_count > 0:
-                session_accuracy = (
-                    study_session.correct_count / cards_in_session if cards_in_session > 0 else 0
-                )
-                review_correct_count += int(study_session.review_cards_count * session_accuracy)
+        day = days[0] if days else UserDailyStats(user_id=user_id, stat_date=today)
+
+        total_study_time_seconds = day.study_time_seconds
+        total_cards_studied = day.session_cards_count
+        new_cards_count = day.new_cards_count
+        review_cards_count = day.review_cards_count
 
         # Calculate review accuracy
         review_accuracy = None
         if review_cards_count > 0:
-            review_accuracy = round((review_correct_count / review_cards_count) * 100, 1)
+            review_accuracy = round((day.review_correct_count / review_cards_count) * 100, 1)
 
         # Use provided daily goal or default
         effective_daily_goal = daily_goal or 30
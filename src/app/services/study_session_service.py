@@ -8,20 +8,23 @@ import random
 from datetime import datetime
 from uuid import UUID
 
-from sqlmodel import func, select
+from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.exceptions import NotFoundError, UnprocessableEntityError, ValidationError
 from app.models import (
     AnswerResponse,
+    BatchAnswerItem,
+    BatchAnswerResponse,
+    BatchAnswerResult,
+    CardBatchResponse,
     CardResponse,
     CardState,
     ClozeQuestion,
     DailyGoalStatus,
-    Deck,
-    DueCardSummary,
     Profile,
     QuizType,
+    ReviewLog,
     SessionAbandonResponse,
     SessionAbandonSummary,
     SessionCompleteResponse,
@@ -40,10 +43,16 @@ from app.models import (
     UserCardProgress,
     UserSelectedDeck,
     VocabularyCard,
+    WrongAnswer,
     XPInfo,
 )
+from app.services.card_cache import CardCache
+from app.services.card_projections import CardContent
+from app.services.distractor_index import DistractorIndex
+from app.services.new_card_frontier_service import NewCardFrontierService
 from app.services.profile_service import ProfileService
 from app.services.user_card_progress_service import UserCardProgressService
+from app.services.user_daily_stats_service import UserDailyStatsService
 from app.services.wrong_answer_service import WrongAnswerService
 
 # CEFR level order for i+1 calculation
@@ -75,7 +84,7 @@ class StudySessionService:
         if review_ratio < 0.0 or review_ratio > 1.0:
             raise ValidationError("review_ratio must be between 0.0 and 1.0")
 
-        profile = await session.get(Profile, user_id)
+        profile = await ProfileService.get_profile(session, user_id)
         if not profile:
             return SessionPreviewResponse(
                 available=SessionPreviewAvailable(
@@ -87,62 +96,13 @@ class StudySessionService:
                 message="프로필을 찾을 수 없습니다.",
             )
 
-        # Note: DB uses 'timestamp without time zone', so use naive datetime
-        now = datetime.utcnow()
-
-        # ------------------------------------------------------------
-        # Availability: new cards
-        # ------------------------------------------------------------
-        seen_subquery = select(UserCardProgress.card_id).where(UserCardProgress.user_id == user_id)
-        new_cards_query = select(func.count(VocabularyCard.id)).where(
-            VocabularyCard.id.not_in(seen_subquery)
-        )
-
-        if profile.select_all_decks:
-            new_cards_query = new_cards_query.join(
-                Deck, VocabularyCard.deck_id == Deck.id, isouter=True
-            ).where((Deck.is_public == True) | (VocabularyCard.deck_id == None))  # noqa: E712, E711
-        else:
-            selected_deck_ids_subquery = select(UserSelectedDeck.deck_id).where(
-                UserSelectedDeck.user_id == user_id
-            )
-            new_cards_query = new_cards_query.where(
-                VocabularyCard.deck_id.in_(selected_deck_ids_subquery)
-            )
-
-        result = await session.exec(new_cards_query)
-        available_new = int(result.one() or 0)
-
         # ------------------------------------------------------------
-        # Availability: due review/relearning cards (respect review_scope)
+        # Availability: new + due review/relearning cards (respect review_scope)
         # ------------------------------------------------------------
-        base_due_query = (
-            select(func.count(UserCardProgress.id))
-            .select_from(UserCardProgress)
-            .join(VocabularyCard, VocabularyCard.id == UserCardProgress.card_id)
-            .where(
-                UserCardProgress.user_id == user_id,
-                UserCardProgress.next_review_date <= now,
-            )
-        )
-
-        if profile.review_scope == "selected_decks_only" and not profile.select_all_decks:
-            selected_deck_ids_subquery = select(UserSelectedDeck.deck_id).where(
-                UserSelectedDeck.user_id == user_id
-            )
-            base_due_query = base_due_query.where(
-                VocabularyCard.deck_id.in_(selected_deck_ids_subquery)
-            )
-
-        # Split due cards by state: REVIEW vs RELEARNING
-        relearning_query = base_due_query.where(UserCardProgress.card_state == CardState.RELEARNING)
-        review_query = base_due_query.where(UserCardProgress.card_state != CardState.RELEARNING)
-
-        result = await session.exec(relearning_query)
-        available_relearning = int(result.one() or 0)
-
-        result = await session.exec(review_query)
-        available_review = int(result.one() or 0)
+        counts = await UserCardProgressService.get_availability_counts(session, profile)
+        available_new = counts["new_cards"]
+        available_review = counts["review_cards"]
+        available_relearning = counts["relearning_cards"]
 
         available_total_due = available_review + available_relearning
 
@@ -227,7 +187,7 @@ class StudySessionService:
         started_at = datetime.utcnow()
 
         # Get profile for ratio calculation
-        profile = await session.get(Profile, user_id)
+        profile = await ProfileService.get_profile(session, user_id)
 
         if use_profile_ratio and profile:
             # Calculate limits based on profile settings
@@ -373,7 +333,7 @@ class StudySessionService:
 
         # Get current card
         card_id = study_session.card_ids[study_session.current_index]
-        card = await session.get(VocabularyCard, card_id)
+        card = await CardCache.get(session, card_id)
         if not card:
             raise NotFoundError(f"Card {card_id} not found")
 
@@ -403,6 +363,81 @@ class StudySessionService:
             cards_completed=study_session.current_index - 1,  # Don't count current card
         )
 
+    @staticmethod
+    async def get_next_cards(
+        session: AsyncSession,
+        user_id: UUID,
+        session_id: UUID,
+        quiz_type: QuizType,
+        count: int,
+    ) -> CardBatchResponse:
+        """
+        Get the next ``count`` cards in the session with quiz formatting.
+
+        Same as calling ``get_next_card`` ``count`` times, but cards and progress
+        are fetched with one ``IN (...)`` query each and the session is committed
+        once, so clients on slow links can preload a session in one round trip.
+
+        Args:
+            session: DB session
+            user_id: User ID (for validation)
+            session_id: Study session ID
+            quiz_type: Quiz type applied to every card in the batch
+            count: Maximum number of cards to return
+
+        Returns:
+            CardBatchResponse with formatted StudyCards (empty if session complete)
+        """
+        # Get study session
+        study_session = await session.get(StudySession, session_id)
+        if not study_session:
+            raise NotFoundError(f"Session {session_id} not found")
+
+        if study_session.user_id != user_id:
+            raise ValidationError("Session does not belong to this user")
+
+        if study_session.status != SessionStatus.ACTIVE:
+            raise ValidationError(f"Session is {study_session.status.value}, not active")
+
+        total_cards = len(study_session.card_ids)
+        start_index = min(study_session.current_index, total_cards)
+        card_ids = study_session.card_ids[start_index : start_index + count]
+        if not card_ids:
+            return CardBatchResponse(cards=[], cards_remaining=0, cards_completed=total_cards)
+
+        # Fetch cards and progress for the whole batch
+        cards_by_id = await CardCache.get_many(session, card_ids)
+
+        missing_ids = [card_id for card_id in card_ids if card_id not in cards_by_id]
+        if missing_ids:
+            raise NotFoundError(f"Card {missing_ids[0]} not found")
+
+        progress_result = await session.exec(
+            select(UserCardProgress.card_id).where(
+                UserCardProgress.user_id == user_id,
+                UserCardProgress.card_id.in_(card_ids),
+            )
+        )
+        seen_card_ids = set(progress_result.all())
+
+        # Distractors come from the in-memory index, so formatting hits no tables
+        study_cards = [
+            await StudySessionService._format_card(
+                session, cards_by_id[card_id], quiz_type, card_id not in seen_card_ids
+            )
+            for card_id in card_ids
+        ]
+
+        study_session.current_index = start_index + len(card_ids)
+        session.add(study_session)
+        await session.commit()
+
+        return CardBatchResponse(
+            cards=study_cards,
+            cards_remaining=total_cards - study_session.current_index,
+            cards_completed=start_index,
+        )
+
     # ============================================================
     # Submit Answer
     # ============================================================
@@ -452,18 +487,11 @@ class StudySessionService:
             raise ValidationError("Card is not in this session")
 
         # Get card to determine correct answer
-        card = await session.get(VocabularyCard, card_id)
+        card = await CardCache.get(session, card_id)
         if not card:
             raise NotFoundError(f"Card {card_id} not found")
 
-        # Determine correct answer based on typical quiz patterns
-        # For word_to_meaning: korean_meaning is correct
-        # For meaning_to_word, cloze, listening: english_word is correct
-        # Since we don't know which quiz_type was used, we check both
-        is_correct = (
-            user_answer.strip().lower() == card.korean_meaning.strip().lower()
-            or user_answer.strip().lower() == card.english_word.strip().lower()
-        )
+        is_correct = StudySessionService._is_correct_answer(card, user_answer)
 
         # Calculate score based on hint usage (Issue #52)
         score, hint_penalty = StudySessionService._calculate_score(
@@ -508,29 +536,210 @@ class StudySessionService:
         session.add(study_session)
         await session.commit()
 
-        # Generate feedback
-        if revealed_answer:
-            feedback = f"정답: {card.korean_meaning} / {card.english_word}"
-        elif is_correct:
-            if hint_count > 0:
-                feedback = f"정답입니다! (힌트 {hint_count}회 사용)"
-            else:
-                feedback = "정답입니다! 🎉"
-        else:
-            feedback = f"틀렸습니다. 정답: {card.korean_meaning} / {card.english_word}"
-
         return AnswerResponse(
             card_id=card_id,
             is_correct=is_correct,
             correct_answer=card.english_word,  # Primary answer
             user_answer=user_answer,
-            feedback=feedback,
+            feedback=StudySessionService._answer_feedback(
+                card, is_correct, hint_count, revealed_answer
+            ),
             score=score,
             hint_penalty=hint_penalty,
             next_review_date=progress.next_review_date,
             card_state=progress.card_state,
         )
 
+    @staticmethod
+    async def submit_answers_batch(
+        session: AsyncSession,
+        user_id: UUID,
+        session_id: UUID,
+        answers: list[BatchAnswerItem],
+    ) -> BatchAnswerResponse:
+        """
+        Submit several answers for a session in a single transaction.
+
+        Intended for offline or queued clients. Answers are processed in order
+        with the same grading and FSRS rules as ``submit_answer``, but cards and
+        progress are loaded with one query each, scheduling runs in memory, and
+        progress, review logs, wrong answers and session counters are written
+        with a single commit.
+
+        Answers that can't be applied (card not in session or deleted) are
+        reported per answer and skipped; they don't fail the whole batch.
+
+        Args:
+            session: DB session
+            user_id: User ID
+            session_id: Study session ID
+            answers: Answers in the order they were given
+
+        Returns:
+            BatchAnswerResponse with one result per submitted answer
+        """
+        # Get study session
+        study_session = await session.get(StudySession, session_id)
+        if not study_session:
+            raise NotFoundError(f"Session {session_id} not found")
+
+        if study_session.user_id != user_id:
+            raise ValidationError("Session does not belong to this user")
+
+        if study_session.status != SessionStatus.ACTIVE:
+            raise ValidationError(f"Session is {study_session.status.value}, not active")
+
+        session_card_ids = set(study_session.card_ids)
+        card_ids = {answer.card_id for answer in answers if answer.card_id in session_card_ids}
+
+        # Load every card and progress row touched by the batch up front
+        cards_by_id: dict[int, CardContent] = {}
+        progress_by_card: dict[int, UserCardProgress] = {}
+        if card_ids:
+            cards_by_id = await CardCache.get_many(session, card_ids)
+
+            progress_result = await session.exec(
+                select(UserCardProgress).where(
+                    UserCardProgress.user_id == user_id,
+                    UserCardProgress.card_id.in_(card_ids),
+                )
+            )
+            progress_by_card = {progress.card_id: progress for progress in progress_result.all()}
+
+        now = datetime.utcnow()
+        results: list[BatchAnswerResult] = []
+        first_seen_cards: list[CardContent] = []
+        review_logs: list[ReviewLog] = []
+        for index, answer in enumerate(answers):
+            if answer.card_id not in session_card_ids:
+                results.append(
+                    BatchAnswerResult(
+                        index=index, card_id=answer.card_id, error="Card is not in this session"
+                    )
+                )
+                continue
+
+            card = cards_by_id.get(answer.card_id)
+            if not card:
+                results.append(
+                    BatchAnswerResult(
+                        index=index,
+                        card_id=answer.card_id,
+                        error=f"Card {answer.card_id} not found",
+                    )
+                )
+                continue
+
+            is_correct = StudySessionService._is_correct_answer(card, answer.answer)
+            score, hint_penalty = StudySessionService._calculate_score(
+                is_correct=is_correct,
+                hint_count=answer.hint_count,
+                revealed_answer=answer.revealed_answer,
+            )
+            fsrs_is_correct = is_correct and not answer.revealed_answer
+            fsrs_rating_hint = 2 if answer.hint_count > 0 and is_correct else None  # 2 = Hard
+
+            # Repeated answers for the same card build on the in-memory progress
+            progress = progress_by_card.get(answer.card_id)
+            if not progress:
+                progress = UserCardProgress(
+                    user_id=user_id,
+                    card_id=answer.card_id,
+                    card_state=CardState.NEW,
+                    next_review_date=now,
+                )
+                progress_by_card[answer.card_id] = progress
+                first_seen_cards.append(card)
+                session.add(progress)
+
+            review_log = UserCardProgressService.apply_review(
+                progress, fsrs_is_correct, fsrs_rating_hint, now
+            )
+            session.add(review_log)
+            review_logs.append(review_log)
+
+            if fsrs_is_correct:
+                study_session.correct_count += 1
+            else:
+                study_session.wrong_count += 1
+                session.add(
+                    WrongAnswer(
+                        user_id=user_id,
+                        card_id=answer.card_id,
+                        session_id=session_id,
+                        user_answer=answer.answer,
+                        correct_answer=card.english_word,
+                        quiz_type=answer.quiz_type or "unknown",
+                    )
+                )
+
+            results.append(
+                BatchAnswerResult(
+                    index=index,
+                    card_id=answer.card_id,
+                    result=AnswerResponse(
+                        card_id=answer.card_id,
+                        is_correct=is_correct,
+                        correct_answer=card.english_word,
+                        user_answer=answer.answer,
+                        feedback=StudySessionService._answer_feedback(
+                            card, is_correct, answer.hint_count, answer.revealed_answer
+                        ),
+                        score=score,
+                        hint_penalty=hint_penalty,
+                        next_review_date=progress.next_review_date,
+                        card_state=progress.card_state,
+                    ),
+                )
+            )
+
+        accepted_count = sum(1 for result in results if result.result is not None)
+        if accepted_count:
+            if first_seen_cards:
+                await session.flush()
+                await NewCardFrontierService.advance(session, user_id, first_seen_cards)
+            await UserDailyStatsService.record_reviews(session, user_id, review_logs)
+            session.add(study_session)
+            await session.commit()
+
+        return BatchAnswerResponse(
+            session_id=session_id,
+            results=results,
+            accepted_count=accepted_count,
+            rejected_count=len(results) - accepted_count,
+        )
+
+    @staticmethod
+    def _is_correct_answer(card: CardContent, user_answer: str) -> bool:
+        """
+        Check an answer against the card.
+
+        For word_to_meaning the korean_meaning is correct; for meaning_to_word,
+        cloze and listening the english_word is. Since the quiz type isn't
+        trusted, both are accepted.
+        """
+        normalized = user_answer.strip().lower()
+        return (
+            normalized == card.korean_meaning.strip().lower()
+            or normalized == card.english_word.strip().lower()
+        )
+
+    @staticmethod
+    def _answer_feedback(
+        card: CardContent,
+        is_correct: bool,
+        hint_count: int,
+        revealed_answer: bool,
+    ) -> str:
+        """Build the feedback message shown after an answer."""
+        if revealed_answer:
+            return f"정답: {card.korean_meaning} / {card.english_word}"
+        if is_correct:
+            if hint_count > 0:
+                return f"정답입니다! (힌트 {hint_count}회 사용)"
+            return "정답입니다! 🎉"
+        return f"틀렸습니다. 정답: {card.korean_meaning} / {card.english_word}"
+
     @staticmethod
     def _calculate_score(
         is_correct: bool,
@@ -595,7 +804,7 @@ class StudySessionService:
             raise ValidationError("Session already completed")
 
         # Get profile
-        profile = await session.get(Profile, user_id)
+        profile = await ProfileService.get_profile(session, user_id)
         if not profile:
             raise NotFoundError(f"Profile {user_id} not found")
 
@@ -609,6 +818,7 @@ class StudySessionService:
         study_session.status = SessionStatus.COMPLETED
         study_session.completed_at = now
         session.add(study_session)
+        await UserDailyStatsService.record_session(session, study_session)
 
         # Calculate session summary
         total_cards = study_session.correct_count + study_session.wrong_count
@@ -664,6 +874,7 @@ class StudySessionService:
         )
 
         await session.commit()
+        ProfileService.invalidate_cached_profile(profile.id)
 
         return SessionCompleteResponse(
             session_summary=session_summary,
@@ -702,7 +913,7 @@ class StudySessionService:
             raise ValidationError("Session does not belong to this user")
 
         # Get profile for daily goal
-        profile = await session.get(Profile, user_id)
+        profile = await ProfileService.get_profile(session, user_id)
         if not profile:
             raise NotFoundError(f"Profile {user_id} not found")
 
@@ -812,34 +1023,13 @@ class StudySessionService:
         limit: int = 10,
     ) -> list[VocabularyCard]:
         """Get new cards user hasn't seen, ordered by frequency rank."""
-        profile = await session.get(Profile, user_id)
+        profile = await ProfileService.get_profile(session, user_id)
         if not profile:
             return []
 
-        # Subquery for cards user has already seen
-        seen_cards_subquery = select(UserCardProgress.card_id).where(
-            UserCardProgress.user_id == user_id
-        )
-
-        # Build query for unseen cards
-        query = select(VocabularyCard).where(VocabularyCard.id.not_in(seen_cards_subquery))
-
-        # Apply deck filtering based on user preference
-        if profile.select_all_decks:
-            query = query.outerjoin(Deck, VocabularyCard.deck_id == Deck.id).where(
-                (Deck.is_public == True) | (VocabularyCard.deck_id == None)  # noqa: E712, E711
-            )
-        else:
-            selected_deck_ids_subquery = select(UserSelectedDeck.deck_id).where(
-                UserSelectedDeck.user_id == user_id
-            )
-            query = query.where(VocabularyCard.deck_id.in_(selected_deck_ids_subquery))
-
-        # Order by frequency rank
-        query = query.order_by(VocabularyCard.frequency_rank.asc().nullslast()).limit(limit)
-
-        result = await session.exec(query)
-        return list(result.all())
+        # Reads each deck from the user's new-card frontier instead of anti-joining
+        # every card they've already seen
+        return await NewCardFrontierService.get_unseen_cards(session, profile, limit)
 
     @staticmethod
     async def _get_due_review_cards(
@@ -858,15 +1048,12 @@ class StudySessionService:
         now = datetime.utcnow()
 
         # Get profile for review_scope setting
-        profile = await session.get(Profile, user_id)
+        profile = await ProfileService.get_profile(session, user_id)
 
         query = (
             select(UserCardProgress, VocabularyCard)
             .join(VocabularyCard, VocabularyCard.id == UserCardProgress.card_id)
-            .where(
-                UserCardProgress.user_id == user_id,
-                UserCardProgress.next_review_date <= now,
-            )
+            .where(*UserCardProgressService.due_conditions(user_id, now))
         )
 
         # Apply deck filtering based on review_scope setting
@@ -892,11 +1079,11 @@ class StudySessionService:
     @staticmethod
     async def _format_card(
         session: AsyncSession,
-        card: VocabularyCard,
+        card: CardContent,
         quiz_type: QuizType,
         is_new: bool,
     ) -> StudyCard:
-        """Format a VocabularyCard as a StudyCard with quiz formatting."""
+        """Format a card as a StudyCard with quiz formatting."""
         question: str | ClozeQuestion
         options: list[str] | None = None
 
@@ -976,53 +1163,33 @@ class StudySessionService:
         session: AsyncSession,
         correct_answer: str,
         quiz_type: QuizType,
-        card: VocabularyCard,
+        card: CardContent,
         count: int = 4,
     ) -> list[str]:
-        """Generate multiple choice options."""
+        """Generate multiple choice options from the in-memory distractor index."""
         wrong_answers: list[str] = []
         needed = count - 1
 
-        # Get candidates with same difficulty/part of speech
-        query = select(VocabularyCard).where(VocabularyCard.id != card.id)
-
-        if card.difficulty_level:
-            query = query.where(VocabularyCard.difficulty_level == card.difficulty_level)
-
-        if card.part_of_speech:
-            query = query.where(VocabularyCard.part_of_speech == card.part_of_speech)
+        await DistractorIndex.ensure_loaded(session)
 
-        query = query.order_by(func.random()).limit(needed * 2)
-
-        result = await session.exec(query)
-        candidates = list(result.all())
-
-        # Extract wrong answers based on quiz type
-        for candidate in candidates:
+        # Candidates with same difficulty/part of speech, then any card as fallback
+        pool_filters = [
+            (card.difficulty_level, card.part_of_speech),
+            (None, None),
+        ]
+        for difficulty_level, part_of_speech in pool_filters:
             if len(wrong_answers) >= needed:
                 break
 
-            if quiz_type == QuizType.WORD_TO_MEANING:
-                answer = candidate.korean_meaning
-            else:
-                answer = candidate.english_word
-
-            if answer and answer.lower() != correct_answer.lower():
-                if answer not in wrong_answers:
-                    wrong_answers.append(answer)
-
-        # Fallback if not enough candidates
-        if len(wrong_answers) < needed:
-            fallback_query = (
-                select(VocabularyCard)
-                .where(VocabularyCard.id != card.id)
-                .order_by(func.random())
-                .limit(needed * 2)
+            candidates = DistractorIndex.sample(
+                exclude_card_id=card.id,
+                difficulty_level=difficulty_level,
+                part_of_speech=part_of_speech,
+                k=needed * 2,
             )
-            result = await session.exec(fallback_query)
-            fallback_candidates = list(result.all())
 
-            for candidate in fallback_candidates:
+            # Extract wrong answers based on quiz type
+            for candidate in candidates:
                 if len(wrong_answers) >= needed:
                     break
 
@@ -1046,7 +1213,7 @@ class StudySessionService:
     # ============================================================
 
     @staticmethod
-    def _generate_cloze_question(card: VocabularyCard) -> ClozeQuestion | None:
+    def _generate_cloze_question(card: CardContent) -> ClozeQuestion | None:
         """
         Generate a cloze question from a card.
 
@@ -1178,27 +1345,11 @@ class StudySessionService:
         new_cards_count = count_data["new_cards_count"]
         review_cards_count = count_data["review_cards_count"]
 
-        # Get due cards with details
-        due_progress_list = await UserCardProgressService.get_due_cards(
+        # Get due cards with their words in one joined query
+        due_cards = await UserCardProgressService.get_due_card_summaries(
             session, user_id, limit=limit
         )
 
-        # Build due cards summary list
-        due_cards: list[DueCardSummary] = []
-        for progress in due_progress_list:
-            # Get card details
-            card = await session.get(VocabularyCard, progress.card_id)
-            if card:
-                due_cards.append(
-                    DueCardSummary(
-                        card_id=progress.card_id,
-                        english_word=card.english_word,
-                        korean_meaning=card.korean_meaning,
-                        next_review_date=progress.next_review_date,
-                        card_state=progress.card_state,
-                    )
-                )
-
         return StudyOverviewResponse(
             new_cards_count=new_cards_count,
             review_cards_count=review_cards_count,
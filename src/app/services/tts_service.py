@@ -2,17 +2,20 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
-import time
-from collections import deque
+import weakref
+from collections.abc import AsyncIterator, Coroutine
 from math import ceil
-from typing import Literal
+from pathlib import Path
+from typing import Any, Literal
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from openai import AsyncOpenAI
 
 from app.config import settings
 from app.core.exceptions import ExternalServiceError
+from app.services.audio_store import AudioStore
+from app.services.openai_clients import OpenAIClients
+from app.services.tts_store import TTSStore, create_tts_store
 
 AudioFormat = Literal["mp3", "ogg"]
 OpenAIResponseFormat = Literal["mp3", "opus"]
@@ -22,18 +25,37 @@ class TTSService:
     """Text-to-Speech service wrapper.
 
     Current implementation:
-    - Provider: OpenAI TTS
-    - Cache: in-memory TTL
-    - Rate limiting: in-memory sliding window per user
+    - Provider: OpenAI TTS on the shared ``OpenAIClients`` connection pool
+    - Cache: TTL cache in a ``TTSStore``
+    - Rate limiting: sliding window per user in the same ``TTSStore``
+    - Storage: generated files kept permanently in the content-addressed ``AudioStore``
+    - Single-flight: concurrent misses for the same audio await one provider call
+    - Streaming: ``stream_audio`` forwards provider chunks while writing them to the
+      ``AudioStore``
 
     Notes:
-    - In-memory caching/limiting is single-process only.
-    - For multi-instance deployments, switch to Redis.
+    - The store comes from ``settings.tts_store_backend``: ``memory`` is
+      single-process only, ``redis`` is shared by every instance.
     """
 
-    _cache: dict[str, tuple[float, bytes]] = {}
-    _rate_windows: dict[str, deque[float]] = {}
-    _lock = asyncio.Lock()
+    _store: TTSStore | None = None
+    # Provider calls in flight by cache key (single-flight, per process)
+    _in_flight: dict[str, asyncio.Task[bytes]] = {}
+    _provider_calls: int = 0
+    _coalesced_waits: int = 0
+    # Chunks buffered between the provider and a streaming client
+    _stream_buffer_chunks: int = 16
+
+    @classmethod
+    def get_store(cls) -> TTSStore:
+        if cls._store is None:
+            cls._store = create_tts_store()
+        return cls._store
+
+    @classmethod
+    def set_store(cls, store: TTSStore | None) -> None:
+        """Replace the store (None rebuilds it from settings on next use)."""
+        cls._store = store
 
     @staticmethod
     def _cache_key(*, text: str, voice: str, audio_format: AudioFormat, model: str) -> str:
@@ -47,6 +69,43 @@ class TTSService:
         h.update(text.encode("utf-8"))
         return h.hexdigest()
 
+    @classmethod
+    def audio_key(
+        cls, *, text: str, audio_format: AudioFormat = "mp3", voice: str | None = None
+    ) -> str:
+        """Cache/store key for ``text`` with the configured model and ``voice``."""
+        return cls._cache_key(
+            text=text,
+            voice=voice or settings.openai_tts_default_voice,
+            audio_format=audio_format,
+            model=settings.openai_tts_model,
+        )
+
+    @classmethod
+    async def get_audio_file(
+        cls,
+        *,
+        profile_id: UUID,
+        text: str,
+        audio_format: AudioFormat = "mp3",
+        voice: str | None = None,
+    ) -> Path:
+        """Path of the audio for ``text`` in the persistent ``AudioStore``.
+
+        Audio that was already stored (by an earlier request or the pre-generation
+        script) is returned without touching the cache or the rate limit; otherwise
+        it's produced by ``generate_audio`` and stored first.
+        """
+        key = cls.audio_key(text=text, audio_format=audio_format, voice=voice)
+        path = await AudioStore.get(key, audio_format)
+        if path is not None:
+            return path
+
+        audio_bytes = await cls.generate_audio(
+            profile_id=profile_id, text=text, audio_format=audio_format, voice=voice
+        )
+        return await AudioStore.put(key, audio_format, audio_bytes)
+
     @classmethod
     async def generate_audio(
         cls,
@@ -60,96 +119,287 @@ class TTSService:
 
         Raises:
         - HTTPException(429) when rate limited
-        - ExternalServiceError(503) on provider failures
+        - ExternalServiceError(503) on provider or store failures
+        """
+        if not settings.openai_api_key:
+            raise ExternalServiceError("OpenAI API key is not configured", service="openai")
+
+        store = cls.get_store()
+        cache_key = cls.audio_key(text=text, audio_format=audio_format, voice=voice)
+
+        # Cache hit
+        cached = await store.get_audio(cache_key)
+        if cached is not None:
+            return cached
+
+        in_flight = await cls._join_in_flight(store, cache_key, profile_id)
+        if in_flight is None:
+            in_flight = cls._start_in_flight(
+                cache_key, cls._synthesize_and_cache(store, cache_key, text, audio_format, voice)
+            )
+
+        # Shielded so one caller disconnecting doesn't cancel the call for the others
+        return await asyncio.shield(in_flight)
+
+    @classmethod
+    async def stream_audio(
+        cls,
+        *,
+        profile_id: UUID,
+        text: str,
+        audio_format: AudioFormat = "mp3",
+        voice: str | None = None,
+    ) -> Path | AsyncIterator[bytes]:
+        """Stored audio as an ``AudioStore`` path, or the provider's chunks as they arrive.
+
+        Audio that is stored, cached or already being generated by another request
+        comes back as a path, like ``get_audio_file``. Otherwise the provider is
+        called in streaming mode; a background task tees the chunks into the
+        ``AudioStore`` (then the cache) and keeps going if the client disconnects.
+
+        Raises (before the first chunk):
+        - HTTPException(429) when rate limited
+        - ExternalServiceError(503) on provider or store failures
+
+        A provider failure after the first chunk ends the stream with the error.
         """
+        cache_key = cls.audio_key(text=text, audio_format=audio_format, voice=voice)
+        path = await AudioStore.get(cache_key, audio_format)
+        if path is not None:
+            return path
 
-        api_key = settings.openai_api_key
-        if not api_key:
+        if not settings.openai_api_key:
             raise ExternalServiceError("OpenAI API key is not configured", service="openai")
 
-        model = settings.openai_tts_model
-        chosen_voice = voice or settings.openai_tts_default_voice
+        store = cls.get_store()
+        audio_bytes = await store.get_audio(cache_key)
+        if audio_bytes is None:
+            in_flight = await cls._join_in_flight(store, cache_key, profile_id)
+            if in_flight is None:
+                return await cls._start_stream(store, cache_key, text, audio_format, voice)
+            audio_bytes = await asyncio.shield(in_flight)
+            # A streamed call has already stored the file
+            path = await AudioStore.get(cache_key, audio_format)
+            if path is not None:
+                return path
+        return await AudioStore.put(cache_key, audio_format, audio_bytes)
 
-        now = time.monotonic()
-        cache_ttl = max(0, int(settings.tts_cache_ttl_seconds))
-        cache_key = cls._cache_key(
-            text=text,
-            voice=chosen_voice,
-            audio_format=audio_format,
-            model=model,
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        """Provider calls made, requests that joined one in flight, and calls running now."""
+        return {
+            "provider_calls": cls._provider_calls,
+            "coalesced_waits": cls._coalesced_waits,
+            "in_flight": len(cls._in_flight),
+        }
+
+    @classmethod
+    def reset_stats(cls) -> None:
+        cls._provider_calls = 0
+        cls._coalesced_waits = 0
+
+    @staticmethod
+    async def _check_rate_limit(store: TTSStore, profile_id: UUID) -> None:
+        limit = max(1, int(settings.tts_rate_limit_requests))
+        window = max(1, int(settings.tts_rate_limit_window_seconds))
+        retry_after = await store.hit_rate_limit(f"tts:{profile_id}", limit, window)
+        if retry_after is not None:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="TTS rate limit exceeded",
+                headers={"Retry-After": str(max(1, ceil(retry_after)))},
+            )
+
+    @classmethod
+    async def _join_in_flight(
+        cls, store: TTSStore, cache_key: str, profile_id: UUID
+    ) -> asyncio.Task[bytes] | None:
+        """The provider call already running for ``cache_key``, if any.
+
+        Otherwise charges the caller's rate limit and returns None: the caller
+        starts the call itself.
+        """
+        in_flight = cls._in_flight.get(cache_key)
+        if in_flight is None:
+            await cls._check_rate_limit(store, profile_id)
+            # Another request may have started the call while we checked the limit
+            in_flight = cls._in_flight.get(cache_key)
+        if in_flight is not None:
+            cls._coalesced_waits += 1
+        return in_flight
+
+    @classmethod
+    def _start_in_flight(
+        cls, cache_key: str, provider_call: Coroutine[Any, Any, bytes]
+    ) -> asyncio.Task[bytes]:
+        def finish(task: asyncio.Task[bytes]) -> None:
+            if cls._in_flight.get(cache_key) is task:
+                del cls._in_flight[cache_key]
+            # Mark the error as retrieved in case every waiter went away
+            if not task.cancelled():
+                task.exception()
+
+        task = asyncio.create_task(provider_call)
+        cls._in_flight[cache_key] = task
+        task.add_done_callback(finish)
+        return task
+
+    @classmethod
+    async def _synthesize_and_cache(
+        cls,
+        store: TTSStore,
+        cache_key: str,
+        text: str,
+        audio_format: AudioFormat,
+        voice: str | None,
+    ) -> bytes:
+        cls._provider_calls += 1
+        audio_bytes = await cls.synthesize(text=text, audio_format=audio_format, voice=voice)
+        ttl = max(0, int(settings.tts_cache_ttl_seconds))
+        await store.set_audio(cache_key, audio_bytes, ttl)
+        return audio_bytes
+
+    @classmethod
+    async def _stream_and_cache(
+        cls,
+        store: TTSStore,
+        cache_key: str,
+        text: str,
+        audio_format: AudioFormat,
+        voice: str | None,
+        chunks: asyncio.Queue[bytes | BaseException | None],
+        detached: asyncio.Event,
+    ) -> bytes:
+        """Forward provider chunks to ``chunks`` (None when done) while writing them to
+        the ``AudioStore``, then cache the stored file.
+
+        ``chunks`` is bounded, so a slow client slows the provider read down instead of
+        buffering the clip in memory; once ``detached`` is set (client gone) chunks are
+        only written to disk.
+        """
+
+        async def send(item: bytes | BaseException | None) -> None:
+            if not detached.is_set():
+                await chunks.put(item)
+
+        cls._provider_calls += 1
+        try:
+            async with AudioStore.writer(cache_key, audio_format) as audio_file:
+                async for chunk in cls.synthesize_stream(
+                    text=text, audio_format=audio_format, voice=voice
+                ):
+                    await audio_file.write(chunk)
+                    await send(chunk)
+                path = await audio_file.commit()
+        except BaseException as e:
+            await send(e)
+            raise
+        await send(None)
+
+        audio_bytes = await asyncio.to_thread(path.read_bytes)
+        ttl = max(0, int(settings.tts_cache_ttl_seconds))
+        await store.set_audio(cache_key, audio_bytes, ttl)
+        return audio_bytes
+
+    @classmethod
+    async def _start_stream(
+        cls,
+        store: TTSStore,
+        cache_key: str,
+        text: str,
+        audio_format: AudioFormat,
+        voice: str | None,
+    ) -> AsyncIterator[bytes]:
+        chunks: asyncio.Queue[bytes | BaseException | None] = asyncio.Queue(
+            maxsize=cls._stream_buffer_chunks
+        )
+        detached = asyncio.Event()
+        cls._start_in_flight(
+            cache_key,
+            cls._stream_and_cache(store, cache_key, text, audio_format, voice, chunks, detached),
         )
 
-        async with cls._lock:
-            # Cache hit
-            cached = cls._cache.get(cache_key)
-            if cached is not None:
-                expires_at, audio_bytes = cached
-                if expires_at > now:
-                    return audio_bytes
-                cls._cache.pop(cache_key, None)
-
-            # Rate limit
-            limit = max(1, int(settings.tts_rate_limit_requests))
-            window = max(1, int(settings.tts_rate_limit_window_seconds))
-
-            bucket_key = f"tts:{profile_id}"
-            q = cls._rate_windows.get(bucket_key)
-            if q is None:
-                q = deque()
-                cls._rate_windows[bucket_key] = q
-
-            cutoff = now - window
-            while q and q[0] <= cutoff:
-                q.popleft()
-
-            if len(q) >= limit:
-                retry_after = ceil((q[0] + window) - now) if q else window
-                raise HTTPException(
-                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                    detail="TTS rate limit exceeded",
-                    headers={"Retry-After": str(max(1, retry_after))},
-                )
-
-            q.append(now)
-
-            # Opportunistic cache pruning
-            if len(cls._cache) > max(1, int(settings.tts_cache_max_entries)):
-                cls._prune_cache_locked(now)
-
-        # Provider call (outside lock)
-        response_format: OpenAIResponseFormat = "mp3" if audio_format == "mp3" else "opus"
+        def detach() -> None:
+            # Unblock the producer and let it finish storing without us
+            detached.set()
+            while not chunks.empty():
+                chunks.get_nowait()
 
+        async def next_chunk() -> bytes | None:
+            item = await chunks.get()
+            if isinstance(item, BaseException):
+                raise item
+            return item
+
+        # Wait for the first chunk so provider errors still become a 503 response
         try:
-            client = AsyncOpenAI(api_key=api_key)
-            response = await client.audio.speech.create(
-                model=model,
-                voice=chosen_voice,
-                input=text,
-                response_format=response_format,
-            )
-            audio_bytes = response.content
-        except HTTPException:
+            first = await next_chunk()
+        except BaseException:
+            detach()
             raise
+
+        async def forward() -> AsyncIterator[bytes]:
+            try:
+                chunk = first
+                while chunk is not None:
+                    yield chunk
+                    chunk = await next_chunk()
+            finally:
+                detach()
+
+        stream = forward()
+        # A stream dropped before it's iterated never runs its ``finally``
+        weakref.finalize(stream, detach)
+        return stream
+
+    @staticmethod
+    def _speech_params(
+        *, text: str, audio_format: AudioFormat, voice: str | None
+    ) -> dict[str, Any]:
+        if not settings.openai_api_key:
+            raise ExternalServiceError("OpenAI API key is not configured", service="openai")
+
+        response_format: OpenAIResponseFormat = "mp3" if audio_format == "mp3" else "opus"
+        return {
+            "model": settings.openai_tts_model,
+            "voice": voice or settings.openai_tts_default_voice,
+            "input": text,
+            "response_format": response_format,
+        }
+
+    @staticmethod
+    async def synthesize(
+        *, text: str, audio_format: AudioFormat = "mp3", voice: str | None = None
+    ) -> bytes:
+        """Call the provider directly (no cache, no rate limit); for batch jobs.
+
+        Raises:
+        - ExternalServiceError(503) on provider failures
+        """
+        params = TTSService._speech_params(text=text, audio_format=audio_format, voice=voice)
+
+        try:
+            client = OpenAIClients.openai()
+            response = await client.audio.speech.create(**params)
+            return response.content
         except Exception as e:
             raise ExternalServiceError("TTS generation failed", service="openai") from e
 
-        # Store in cache
-        expires_at = now + cache_ttl
-        async with cls._lock:
-            cls._cache[cache_key] = (expires_at, audio_bytes)
-            if len(cls._cache) > max(1, int(settings.tts_cache_max_entries)):
-                cls._prune_cache_locked(time.monotonic())
+    @staticmethod
+    async def synthesize_stream(
+        *, text: str, audio_format: AudioFormat = "mp3", voice: str | None = None
+    ) -> AsyncIterator[bytes]:
+        """Like ``synthesize``, but yields the audio as the provider sends it.
 
-        return audio_bytes
+        Raises:
+        - ExternalServiceError(503) on provider failures
+        """
+        params = TTSService._speech_params(text=text, audio_format=audio_format, voice=voice)
 
-    @classmethod
-    def _prune_cache_locked(cls, now: float) -> None:
-        # Remove expired first
-        expired_keys = [k for k, (exp, _) in cls._cache.items() if exp <= now]
-        for k in expired_keys:
-            cls._cache.pop(k, None)
-
-        # Hard cap fallback: drop arbitrary items until within limit
-        max_entries = max(1, int(settings.tts_cache_max_entries))
-        while len(cls._cache) > max_entries:
-            cls._cache.pop(next(iter(cls._cache)))
+        try:
+            client = OpenAIClients.openai()
+            async with client.audio.speech.with_streaming_response.create(**params) as response:
+                async for chunk in response.iter_bytes():
+                    yield chunk
+        except Exception as e:
+            raise ExternalServiceError("TTS generation failed", service="openai") from e
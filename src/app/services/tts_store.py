@@ -0,0 +1,205 @@
+"""
+Storage backends for the TTS audio cache and per-user rate limiter.
+
+``settings.tts_store_backend`` selects the backend:
+
+- ``memory``: dicts in this process. Every instance keeps its own cache and its
+  own rate windows, so N instances allow N times the configured rate.
+- ``redis``: one Redis (or Redis-protocol compatible server) shared by every
+  instance. Audio is stored with a TTL, and the sliding window is a sorted set
+  updated by a Lua script, so the check-and-record is atomic across instances.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import TYPE_CHECKING
+
+from app.config import settings
+from app.core.exceptions import ExternalServiceError
+
+try:
+    from redis.exceptions import RedisError
+except ImportError:  # the redis extra isn't installed; only RedisTTSStore needs it
+
+    class RedisError(Exception):  # type: ignore[no-redef]
+        """Stand-in so ``except RedisError`` works without the redis package."""
+
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+
+class TTSStore(ABC):
+    """Cache of synthesized audio plus a sliding-window rate limiter."""
+
+    @abstractmethod
+    async def get_audio(self, key: str) -> bytes | None:
+        """Return cached audio, or None on a miss."""
+
+    @abstractmethod
+    async def set_audio(self, key: str, audio: bytes, ttl_seconds: int) -> None:
+        """Cache audio for ``ttl_seconds`` (nothing is stored when it's 0)."""
+
+    @abstractmethod
+    async def hit_rate_limit(self, bucket: str, limit: int, window_seconds: int) -> float | None:
+        """
+        Record one request in ``bucket`` if it's under ``limit`` per window.
+
+        Returns None when the request is allowed, otherwise the seconds until the
+        oldest request in the window expires (nothing is recorded).
+        """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Drop all cached audio and rate windows (mainly for tests)."""
+
+
+class MemoryTTSStore(TTSStore):
+    """Process-local store; the default."""
+
+    def __init__(self) -> None:
+        self._cache: dict[str, tuple[float, bytes]] = {}
+        self._rate_windows: dict[str, deque[float]] = {}
+        self._lock = asyncio.Lock()
+
+    async def get_audio(self, key: str) -> bytes | None:
+        now = time.monotonic()
+        async with self._lock:
+            cached = self._cache.get(key)
+            if cached is None:
+                return None
+            expires_at, audio = cached
+            if expires_at > now:
+                return audio
+            self._cache.pop(key, None)
+            return None
+
+    async def set_audio(self, key: str, audio: bytes, ttl_seconds: int) -> None:
+        if ttl_seconds <= 0:
+            return
+
+        now = time.monotonic()
+        async with self._lock:
+            self._cache[key] = (now + ttl_seconds, audio)
+            if len(self._cache) > max(1, int(settings.tts_cache_max_entries)):
+                self._prune_cache_locked(now)
+
+    async def hit_rate_limit(self, bucket: str, limit: int, window_seconds: int) -> float | None:
+        now = time.monotonic()
+        async with self._lock:
+            q = self._rate_windows.get(bucket)
+            if q is None:
+                q = deque()
+                self._rate_windows[bucket] = q
+
+            cutoff = now - window_seconds
+            while q and q[0] <= cutoff:
+                q.popleft()
+
+            if len(q) >= limit:
+                return q[0] + window_seconds - now
+
+            q.append(now)
+            return None
+
+    async def clear(self) -> None:
+        async with self._lock:
+            self._cache = {}
+            self._rate_windows = {}
+
+    def _prune_cache_locked(self, now: float) -> None:
+        # Remove expired first
+        expired_keys = [k for k, (exp, _) in self._cache.items() if exp <= now]
+        for k in expired_keys:
+            self._cache.pop(k, None)
+
+        # Hard cap fallback: drop oldest inserted items until within limit
+        max_entries = max(1, int(settings.tts_cache_max_entries))
+        while len(self._cache) > max_entries:
+            self._cache.pop(next(iter(self._cache)))
+
+
+# KEYS[1] = window sorted set; ARGV = window_ms, limit, member
+# Uses the server clock so instances with skewed clocks share one window.
+# Returns -1 when allowed, else milliseconds until the oldest entry leaves the window.
+_SLIDING_WINDOW_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+if redis.call('ZCARD', KEYS[1]) >= limit then
+    local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+    return tonumber(oldest[2]) + window - now
+end
+
+redis.call('ZADD', KEYS[1], now, ARGV[3])
+redis.call('PEXPIRE', KEYS[1], window)
+return -1
+"""
+
+
+class RedisTTSStore(TTSStore):
+    """Store shared by every instance through Redis."""
+
+    def __init__(self, client: Redis, *, prefix: str = "loops:tts:") -> None:
+        self._client = client
+        self._prefix = prefix
+        self._sliding_window = client.register_script(_SLIDING_WINDOW_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str) -> RedisTTSStore:
+        try:
+            from redis.asyncio import Redis
+        except ImportError as e:
+            raise ExternalServiceError(
+                "Redis TTS store requires the 'redis' package", service="redis"
+            ) from e
+        return cls(Redis.from_url(url))
+
+    async def get_audio(self, key: str) -> bytes | None:
+        try:
+            return await self._client.get(f"{self._prefix}audio:{key}")
+        except RedisError as e:
+            raise ExternalServiceError("TTS cache is unavailable", service="redis") from e
+
+    async def set_audio(self, key: str, audio: bytes, ttl_seconds: int) -> None:
+        if ttl_seconds <= 0:
+            return
+        try:
+            await self._client.set(f"{self._prefix}audio:{key}", audio, ex=ttl_seconds)
+        except RedisError as e:
+            raise ExternalServiceError("TTS cache is unavailable", service="redis") from e
+
+    async def hit_rate_limit(self, bucket: str, limit: int, window_seconds: int) -> float | None:
+        try:
+            retry_after_ms = await self._sliding_window(
+                keys=[f"{self._prefix}rate:{bucket}"],
+                args=[window_seconds * 1000, limit, uuid.uuid4().hex],
+            )
+        except RedisError as e:
+            raise ExternalServiceError("TTS rate limiter is unavailable", service="redis") from e
+        return None if int(retry_after_ms) < 0 else int(retry_after_ms) / 1000
+
+    async def clear(self) -> None:
+        keys = [key async for key in self._client.scan_iter(match=f"{self._prefix}*")]
+        if keys:
+            await self._client.delete(*keys)
+
+
+def create_tts_store() -> TTSStore:
+    """Build the store selected by ``settings.tts_store_backend``."""
+    backend = settings.tts_store_backend
+    if backend == "memory":
+        return MemoryTTSStore()
+    if backend == "redis":
+        if not settings.redis_url:
+            raise ExternalServiceError("Redis URL is not configured", service="redis")
+        return RedisTTSStore.from_url(settings.redis_url)
+    raise ValueError(f"Unknown TTS store backend: {backend}")
@@ -1,20 +1,27 @@
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
 from fsrs import Card, Rating, Scheduler
 from fsrs import State as FSRSState
+from sqlalchemy import ColumnElement, case, literal_column, true
 from sqlmodel import func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models import (
     CardState,
     Deck,
+    DueCardSummary,
     Profile,
+    ReviewLog,
     UserCardProgress,
     UserCardProgressCreate,
     UserSelectedDeck,
     VocabularyCard,
 )
+from app.services.card_cache import CardCache
+from app.services.new_card_frontier_service import NewCardFrontierService
+from app.services.profile_service import ProfileService
+from app.services.user_daily_stats_service import UserDailyStatsService
 
 
 class UserCardProgressService:
@@ -22,6 +29,23 @@ class UserCardProgressService:
 
     scheduler = Scheduler(enable_fuzzing=False)
 
+    @staticmethod
+    def due_conditions(user_id: UUID, now: datetime) -> tuple[ColumnElement[bool], ...]:
+        """
+        WHERE conditions selecting a user's cards due for review.
+
+        Progress rows only stay NEW until their first review is applied, so
+        excluding them changes no results but lets the planner use the partial
+        ``ix_user_card_progress_due`` index. The literal is rendered inline: a
+        bound parameter can't be matched against the index predicate by
+        Postgres generic plans.
+        """
+        return (
+            UserCardProgress.user_id == user_id,
+            UserCardProgress.card_state != literal_column(f"'{CardState.NEW.name}'"),
+            UserCardProgress.next_review_date <= now,
+        )
+
     @staticmethod
     def progress_to_card(progress: UserCardProgress) -> Card:
         """Convert UserCardProgress to FSRS Card."""
@@ -95,7 +119,7 @@ class UserCardProgressService:
         progress.interval = max(interval_days, 0)
 
         # Calculate elapsed days since last review
-        if progress.last_review_date and progress.quality_history:
+        if progress.last_review_date and progress.total_reviews > 0:
             last_review = progress.last_review_date
             # Ensure both are naive for comparison
             now_naive = now.replace(tzinfo=None) if now.tzinfo else now
@@ -118,24 +142,6 @@ class UserCardProgressService:
         if is_correct:
             progress.correct_count += 1
 
-        # Record history
-        now_naive = now.replace(tzinfo=None) if now.tzinfo else now
-        history_entry = {
-            "date": now_naive.isoformat(),
-            "is_correct": is_correct,
-            "interval": interval_days,
-            "stability": card.stability,
-            "difficulty": card.difficulty,
-            "state": progress.card_state.value,
-        }
-
-        if progress.quality_history is None:
-            progress.quality_history = []
-        if isinstance(progress.quality_history, list):
-            progress.quality_history.append(history_entry)
-        else:
-            progress.quality_history = [history_entry]
-
         return progress
 
     @staticmethod
@@ -188,16 +194,44 @@ class UserCardProgressService:
         now = datetime.utcnow()
         statement = (
             select(UserCardProgress)
-            .where(
-                UserCardProgress.user_id == user_id,
-                UserCardProgress.next_review_date <= now,
-            )
+            .where(*UserCardProgressService.due_conditions(user_id, now))
             .order_by(UserCardProgress.next_review_date)
             .limit(limit)
         )
         result = await session.exec(statement)
         return list(result.all())
 
+    @staticmethod
+    async def get_due_card_summaries(
+        session: AsyncSession, user_id: UUID, limit: int = 20
+    ) -> list[DueCardSummary]:
+        """Get due cards joined with their words, selecting only the summary columns."""
+        now = datetime.utcnow()
+        statement = (
+            select(
+                UserCardProgress.card_id,
+                VocabularyCard.english_word,
+                VocabularyCard.korean_meaning,
+                UserCardProgress.next_review_date,
+                UserCardProgress.card_state,
+            )
+            .join(VocabularyCard, VocabularyCard.id == UserCardProgress.card_id)
+            .where(*UserCardProgressService.due_conditions(user_id, now))
+            .order_by(UserCardProgress.next_review_date)
+            .limit(limit)
+        )
+        result = await session.exec(statement)
+        return [
+            DueCardSummary(
+                card_id=card_id,
+                english_word=english_word,
+                korean_meaning=korean_meaning,
+                next_review_date=next_review_date,
+                card_state=card_state,
+            )
+            for card_id, english_word, korean_meaning, next_review_date, card_state in result.all()
+        ]
+
     @staticmethod
     async def process_review(
         session: AsyncSession,
@@ -219,19 +253,12 @@ class UserCardProgressService:
         - 3 = Good (normal)
         - 4 = Easy (perfect)
         """
-        # Use rating_hint if provided, otherwise use binary rating
-        if rating_hint is not None:
-            rating_map = {1: Rating.Again, 2: Rating.Hard, 3: Rating.Good, 4: Rating.Easy}
-            fsrs_rating = rating_map.get(rating_hint, Rating.Good if is_correct else Rating.Again)
-        else:
-            fsrs_rating = Rating.Good if is_correct else Rating.Again
         # Note: DB uses 'timestamp without time zone', so use naive datetime for storage
-        # But FSRS requires timezone-aware datetime for review_card()
         now = datetime.utcnow()
-        now_utc = datetime.now(UTC)
 
         progress = await UserCardProgressService.get_user_card_progress(session, user_id, card_id)
 
+        is_first_review = progress is None
         if not progress:
             progress = UserCardProgress(
                 user_id=user_id,
@@ -239,7 +266,49 @@ class UserCardProgressService:
                 card_state=CardState.NEW,
                 next_review_date=now,
             )
-            session.add(progress)
+
+        review_log = UserCardProgressService.apply_review(progress, is_correct, rating_hint, now)
+
+        session.add(progress)
+        session.add(review_log)
+        await UserDailyStatsService.record_reviews(session, user_id, [review_log])
+
+        # The card is no longer new: move the user's frontier in its deck past it
+        if is_first_review:
+            await session.flush()
+            card = await CardCache.get(session, card_id)
+            if card:
+                await NewCardFrontierService.advance(session, user_id, [card])
+
+        await session.commit()
+        await session.refresh(progress)
+
+        return progress
+
+    @staticmethod
+    def apply_review(
+        progress: UserCardProgress,
+        is_correct: bool,
+        rating_hint: int | None,
+        review_datetime: datetime,
+    ) -> ReviewLog:
+        """
+        Run FSRS scheduling for one review in memory.
+
+        Updates ``progress`` in place and returns the (unsaved) ReviewLog row for
+        the review. Nothing is added to the session, so callers can batch several
+        reviews into a single transaction.
+        """
+        # Use rating_hint if provided, otherwise use binary rating
+        if rating_hint is not None:
+            rating_map = {1: Rating.Again, 2: Rating.Hard, 3: Rating.Good, 4: Rating.Easy}
+            fsrs_rating = rating_map.get(rating_hint, Rating.Good if is_correct else Rating.Again)
+        else:
+            fsrs_rating = Rating.Good if is_correct else Rating.Again
+
+        # FSRS requires timezone-aware datetime for review_card()
+        now = review_datetime.replace(tzinfo=None) if review_datetime.tzinfo else review_datetime
+        now_utc = now.replace(tzinfo=UTC)
 
         # Convert to FSRS Card and process review
         card = UserCardProgressService.progress_to_card(progress)
@@ -250,16 +319,19 @@ class UserCardProgressService:
         )
 
         # Update progress from the reviewed card
-        progress = UserCardProgressService.update_progress_from_card(
-            progress, updated_card, is_correct, now
+        UserCardProgressService.update_progress_from_card(progress, updated_card, is_correct, now)
+
+        return ReviewLog(
+            user_id=progress.user_id,
+            card_id=progress.card_id,
+            reviewed_at=now,
+            is_correct=is_correct,
+            interval=progress.interval,
+            stability=progress.stability,
+            difficulty=progress.difficulty,
+            card_state=progress.card_state,
         )
 
-        session.add(progress)
-        await session.commit()
-        await session.refresh(progress)
-
-        return progress
-
     @staticmethod
     async def get_today_progress(session: AsyncSession, user_id: UUID, daily_goal: int) -> dict:
         """
@@ -273,35 +345,21 @@ class UserCardProgressService:
         now = datetime.utcnow()
         today = now.date()
 
-        # Get all progress records for user where last_review_date is today
+        # Range scan over (user_id, reviewed_at)
         today_start = datetime.combine(today, datetime.min.time())
-        today_end = datetime.combine(today, datetime.max.time())
-        statement = select(UserCardProgress).where(
-            UserCardProgress.user_id == user_id,
-            UserCardProgress.last_review_date >= today_start,
-            UserCardProgress.last_review_date < today_end,
+        tomorrow_start = today_start + timedelta(days=1)
+        statement = select(
+            func.count(ReviewLog.id),
+            func.coalesce(func.sum(case((ReviewLog.is_correct == True, 1), else_=0)), 0),  # noqa: E712
+        ).where(
+            ReviewLog.user_id == user_id,
+            ReviewLog.reviewed_at >= today_start,
+            ReviewLog.reviewed_at < tomorrow_start,
         )
         result = await session.exec(statement)
-        progress_records = list(result.all())
-
-        # Count reviews from quality_history for today
-        total_reviews = 0
-        correct_count = 0
-
-        for progress in progress_records:
-            if progress.quality_history and isinstance(progress.quality_history, list):
-                for entry in progress.quality_history:
-                    if isinstance(entry, dict):
-                        entry_date_str = entry.get("date")
-                        if entry_date_str:
-                            try:
-                                entry_date = datetime.fromisoformat(entry_date_str).date()
-                                if entry_date == today:
-                                    total_reviews += 1
-                                    if entry.get("is_correct", False):
-                                        correct_count += 1
-                            except (ValueError, AttributeError):
-                                continue
+        total_reviews, correct_count = result.one()
+        total_reviews = int(total_reviews or 0)
+        correct_count = int(correct_count or 0)
 
         wrong_count = total_reviews - correct_count
         accuracy_rate = (correct_count / total_reviews * 100) if total_reviews > 0 else 0.0
@@ -329,48 +387,91 @@ class UserCardProgressService:
             dict with new_cards_count and review_cards_count
         """
         # Get profile to check deck selection preference
-        profile = await session.get(Profile, user_id)
+        profile = await ProfileService.get_profile(session, user_id)
         if not profile:
             return {"new_cards_count": 0, "review_cards_count": 0}
 
-        # Get cards user has already seen
-        seen_subquery = select(UserCardProgress.card_id).where(UserCardProgress.user_id == user_id)
-
-        # Build base query for new cards
-        new_cards_query = select(func.count(VocabularyCard.id)).where(
-            VocabularyCard.id.not_in(seen_subquery)
+        counts = await UserCardProgressService.get_availability_counts(
+            session, profile, apply_review_scope=False
         )
 
-        # Apply deck filtering based on user preference
-        if profile.select_all_decks:
-            # Count from all public decks
-            new_cards_query = new_cards_query.join(
-                Deck, VocabularyCard.deck_id == Deck.id, isouter=True
-            ).where((Deck.is_public == True) | (VocabularyCard.deck_id == None))  # noqa: E712
-        else:
-            # Count from selected decks only
-            selected_deck_ids_subquery = select(UserSelectedDeck.deck_id).where(
-                UserSelectedDeck.user_id == user_id
-            )
-            new_cards_query = new_cards_query.where(
-                VocabularyCard.deck_id.in_(selected_deck_ids_subquery)
-            )
+        return {
+            "new_cards_count": counts["new_cards"],
+            "review_cards_count": counts["review_cards"] + counts["relearning_cards"],
+        }
 
-        # Count new cards
-        result = await session.exec(new_cards_query)
-        new_cards_count = result.one()
+    @staticmethod
+    async def get_availability_counts(
+        session: AsyncSession,
+        profile: Profile,
+        apply_review_scope: bool = True,
+        now: datetime | None = None,
+    ) -> dict[str, int]:
+        """
+        Count new, due review and due relearning cards in one round trip.
 
-        # Count review cards (due for review)
+        New cards honour the profile's deck selection (all public decks or the
+        selected ones) and are found with an anti-join (``NOT EXISTS``) against
+        the user's progress. Due cards are split by state with conditional
+        aggregation (``COUNT(*) FILTER (WHERE ...)``) in a single scan; with
+        ``apply_review_scope`` they are limited to the selected decks when the
+        profile's review_scope is ``selected_decks_only``.
+
+        Returns:
+            dict with new_cards, review_cards and relearning_cards
+        """
         # Note: DB uses 'timestamp without time zone', so use naive datetime
-        now = datetime.utcnow()
-        review_cards_query = select(func.count(UserCardProgress.id)).where(
-            UserCardProgress.user_id == user_id,
-            UserCardProgress.next_review_date <= now,
+        now = now or datetime.utcnow()
+        user_id = profile.id
+        selected_deck_ids = select(UserSelectedDeck.deck_id).where(
+            UserSelectedDeck.user_id == user_id
+        )
+
+        # New cards: anti-join against the user's progress rows
+        seen = (
+            select(UserCardProgress.id)
+            .where(
+                UserCardProgress.user_id == user_id,
+                UserCardProgress.card_id == VocabularyCard.id,
+            )
+            .exists()
         )
-        result = await session.exec(review_cards_query)
-        review_cards_count = result.one()
+        new_cards = select(func.count(VocabularyCard.id).label("new_cards")).where(~seen)
+        if profile.select_all_decks:
+            new_cards = new_cards.join(Deck, VocabularyCard.deck_id == Deck.id, isouter=True).where(
+                (Deck.is_public == True) | (VocabularyCard.deck_id == None)  # noqa: E712, E711
+            )
+        else:
+            new_cards = new_cards.where(VocabularyCard.deck_id.in_(selected_deck_ids))
+
+        # Due cards: one scan, split by state
+        is_relearning = UserCardProgress.card_state == CardState.RELEARNING
+        due_cards = select(
+            func.count(UserCardProgress.id).filter(~is_relearning).label("review_cards"),
+            func.count(UserCardProgress.id).filter(is_relearning).label("relearning_cards"),
+        ).where(*UserCardProgressService.due_conditions(user_id, now))
+        if (
+            apply_review_scope
+            and profile.review_scope == "selected_decks_only"
+            and not profile.select_all_decks
+        ):
+            due_cards = due_cards.join(
+                VocabularyCard, VocabularyCard.id == UserCardProgress.card_id
+            ).where(VocabularyCard.deck_id.in_(selected_deck_ids))
+
+        new_subquery = new_cards.subquery()
+        due_subquery = due_cards.subquery()
+        statement = select(
+            new_subquery.c.new_cards,
+            due_subquery.c.review_cards,
+            due_subquery.c.relearning_cards,
+        ).select_from(new_subquery.join(due_subquery, true()))
+
+        result = await session.exec(statement)
+        new_count, review_count, relearning_count = result.one()
 
         return {
-            "new_cards_count": new_cards_count,
-            "review_cards_count": review_cards_count,
+            "new_cards": int(new_count or 0),
+            "review_cards": int(review_count or 0),
+            "relearning_cards": int(relearning_count or 0),
         }
@@ -0,0 +1,109 @@
+"""
+Incremental per-user, per-day stats rollup.
+
+Writers add deltas with a single ``INSERT ... ON CONFLICT DO UPDATE`` per day, so
+concurrent answers for the same user never lose increments. Readers fetch the
+rows in a date range; see ``StatsService``.
+"""
+
+from collections.abc import Iterable
+from datetime import date, datetime
+from uuid import UUID
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.database import dialect_insert
+from app.models import ReviewLog, StudySession, UserDailyStats
+
+
+class UserDailyStatsService:
+    """Service for the user_daily_stats rollup."""
+
+    @staticmethod
+    async def record_reviews(
+        session: AsyncSession,
+        user_id: UUID,
+        review_logs: Iterable[ReviewLog],
+    ) -> None:
+        """Add reviews to the days they happened on."""
+        deltas: dict[date, dict[str, int]] = {}
+        for review_log in review_logs:
+            day = deltas.setdefault(
+                review_log.reviewed_at.date(), {"cards_studied": 0, "correct_count": 0}
+            )
+            day["cards_studied"] += 1
+            day["correct_count"] += int(review_log.is_correct)
+
+        for stat_date, values in deltas.items():
+            await UserDailyStatsService._increment(session, user_id, stat_date, values)
+
+    @staticmethod
+    async def record_session(session: AsyncSession, study_session: StudySession) -> None:
+        """Add a completed study session to the day it started on."""
+        if study_session.completed_at is None:
+            return
+
+        cards = study_session.correct_count + study_session.wrong_count
+        # Per-session approximation of review accuracy (answers aren't tagged new/review)
+        review_correct = (
+            int(study_session.review_cards_count * study_session.correct_count / cards)
+            if cards > 0
+            else 0
+        )
+        study_time = int((study_session.completed_at - study_session.started_at).total_seconds())
+
+        await UserDailyStatsService._increment(
+            session,
+            study_session.user_id,
+            study_session.started_at.date(),
+            {
+                "sessions_completed": 1,
+                "study_time_seconds": max(study_time, 0),
+                "session_cards_count": cards,
+                "new_cards_count": study_session.new_cards_count,
+                "review_cards_count": study_session.review_cards_count,
+                "review_correct_count": review_correct,
+            },
+        )
+
+    @staticmethod
+    async def get_days(
+        session: AsyncSession,
+        user_id: UUID,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> list[UserDailyStats]:
+        """Get the user's rollup rows in ``[start_date, end_date]``, oldest first."""
+        query = select(UserDailyStats).where(UserDailyStats.user_id == user_id)
+        if start_date is not None:
+            query = query.where(UserDailyStats.stat_date >= start_date)
+        if end_date is not None:
+            query = query.where(UserDailyStats.stat_date <= end_date)
+        query = query.order_by(UserDailyStats.stat_date.asc())
+
+        result = await session.exec(query)
+        return list(result.all())
+
+    @staticmethod
+    async def _increment(
+        session: AsyncSession,
+        user_id: UUID,
+        stat_date: date,
+        values: dict[str, int],
+    ) -> None:
+        insert = dialect_insert(session)
+
+        now = datetime.utcnow()
+        table = UserDailyStats.__table__
+        statement = insert(table).values(
+            user_id=user_id, stat_date=stat_date, updated_at=now, **values
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.user_id, table.c.stat_date],
+            set_={
+                **{name: table.c[name] + statement.excluded[name] for name in values},
+                "updated_at": now,
+            },
+        )
+        await session.exec(statement)
@@ -9,6 +9,10 @@ from app.models import (
     VocabularyCardCreate,
     VocabularyCardUpdate,
 )
+from app.services.card_cache import CardCache
+from app.services.catalog_cache import CatalogCache
+from app.services.distractor_index import DistractorIndex
+from app.services.new_card_frontier_service import NewCardFrontierService
 
 # relation_type -> Korean label mapping
 RELATION_TYPE_LABELS = {
@@ -19,6 +23,12 @@ RELATION_TYPE_LABELS = {
     "collocation": "연어",
 }
 
+# Fields held by the distractor index; updating any of them requires a rebuild
+DISTRACTOR_FIELDS = {"english_word", "korean_meaning", "difficulty_level", "part_of_speech"}
+
+# Fields that decide a card's place in new-card order; see NewCardFrontier
+FRONTIER_FIELDS = {"deck_id", "frequency_rank"}
+
 
 class VocabularyCardService:
     """Service for vocabulary card CRUD operations."""
@@ -28,8 +38,12 @@ class VocabularyCardService:
         """Create a new vocabulary card."""
         card = VocabularyCard(**card_data.model_dump())
         session.add(card)
+        await session.flush()
+        await NewCardFrontierService.lower_to_card(session, card)
         await session.commit()
         await session.refresh(card)
+        DistractorIndex.invalidate()
+        CatalogCache.bump()
         return card
 
     @staticmethod
@@ -70,8 +84,15 @@ class VocabularyCardService:
         card.sqlmodel_update(update_dict)
 
         session.add(card)
+        if update_dict.keys() & FRONTIER_FIELDS:
+            await NewCardFrontierService.lower_to_card(session, card)
         await session.commit()
         await session.refresh(card)
+        CardCache.invalidate(card_id)
+        if update_dict.keys() & DISTRACTOR_FIELDS:
+            DistractorIndex.invalidate()
+        if "deck_id" in update_dict:
+            CatalogCache.bump()
         return card
 
     @staticmethod
@@ -83,6 +104,9 @@ class VocabularyCardService:
 
         await session.delete(card)
         await session.commit()
+        CardCache.invalidate(card_id)
+        DistractorIndex.invalidate()
+        CatalogCache.bump()
         return True
 
     @staticmethod
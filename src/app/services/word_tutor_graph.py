@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import hashlib
 from typing import Annotated, TypedDict
 from uuid import UUID
 
 from langchain_core.messages import AIMessage, AnyMessage, HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
+from langgraph.config import get_stream_writer
 from langgraph.graph import END, START, StateGraph
 from langgraph.graph.message import add_messages
 from langgraph.types import RetryPolicy
@@ -16,8 +18,12 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.config import settings
 from app.core.exceptions import NotFoundError
-from app.models import VocabularyCard, WordTutorMessage, WordTutorThread
+from app.models import WordTutorMessage, WordTutorThread
 from app.models.enums import ChatRole
+from app.services.card_cache import CardCache
+from app.services.card_projections import CardContent
+from app.services.openai_clients import OpenAIClients
+from app.services.starter_question_cache import StarterQuestionCache
 
 
 class StarterQuestionsOutput(BaseModel):
@@ -41,31 +47,83 @@ class WordTutorState(TypedDict, total=False):
     card_id: int
     thread_id: UUID
 
-    # chat memory
+    # chat memory: recent messages within the history budget + summary of older ones
     messages: Annotated[list[AnyMessage], add_messages]
+    summary: str | None
 
     # context
-    card: VocabularyCard
+    card: CardContent
 
     # inputs/outputs
     input_message: str
     starter_questions: list[str]
+    # content hash of freshly generated starters, remembered once they're committed
+    starters_hash: str
     assistant_answer: str
     follow_up_questions: list[str]
 
 
 def _build_llm() -> ChatOpenAI:
-    # LangChain OpenAI reads OPENAI_API_KEY from env too, but we pass explicitly for clarity.
-    api_key = settings.openai_api_key or None
-    return ChatOpenAI(
-        model=settings.openai_model,
-        api_key=api_key,
-        temperature=0.3,
-        timeout=30,
-    )
+    return OpenAIClients.chat_model(model=settings.openai_model, temperature=0.3, timeout=30)
+
+
+# Per-message framing (role, separators) in chat completion prompts
+_MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count: ~4 ASCII characters per token, one per other character (Hangul).
+
+    Used for the tutor's context budgets; close enough to the OpenAI tokenizers for
+    budgeting, without loading a tokenizer.
+    """
+    ascii_chars = sum(1 for c in text if c.isascii())
+    return -(-ascii_chars // 4) + (len(text) - ascii_chars)
+
+
+def message_tokens(message: AnyMessage) -> int:
+    """Estimated prompt tokens of one chat message."""
+    return estimate_tokens(message.text) + _MESSAGE_OVERHEAD_TOKENS
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    ascii_chars = other_chars = 0
+    for i, c in enumerate(text):
+        if c.isascii():
+            ascii_chars += 1
+        else:
+            other_chars += 1
+        if -(-ascii_chars // 4) + other_chars > max_tokens:
+            return text[:i]
+    return text
 
 
-def _card_context_text(card: VocabularyCard) -> str:
+def _fit_history(messages: list[AnyMessage], max_tokens: int) -> list[AnyMessage]:
+    """The most recent messages whose estimated tokens fit in ``max_tokens``."""
+    total = 0
+    start = len(messages)
+    while start > 0:
+        total += message_tokens(messages[start - 1])
+        if total > max_tokens:
+            break
+        start -= 1
+    return messages[start:]
+
+
+def _to_chat_message(m: WordTutorMessage) -> AnyMessage:
+    if m.role == ChatRole.SYSTEM:
+        return SystemMessage(content=m.content)
+    if m.role == ChatRole.USER:
+        return HumanMessage(content=m.content)
+    return AIMessage(content=m.content)
+
+
+def _is_starter_marker(m: WordTutorMessage) -> bool:
+    # Internal marker messages aren't useful for the LLM.
+    return m.role == ChatRole.SYSTEM and m.content == "STARTER_QUESTIONS"
+
+
+def _card_context_text(card: CardContent) -> str:
     parts: list[str] = [
         f"영어 단어: {card.english_word}",
         f"한국어 뜻: {card.korean_meaning}",
@@ -85,34 +143,26 @@ async def _load_context(state: WordTutorState) -> WordTutorState:
     if not thread:
         raise NotFoundError(f"Thread {state['thread_id']} not found")
 
-    card = await session.get(VocabularyCard, thread.card_id)
+    card = await CardCache.get(session, thread.card_id)
     if not card:
         raise NotFoundError(f"Card {thread.card_id} not found")
 
-    # Load recent history
+    # Most recent messages not yet folded into thread.summary, within the history budget
+    query = select(WordTutorMessage).where(WordTutorMessage.thread_id == thread.id)
+    if thread.summarized_until is not None:
+        query = query.where(WordTutorMessage.created_at > thread.summarized_until)
     result = await session.exec(
-        select(WordTutorMessage)
-        .where(WordTutorMessage.thread_id == thread.id)
-        .order_by(WordTutorMessage.created_at.asc())
-        .limit(50)
+        query.order_by(WordTutorMessage.created_at.desc()).limit(
+            settings.tutor_history_max_messages
+        )
     )
-    rows = list(result.all())
-
-    msgs: list[AnyMessage] = []
-    for m in rows:
-        if m.role == ChatRole.SYSTEM:
-            # Internal marker messages aren't useful for the LLM.
-            if m.content == "STARTER_QUESTIONS":
-                continue
-            msgs.append(SystemMessage(content=m.content))
-        elif m.role == ChatRole.USER:
-            msgs.append(HumanMessage(content=m.content))
-        else:
-            msgs.append(AIMessage(content=m.content))
+    rows = [m for m in reversed(result.all()) if not _is_starter_marker(m)]
+    msgs = _fit_history([_to_chat_message(m) for m in rows], settings.tutor_history_max_tokens)
 
     return {
         "card": card,
         "messages": msgs,
+        "summary": thread.summary,
         "starter_questions": thread.starter_questions,
     }
 
@@ -122,35 +172,63 @@ def _should_generate_starters(state: WordTutorState) -> str:
     return "generate" if len(existing) == 0 else "skip"
 
 
-async def _generate_starters(state: WordTutorState) -> WordTutorState:
+_STARTER_INSTRUCTIONS = (
+    "너는 영어 단어 학습 앱의 AI 튜터다.\n"
+    "주어진 단어를 기준으로 사용자가 학습 직후에 궁금해할 질문을 3~7개 추천해라.\n"
+    "질문은 한국어로, 구체적이고 학습에 도움이 되게. 발음/뉘앙스/예문/구분/콜로케이션 위주.\n"
+    "반드시 JSON 스키마에 맞춰 응답."
+)
+
+
+def starter_content_hash(card: CardContent) -> str:
+    """Hash of everything the starter prompt sees; changes with the card or the prompt."""
+    h = hashlib.sha256()
+    h.update(_STARTER_INSTRUCTIONS.encode("utf-8"))
+    h.update(b"\x00")
+    h.update(_card_context_text(card).encode("utf-8"))
+    return h.hexdigest()
+
+
+async def generate_starter_questions(card: CardContent) -> list[str]:
+    """Ask the LLM for starter questions about ``card`` (no cache; raises on failure)."""
     llm = _build_llm()
     try:
         structured = llm.with_structured_output(StarterQuestionsOutput, method="json_schema")
     except Exception:
         structured = llm.with_structured_output(StarterQuestionsOutput, method="function_calling")
 
-    sys = SystemMessage(
-        content=(
-            "너는 영어 단어 학습 앱의 AI 튜터다.\n"
-            "주어진 단어를 기준으로 사용자가 학습 직후에 궁금해할 질문을 3~7개 추천해라.\n"
-            "질문은 한국어로, 구체적이고 학습에 도움이 되게. 발음/뉘앙스/예문/구분/콜로케이션 위주.\n"
-            "반드시 JSON 스키마에 맞춰 응답."
-        ),
-    )
-    user = HumanMessage(content=_card_context_text(state["card"]))
+    sys = SystemMessage(content=_STARTER_INSTRUCTIONS)
+    user = HumanMessage(content=_card_context_text(card))
+    out = await structured.ainvoke([sys, user])
+    return out.starter_questions
+
+
+async def _generate_starters(state: WordTutorState) -> WordTutorState:
+    session = state["db"]
+    card = state["card"]
+
+    # Shared per card: most tutors open without an LLM call
+    content_hash = starter_content_hash(card)
+    cached = await StarterQuestionCache.get(session, card.id, content_hash)
+    if cached is not None:
+        return {"starter_questions": cached}
 
     try:
-        out = await structured.ainvoke([sys, user])
-        starters = out.starter_questions
+        starters = await generate_starter_questions(card)
     except Exception:
-        # fallback: safe defaults
+        # fallback: safe defaults (not cached, so the next tutor tries again)
         starters = [
-            f"'{state['card'].english_word}'는 어떤 상황에서 자주 쓰이나요?",
-            f"'{state['card'].english_word}'를 포함한 자연스러운 예문을 2개만 만들어줘.",
-            f"'{state['card'].english_word}'의 비슷한 단어(동의어/유의어)와 차이를 알려줘.",
+            f"'{card.english_word}'는 어떤 상황에서 자주 쓰이나요?",
+            f"'{card.english_word}'를 포함한 자연스러운 예문을 2개만 만들어줘.",
+            f"'{card.english_word}'의 비슷한 단어(동의어/유의어)와 차이를 알려줘.",
         ]
+        return {"starter_questions": starters}
 
-    return {"starter_questions": starters}
+    # Committed with the thread in _save_starters
+    await StarterQuestionCache.put(
+        session, card.id, content_hash, starters, model=settings.openai_model
+    )
+    return {"starter_questions": starters, "starters_hash": content_hash}
 
 
 async def _save_starters(state: WordTutorState) -> WordTutorState:
@@ -173,9 +251,36 @@ async def _save_starters(state: WordTutorState) -> WordTutorState:
     )
 
     await session.commit()
+    if content_hash := state.get("starters_hash"):
+        StarterQuestionCache.remember(state["card"].id, content_hash, thread.starter_questions)
     return {}
 
 
+_ANSWER_INSTRUCTIONS = (
+    "너는 영어 단어 학습 앱의 AI 튜터다.\n"
+    "주어진 단어 컨텍스트를 바탕으로 사용자의 질문에 한국어로 답변해라.\n"
+    "- 짧고 정확하게\n"
+    "- 필요하면 예문 1~2개(영어+한국어)\n"
+    "- 혼동되는 단어/표현이 있으면 비교\n"
+)
+
+_FALLBACK_ANSWER = "지금은 답변을 생성하는 데 실패했어요. 질문을 조금만 바꿔서 다시 보내줘."
+
+# Separates the streamed answer from the follow-up questions in plain-text replies
+FOLLOW_UP_MARKER = "[[FOLLOW_UP]]"
+
+
+def _answer_messages(state: WordTutorState, instructions: str) -> list[AnyMessage]:
+    sys = SystemMessage(content=instructions)
+    context = HumanMessage(content=f"[단어 컨텍스트]\n{_card_context_text(state['card'])}")
+    user_q = HumanMessage(content=state["input_message"])
+
+    # History is already bounded by _load_context; older turns come in as the summary
+    summary = state.get("summary")
+    memory = [SystemMessage(content=f"[이전 대화 요약]\n{summary}")] if summary else []
+    return [sys, context, *memory, *(state.get("messages") or []), user_q]
+
+
 async def _generate_answer(state: WordTutorState) -> WordTutorState:
     llm = _build_llm()
     try:
@@ -183,36 +288,94 @@ async def _generate_answer(state: WordTutorState) -> WordTutorState:
     except Exception:
         structured = llm.with_structured_output(TutorAnswerOutput, method="function_calling")
 
-    sys = SystemMessage(
-        content=(
-            "너는 영어 단어 학습 앱의 AI 튜터다.\n"
-            "주어진 단어 컨텍스트를 바탕으로 사용자의 질문에 한국어로 답변해라.\n"
-            "- 짧고 정확하게\n"
-            "- 필요하면 예문 1~2개(영어+한국어)\n"
-            "- 혼동되는 단어/표현이 있으면 비교\n"
-            "그리고 follow_up_questions(2~5개)도 함께 추천해라.\n"
-            "반드시 JSON 스키마에 맞춰 응답."
-        ),
+    instructions = (
+        _ANSWER_INSTRUCTIONS + "그리고 follow_up_questions(2~5개)도 함께 추천해라.\n"
+        "반드시 JSON 스키마에 맞춰 응답."
     )
 
-    context = HumanMessage(content=f"[단어 컨텍스트]\n{_card_context_text(state['card'])}")
-    user_q = HumanMessage(content=state["input_message"])
-
-    # Keep a small amount of prior turns for coherence
-    history = state.get("messages") or []
-    history_tail = history[-10:]
-
     try:
-        out = await structured.ainvoke([sys, context, *history_tail, user_q])
+        out = await structured.ainvoke(_answer_messages(state, instructions))
         answer = out.answer
         followups = out.follow_up_questions
     except Exception:
-        answer = "지금은 답변을 생성하는 데 실패했어요. 질문을 조금만 바꿔서 다시 보내줘."
+        answer = _FALLBACK_ANSWER
         followups = []
 
     return {"assistant_answer": answer, "follow_up_questions": followups}
 
 
+class _AnswerSplitter:
+    """Passes streamed text through until ``FOLLOW_UP_MARKER``, which may span chunks."""
+
+    def __init__(self) -> None:
+        self._pending = ""
+        self._done = False
+
+    def feed(self, text: str) -> str:
+        if self._done:
+            return ""
+        pending = self._pending + text
+        index = pending.find(FOLLOW_UP_MARKER)
+        if index >= 0:
+            self._done = True
+            self._pending = ""
+            return pending[:index]
+
+        # Hold back a suffix that could be the start of the marker
+        keep = next(
+            (
+                n
+                for n in range(len(FOLLOW_UP_MARKER) - 1, 0, -1)
+                if pending.endswith(FOLLOW_UP_MARKER[:n])
+            ),
+            0,
+        )
+        self._pending = pending[len(pending) - keep :]
+        return pending[: len(pending) - keep]
+
+    def flush(self) -> str:
+        rest, self._pending = ("" if self._done else self._pending), ""
+        return rest
+
+
+def _split_follow_ups(text: str) -> tuple[str, list[str]]:
+    """Split a plain-text reply into the answer and its follow-up questions."""
+    answer, _, tail = text.partition(FOLLOW_UP_MARKER)
+    questions = [line.strip().lstrip("-*•0123456789.) ").strip() for line in tail.splitlines()]
+    return answer.strip(), [q for q in questions if q]
+
+
+async def _stream_answer(state: WordTutorState) -> WordTutorState:
+    """Like ``_generate_answer`` in plain text, writing answer tokens to the custom stream."""
+    llm = _build_llm()
+    write = get_stream_writer()
+    instructions = (
+        _ANSWER_INSTRUCTIONS + f"답변을 마친 뒤 새 줄에 {FOLLOW_UP_MARKER} 를 쓰고, "
+        "그 아래에 후속 추천 질문 2~5개를 한 줄에 하나씩 써라."
+    )
+
+    splitter = _AnswerSplitter()
+    parts: list[str] = []
+    streamed = False
+    try:
+        async for chunk in llm.astream(_answer_messages(state, instructions)):
+            parts.append(chunk.text)
+            if visible := splitter.feed(chunk.text):
+                write({"token": visible})
+                streamed = True
+        if visible := splitter.flush():
+            write({"token": visible})
+    except Exception:
+        # Tokens already sent can't be taken back; fail the turn instead of saving half of it
+        if streamed:
+            raise
+        write({"token": _FALLBACK_ANSWER})
+        return {"assistant_answer": _FALLBACK_ANSWER, "follow_up_questions": []}
+
+    answer, followups = _split_follow_ups("".join(parts))
+    return {"assistant_answer": answer, "follow_up_questions": followups}
+
+
 async def _save_turn(state: WordTutorState) -> WordTutorState:
     session = state["db"]
     thread = await session.get(WordTutorThread, state["thread_id"])
@@ -240,6 +403,89 @@ async def _save_turn(state: WordTutorState) -> WordTutorState:
     return {}
 
 
+_SUMMARY_INSTRUCTIONS = (
+    "너는 영어 단어 학습 앱의 AI 튜터다.\n"
+    "아래의 [이전 요약]과 그 뒤에 이어진 [대화]를 합쳐 하나의 요약으로 다시 써라.\n"
+    "- 학습자가 궁금해한 점, 이미 설명한 내용, 학습자가 헷갈려한 부분 위주로\n"
+    "- 이후 대화를 이어가는 데 필요한 내용만, 한국어로 짧게\n"
+)
+
+
+async def summarize_conversation(previous_summary: str | None, messages: list[AnyMessage]) -> str:
+    """Fold ``messages`` into ``previous_summary`` (raises on failure)."""
+    speakers = {"human": "학습자", "ai": "튜터"}
+    transcript = "\n".join(f"{speakers.get(m.type, '시스템')}: {m.text}" for m in messages)
+    prompt = f"[이전 요약]\n{previous_summary or '(없음)'}\n\n[대화]\n{transcript}"
+
+    out = await _build_llm().ainvoke(
+        [SystemMessage(content=_SUMMARY_INSTRUCTIONS), HumanMessage(content=prompt)]
+    )
+    # Hard cap regardless of how long the model answered, so the prompt stays bounded
+    return _truncate_to_tokens(out.text.strip(), settings.tutor_summary_max_tokens)
+
+
+def _summary_cut(rows: list[WordTutorMessage]) -> int:
+    """Number of oldest ``rows`` to fold into the summary (0 while they fit the budget).
+
+    Once over budget, folds until the rest takes half of it, so the summary is
+    refreshed every few turns rather than on every turn.
+    """
+    max_tokens = settings.tutor_history_max_tokens
+    max_messages = settings.tutor_history_max_messages
+    tokens = [message_tokens(_to_chat_message(m)) for m in rows]
+    if sum(tokens) <= max_tokens and len(rows) <= max_messages:
+        return 0
+
+    kept = kept_tokens = 0
+    for t in reversed(tokens):
+        if kept_tokens + t > max_tokens // 2 or kept + 1 > max_messages // 2:
+            break
+        kept += 1
+        kept_tokens += t
+
+    # summarized_until is a timestamp: don't split messages created at the same instant
+    cut = len(rows) - kept
+    while cut < len(rows) and rows[cut].created_at == rows[cut - 1].created_at:
+        cut += 1
+    return cut
+
+
+async def refresh_summary(session: AsyncSession, thread_id: UUID) -> bool:
+    """Fold the oldest unsummarized messages into the thread summary once over budget.
+
+    Not a graph node: ``WordTutorService`` runs it after the reply was sent, on its
+    own session. Returns whether the summary changed.
+    """
+    thread = await session.get(WordTutorThread, thread_id)
+    if not thread:
+        return False
+
+    # Stays small: everything older than the last summary is excluded
+    query = select(WordTutorMessage).where(WordTutorMessage.thread_id == thread.id)
+    if thread.summarized_until is not None:
+        query = query.where(WordTutorMessage.created_at > thread.summarized_until)
+    result = await session.exec(query.order_by(WordTutorMessage.created_at.asc()))
+    rows = [m for m in result.all() if not _is_starter_marker(m)]
+
+    cut = _summary_cut(rows)
+    if cut == 0:
+        return False
+
+    try:
+        summary = await summarize_conversation(
+            thread.summary, [_to_chat_message(m) for m in rows[:cut]]
+        )
+    except Exception:
+        # The turn is already saved; the next turn tries again with the same messages
+        return False
+
+    thread.summary = summary
+    thread.summarized_until = rows[cut - 1].created_at
+    session.add(thread)
+    await session.commit()
+    return True
+
+
 _LLM_RETRY_POLICY = RetryPolicy(
     max_attempts=3,
     initial_interval=0.5,
@@ -279,5 +525,24 @@ def build_message_graph():
     return g.compile()
 
 
+def build_stream_message_graph():
+    """Graph for /tutor/message/stream.
+
+    Answer tokens are emitted on the ``custom`` stream mode. No retry policy on the
+    answer node: a retry after tokens were sent would repeat them to the client.
+    """
+    g = StateGraph(WordTutorState)
+    g.add_node("load_context", _load_context)
+    g.add_node("stream_answer", _stream_answer)
+    g.add_node("save_turn", _save_turn)
+
+    g.add_edge(START, "load_context")
+    g.add_edge("load_context", "stream_answer")
+    g.add_edge("stream_answer", "save_turn")
+    g.add_edge("save_turn", END)
+    return g.compile()
+
+
 START_GRAPH = build_start_graph()
 MESSAGE_GRAPH = build_message_graph()
+STREAM_MESSAGE_GRAPH = build_stream_message_graph()
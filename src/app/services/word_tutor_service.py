@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
 from uuid import UUID
 
 from sqlmodel import select
@@ -9,6 +11,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.config import settings
 from app.core.exceptions import ExternalServiceError, NotFoundError, ValidationError
+from app.core.logging import logger
 from app.models import StudySession, WordTutorMessage, WordTutorThread
 from app.models.schemas.word_tutor import (
     TutorHistoryResponse,
@@ -16,13 +19,22 @@ from app.models.schemas.word_tutor import (
     TutorMessageRequest,
     TutorMessageResponse,
     TutorStartResponse,
+    TutorStreamToken,
+)
+from app.services.word_tutor_graph import (
+    MESSAGE_GRAPH,
+    START_GRAPH,
+    STREAM_MESSAGE_GRAPH,
+    refresh_summary,
 )
-from app.services.word_tutor_graph import MESSAGE_GRAPH, START_GRAPH
 
 
 class WordTutorService:
     """Word tutor chat operations."""
 
+    # Background rolling-summary refreshes, at most one per thread
+    _summary_refreshes: dict[UUID, asyncio.Task[None]] = {}
+
     @staticmethod
     async def _require_openai() -> None:
         if not settings.openai_api_key:
@@ -154,12 +166,97 @@ class WordTutorService:
             }
         )
 
+        WordTutorService._schedule_summary_refresh(session, thread.id)
         return TutorMessageResponse(
             thread_id=thread.id,
             assistant_message=out.get("assistant_answer") or "",
             follow_up_questions=out.get("follow_up_questions") or [],
         )
 
+    @staticmethod
+    async def stream_message(
+        session: AsyncSession,
+        *,
+        user_id: UUID,
+        session_id: UUID,
+        card_id: int,
+        request: TutorMessageRequest,
+    ) -> AsyncIterator[TutorStreamToken | TutorMessageResponse]:
+        """Like ``send_message``, but yields the answer as the LLM produces it.
+
+        Validation errors are raised here, before anything is streamed. The returned
+        iterator yields ``TutorStreamToken``s, then the saved turn as a
+        ``TutorMessageResponse`` with the follow-up questions.
+        """
+        await WordTutorService._require_openai()
+        await WordTutorService._validate_session_and_card(
+            session, user_id=user_id, session_id=session_id, card_id=card_id
+        )
+        thread = await WordTutorService._get_or_create_thread(
+            session, user_id=user_id, session_id=session_id, card_id=card_id
+        )
+
+        async def events() -> AsyncIterator[TutorStreamToken | TutorMessageResponse]:
+            out: dict = {}
+            async for mode, chunk in STREAM_MESSAGE_GRAPH.astream(
+                {
+                    "db": session,
+                    "thread_id": thread.id,
+                    "messages": [],
+                    "input_message": request.message,
+                },
+                stream_mode=["custom", "values"],
+            ):
+                if mode == "custom":
+                    yield TutorStreamToken(text=chunk["token"])
+                else:
+                    out = chunk
+
+            # Before the last yield: the client may disconnect once it has the reply
+            WordTutorService._schedule_summary_refresh(session, thread.id)
+            yield TutorMessageResponse(
+                thread_id=thread.id,
+                assistant_message=out.get("assistant_answer") or "",
+                follow_up_questions=out.get("follow_up_questions") or [],
+            )
+
+        return events()
+
+    @staticmethod
+    def _schedule_summary_refresh(session: AsyncSession, thread_id: UUID) -> None:
+        """Refresh the thread's rolling summary after the reply, off the request path.
+
+        Runs as a detached task on its own session (same engine), since the
+        request's session closes with the response. Skipped while a refresh for
+        the thread is still running; the next turn checks again.
+        """
+        running = WordTutorService._summary_refreshes.get(thread_id)
+        if running is not None and not running.done():
+            return
+
+        bind = session.bind
+
+        async def run() -> None:
+            try:
+                async with AsyncSession(bind, expire_on_commit=False) as refresh_session:
+                    await refresh_summary(refresh_session, thread_id)
+            except Exception as e:
+                logger.warning(
+                    "Tutor summary refresh failed", thread_id=str(thread_id), error=str(e)
+                )
+            finally:
+                if WordTutorService._summary_refreshes.get(thread_id) is asyncio.current_task():
+                    del WordTutorService._summary_refreshes[thread_id]
+
+        WordTutorService._summary_refreshes[thread_id] = asyncio.create_task(run())
+
+    @staticmethod
+    async def wait_for_summary_refreshes() -> None:
+        """Wait for running background summary refreshes (tests and shutdown)."""
+        tasks = list(WordTutorService._summary_refreshes.values())
+        if tasks:
+            await asyncio.gather(*tasks)
+
     @staticmethod
     async def history(
         session: AsyncSession,
@@ -0,0 +1,125 @@
+"""Batch-generate pronunciation audio for vocabulary cards and fill in audio_url.
+
+Audio is content-addressed by the TTS cache key, so words shared by several
+cards (or already served by /cards/{id}/audio) are only synthesized once. Files
+land in the local AudioStore (TTS_AUDIO_DIR) and are uploaded to Supabase
+Storage under the same key; audio_url is set to the public object URL.
+
+Run with:
+  cd src && uv run python scripts/generate_card_audio.py
+
+Requires env:
+  - DATABASE_URL
+  - OPENAI_API_KEY
+  - SUPABASE_URL, SUPABASE_SECRET_KEY (unless --local-only)
+  - SUPABASE_AUDIO_BUCKET (optional, default: card-audio)
+  - OPENAI_TTS_MODEL / OPENAI_TTS_DEFAULT_VOICE (optional)
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from sqlmodel import select
+
+from app.config import settings
+from app.database import async_session_maker
+from app.models.tables.vocabulary_card import VocabularyCard
+from app.services.audio_store import AudioStore
+from app.services.supabase_storage_service import SupabaseStorageService
+from app.services.tts_service import AudioFormat, TTSService
+
+MIME_TYPES = {"mp3": "audio/mpeg", "ogg": "audio/ogg"}
+
+
+async def _store_audio(text: str, audio_format: AudioFormat) -> tuple[str, bytes]:
+    """Return (key, audio), synthesizing only when the store doesn't have it yet."""
+    key = TTSService.audio_key(text=text, audio_format=audio_format)
+    path = await AudioStore.get(key, audio_format)
+    if path is not None:
+        return key, await asyncio.to_thread(path.read_bytes)
+
+    audio = await TTSService.synthesize(text=text, audio_format=audio_format)
+    await AudioStore.put(key, audio_format, audio)
+    return key, audio
+
+
+async def _process_card(card_id: int, *, audio_format: AudioFormat, local_only: bool) -> bool:
+    async with async_session_maker() as session:
+        card = await session.get(VocabularyCard, card_id)
+        if not card:
+            return False
+
+        try:
+            key, audio = await _store_audio(card.english_word, audio_format)
+            if local_only:
+                audio_url = f"{settings.api_v1_prefix}/cards/{card.id}/audio?format={audio_format}"
+            else:
+                audio_url = await asyncio.to_thread(
+                    SupabaseStorageService.upload_bytes,
+                    bucket=settings.supabase_audio_bucket,
+                    path=f"tts/{key[:2]}/{key}.{audio_format}",
+                    data=audio,
+                    mime_type=MIME_TYPES[audio_format],
+                )
+        except Exception as e:  # noqa: BLE001
+            print(f"FAIL card_id={card_id} error={str(e)[:200]}")
+            return False
+
+        card.audio_url = audio_url
+        await session.commit()
+        return True
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate TTS audio for vocabulary cards")
+    parser.add_argument("--limit", type=int, default=0, help="Max cards to process (0 = no limit)")
+    parser.add_argument("--force", action="store_true", help="Regenerate even if audio_url exists")
+    parser.add_argument("--format", choices=["mp3", "ogg"], default="mp3", dest="audio_format")
+    parser.add_argument("--concurrency", type=int, default=4, help="Cards processed in parallel")
+    parser.add_argument(
+        "--local-only",
+        action="store_true",
+        help="Skip the Supabase upload; audio_url points at the API audio endpoint",
+    )
+    args = parser.parse_args()
+
+    async with async_session_maker() as session:
+        stmt = select(VocabularyCard.id)
+        if not args.force:
+            stmt = stmt.where(VocabularyCard.audio_url == None)  # noqa: E711
+        stmt = stmt.order_by(VocabularyCard.id)
+        if args.limit and args.limit > 0:
+            stmt = stmt.limit(args.limit)
+        result = await session.exec(stmt)
+        card_ids = list(result.all())
+
+    if not card_ids:
+        print("No cards to process")
+        return
+
+    print(
+        f"Processing {len(card_ids)} cards (dir={settings.tts_audio_dir}, "
+        f"bucket={'-' if args.local_only else settings.supabase_audio_bucket}, "
+        f"model={settings.openai_tts_model}, voice={settings.openai_tts_default_voice})"
+    )
+
+    semaphore = asyncio.Semaphore(max(1, args.concurrency))
+
+    async def run(card_id: int) -> bool:
+        async with semaphore:
+            success = await _process_card(
+                card_id, audio_format=args.audio_format, local_only=args.local_only
+            )
+        if success:
+            print(f"OK card_id={card_id}")
+        return success
+
+    results = await asyncio.gather(*(run(card_id) for card_id in card_ids))
+    ok = sum(results)
+    print(f"Done. ok={ok} fail={len(results) - ok}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,91 @@
+"""Precompute word tutor starter questions for every vocabulary card.
+
+Starter questions are shared per card (card_starter_questions) and keyed by a
+hash of the prompt and card content, so opening a tutor for a precomputed card
+needs no LLM call. Cards whose stored hash still matches are skipped; edited
+cards (or all cards after a prompt change) are regenerated.
+
+Run with:
+  cd src && uv run python scripts/generate_starter_questions.py
+
+Requires env:
+  - DATABASE_URL
+  - OPENAI_API_KEY
+  - OPENAI_MODEL (optional)
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from sqlmodel import select
+
+from app.config import settings
+from app.database import async_session_maker
+from app.models.tables.vocabulary_card import VocabularyCard
+from app.services.card_projections import CACHED_CARD_COLUMNS, CachedCard
+from app.services.starter_question_cache import StarterQuestionCache
+from app.services.word_tutor_graph import generate_starter_questions, starter_content_hash
+
+
+async def _process_card(card: CachedCard, content_hash: str) -> bool:
+    try:
+        questions = await generate_starter_questions(card)
+    except Exception as e:  # noqa: BLE001
+        print(f"FAIL card_id={card.id} error={str(e)[:200]}")
+        return False
+
+    async with async_session_maker() as session:
+        await StarterQuestionCache.put(
+            session, card.id, content_hash, questions, model=settings.openai_model
+        )
+        await session.commit()
+    return True
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Precompute tutor starter questions per card")
+    parser.add_argument("--limit", type=int, default=0, help="Max cards to generate (0 = no limit)")
+    parser.add_argument("--force", action="store_true", help="Regenerate even if up to date")
+    parser.add_argument("--concurrency", type=int, default=4, help="LLM calls in parallel")
+    args = parser.parse_args()
+
+    async with async_session_maker() as session:
+        stored = {} if args.force else await StarterQuestionCache.get_hashes(session)
+        result = await session.exec(select(*CACHED_CARD_COLUMNS).order_by(VocabularyCard.id))
+        cards = [CachedCard(**row._asdict()) for row in result.all()]
+
+    pending = [
+        (card, content_hash)
+        for card in cards
+        if stored.get(card.id) != (content_hash := starter_content_hash(card))
+    ]
+    if args.limit and args.limit > 0:
+        pending = pending[: args.limit]
+
+    if not pending:
+        print(f"All {len(cards)} cards are up to date")
+        return
+
+    print(
+        f"Generating starter questions for {len(pending)} of {len(cards)} cards "
+        f"(model={settings.openai_model})"
+    )
+
+    semaphore = asyncio.Semaphore(max(1, args.concurrency))
+
+    async def run(card: CachedCard, content_hash: str) -> bool:
+        async with semaphore:
+            success = await _process_card(card, content_hash)
+        if success:
+            print(f"OK card_id={card.id}")
+        return success
+
+    results = await asyncio.gather(*(run(card, h) for card, h in pending))
+    ok = sum(results)
+    print(f"Done. ok={ok} fail={len(results) - ok}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -150,6 +150,7 @@ async def map_frequency_ranks(session, mapper: FrequencyMapper, dry_run: bool =
     from sqlmodel import select
 
     from app.models.vocabulary_card import VocabularyCard
+    from app.services.new_card_frontier_service import NewCardFrontierService
 
     print("\nFetching vocabulary cards from database...")
     result = await session.execute(select(VocabularyCard))
@@ -216,6 +217,8 @@ async def map_frequency_ranks(session, mapper: FrequencyMapper, dry_run: bool =
 
     # Commit changes if not dry run
     if not dry_run:
+        # Ranks changed outside the card service: rebuild new-card frontiers
+        await NewCardFrontierService.reset(session)
         await session.commit()
         print(f"\n✓ Updated {stats['updated']} cards in database")
     else:
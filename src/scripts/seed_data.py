@@ -22,6 +22,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from app.database import async_session_maker
 from app.models.tables.deck import Deck
 from app.models.tables.vocabulary_card import VocabularyCard
+from app.services.new_card_frontier_service import NewCardFrontierService
 
 # Path to collected vocabulary data
 DATA_DIR = Path(__file__).parent.parent / "data"
@@ -391,6 +392,10 @@ async def seed_vocabulary_from_json(session: AsyncSession, deck_map: dict[str, i
         await session.commit()
         print(f"  [PROGRESS] {min(i + batch_size, total)}/{total} cards added...")
 
+    # Cards were inserted outside the card service: rebuild new-card frontiers
+    await NewCardFrontierService.reset(session)
+    await session.commit()
+
     print(f"✅ {added} vocabulary cards seeded successfully\n")
 
 
@@ -9,6 +9,8 @@ This module provides:
 - API test fixtures with FastAPI TestClient
 """
 
+import asyncio
+import json
 import os
 import random
 import sys
@@ -108,6 +110,71 @@ async def db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
         await session.commit()
 
 
+# =============================================================================
+# In-Process Cache Fixtures
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def reset_distractor_index():
+    """Drop the in-memory distractor index so each test sees its own cards."""
+    from app.services.distractor_index import DistractorIndex
+
+    DistractorIndex.clear()
+    yield
+    DistractorIndex.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_catalog_cache():
+    """Drop the in-memory catalog snapshot so each test sees its own decks."""
+    from app.services.catalog_cache import CatalogCache
+
+    CatalogCache.clear()
+    yield
+    CatalogCache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_card_cache():
+    """Drop cached card content so each test reads its own cards."""
+    from app.services.card_cache import CardCache
+
+    CardCache.clear()
+    yield
+    CardCache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_starter_question_cache():
+    """Drop in-memory starter questions so each test reads its own table rows."""
+    from app.services.starter_question_cache import StarterQuestionCache
+
+    StarterQuestionCache.clear()
+    yield
+    StarterQuestionCache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_openai_clients():
+    """Drop pooled OpenAI clients; their connections belong to the test's event loop."""
+    from app.services.openai_clients import OpenAIClients
+
+    OpenAIClients.reset()
+    yield
+    OpenAIClients.reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_tutor_summary_refreshes():
+    """Forget background summary tasks, which belong to the previous test's event loop."""
+    from app.services.word_tutor_service import WordTutorService
+
+    WordTutorService._summary_refreshes.clear()
+    yield
+    WordTutorService._summary_refreshes.clear()
+
+
 # =============================================================================
 # Time Fixtures
 # =============================================================================
@@ -195,6 +262,115 @@ def mock_openai_client(request, mocker):
     yield mock_client
 
 
+class FakeOpenAIServer:
+    """Minimal keep-alive HTTP/1.1 server for the OpenAI speech and chat endpoints.
+
+    Chat requests with ``"stream": true`` get ``chat_reply`` as one SSE chunk per
+    ``chat_chunk_size`` characters; others get it as one completion. ``chat_reply``
+    may also be a callable taking the request body.
+    """
+
+    def __init__(self):
+        self.connections = 0
+        self.requests = 0
+        self.chat_reply = "ok"
+        self.chat_chunk_size = 4
+        self.chat_bodies: list[dict] = []
+        self._server = None
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/v1"
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    def _chat_response(self, request: dict) -> tuple[bytes, str]:
+        self.chat_bodies.append(request)
+        reply = self.chat_reply(request) if callable(self.chat_reply) else self.chat_reply
+        base = {"id": "chatcmpl-test", "created": 0, "model": request.get("model", "gpt-4o-mini")}
+        if not request.get("stream"):
+            completion = {
+                **base,
+                "object": "chat.completion",
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": reply},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+            }
+            return json.dumps(completion).encode(), "application/json"
+
+        size = self.chat_chunk_size
+        pieces = [reply[i : i + size] for i in range(0, len(reply), size)]
+        deltas = [{"role": "assistant", "content": ""}] + [{"content": p} for p in pieces] + [{}]
+        events = []
+        for i, delta in enumerate(deltas):
+            chunk = {
+                **base,
+                "object": "chat.completion.chunk",
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": delta,
+                        "finish_reason": "stop" if i == len(deltas) - 1 else None,
+                    }
+                ],
+            }
+            events.append(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n")
+        events.append("data: [DONE]\n\n")
+        return "".join(events).encode(), "text/event-stream"
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                request_line, *header_lines = head.decode().split("\r\n")
+                headers = {
+                    k.lower(): v
+                    for k, v in (line.split(": ", 1) for line in header_lines if ": " in line)
+                }
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                self.requests += 1
+
+                if "/audio/speech" in request_line:
+                    payload, content_type = b"fake-mp3-audio", "audio/mpeg"
+                else:
+                    payload, content_type = self._chat_response(json.loads(body or b"{}"))
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\n"
+                    + f"Content-Type: {content_type}\r\n".encode()
+                    + f"Content-Length: {len(payload)}\r\n\r\n".encode()
+                    + payload
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.fixture
+async def fake_openai(monkeypatch):
+    """Point the OpenAI settings at a local FakeOpenAIServer."""
+    from app.config import settings
+    from app.services.openai_clients import OpenAIClients
+
+    server = FakeOpenAIServer()
+    base_url = await server.start()
+    monkeypatch.setattr(settings, "openai_api_key", "test-key")
+    monkeypatch.setattr(settings, "openai_base_url", base_url)
+    yield server
+    await OpenAIClients.aclose()
+    await server.stop()
+
+
 @pytest.fixture
 def mock_gemini_client(request, mocker):
     """
@@ -327,6 +503,24 @@ def wrong_answer_factory(db_session):
     return WrongAnswerFactory
 
 
+@pytest.fixture
+def review_log_factory(db_session):
+    """Factory fixture for creating ReviewLog instances."""
+    from tests.factories.review_log_factory import ReviewLogFactory
+
+    ReviewLogFactory._meta.sqlalchemy_session = db_session
+    return ReviewLogFactory
+
+
+@pytest.fixture
+def user_daily_stats_factory(db_session):
+    """Factory fixture for creating UserDailyStats instances."""
+    from tests.factories.user_daily_stats_factory import UserDailyStatsFactory
+
+    UserDailyStatsFactory._meta.sqlalchemy_session = db_session
+    return UserDailyStatsFactory
+
+
 @pytest.fixture
 def word_tutor_thread_factory(db_session):
     """Factory fixture for creating WordTutorThread instances."""
@@ -417,3 +611,33 @@ def unauthenticated_client(db_session):
         yield client
 
     app.dependency_overrides.clear()
+
+
+# =============================================================================
+# Benchmark Reporting
+# =============================================================================
+
+_benchmark_results = pytest.StashKey[list[str]]()
+
+
+@pytest.fixture
+def benchmark_report(request):
+    """Record a line for the "benchmarks" section of the terminal summary.
+
+    Opt-in benchmarks (``RUN_BENCHMARKS=1``) report through this instead of
+    ``print``, so their numbers show up without ``-s``.
+    """
+    results = request.config.stash.setdefault(_benchmark_results, [])
+
+    def report(line: str) -> None:
+        results.append(f"{request.node.name}: {line}")
+
+    return report
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    results = config.stash.get(_benchmark_results, [])
+    if results:
+        terminalreporter.section("benchmarks")
+        for line in results:
+            terminalreporter.write_line(line)
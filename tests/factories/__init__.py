@@ -2,8 +2,10 @@
 
 from tests.factories.deck_factory import DeckFactory
 from tests.factories.profile_factory import ProfileFactory
+from tests.factories.review_log_factory import ReviewLogFactory
 from tests.factories.study_session_factory import StudySessionFactory
 from tests.factories.user_card_progress_factory import UserCardProgressFactory
+from tests.factories.user_daily_stats_factory import UserDailyStatsFactory
 from tests.factories.vocabulary_card_factory import VocabularyCardFactory
 from tests.factories.word_tutor_factory import WordTutorMessageFactory, WordTutorThreadFactory
 from tests.factories.wrong_answer_factory import WrongAnswerFactory
@@ -15,6 +17,8 @@ __all__ = [
     "DeckFactory",
     "StudySessionFactory",
     "WrongAnswerFactory",
+    "ReviewLogFactory",
+    "UserDailyStatsFactory",
     "WordTutorThreadFactory",
     "WordTutorMessageFactory",
 ]
@@ -0,0 +1,38 @@
+"""Factory for ReviewLog model."""
+
+from datetime import datetime
+from uuid import uuid4
+
+import factory
+
+from app.models import CardState, ReviewLog
+from tests.factories.base import AsyncSQLModelFactory
+
+
+class ReviewLogFactory(AsyncSQLModelFactory):
+    """Factory for creating ReviewLog instances."""
+
+    class Meta:
+        model = ReviewLog
+
+    id = factory.Sequence(lambda n: n + 1)
+
+    user_id = factory.LazyFunction(uuid4)
+    card_id = factory.Sequence(lambda n: n + 1)
+
+    reviewed_at = factory.LazyFunction(datetime.utcnow)
+    is_correct = True
+
+    # FSRS state after the review
+    interval = 1
+    stability = 1.0
+    difficulty = 5.0
+    card_state = CardState.LEARNING
+
+    class Params:
+        """Factory parameters for common scenarios."""
+
+        wrong = factory.Trait(
+            is_correct=False,
+            interval=0,
+        )
@@ -0,0 +1,31 @@
+"""Factory for UserDailyStats model."""
+
+from datetime import datetime
+from uuid import uuid4
+
+import factory
+
+from app.models import UserDailyStats
+from tests.factories.base import AsyncSQLModelFactory
+
+
+class UserDailyStatsFactory(AsyncSQLModelFactory):
+    """Factory for creating UserDailyStats instances."""
+
+    class Meta:
+        model = UserDailyStats
+
+    user_id = factory.LazyFunction(uuid4)
+    stat_date = factory.LazyFunction(lambda: datetime.utcnow().date())
+
+    # Reviews
+    cards_studied = 0
+    correct_count = 0
+
+    # Completed study sessions
+    sessions_completed = 0
+    study_time_seconds = 0
+    session_cards_count = 0
+    new_cards_count = 0
+    review_cards_count = 0
+    review_correct_count = 0
@@ -258,6 +258,112 @@ class TestGetRelatedWords:
         assert response.status_code == 404
 
 
+class TestGetCardAudio:
+    """Tests for GET /cards/{card_id}/audio endpoint."""
+
+    def test_get_card_audio_serves_stored_file(self, api_client, mocker, tmp_path):
+        """Test the stored audio file is returned as-is."""
+        audio_path = tmp_path / "abc.mp3"
+        audio_path.write_bytes(b"ID3-audio")
+        mocker.patch(
+            "app.api.cards.VocabularyCardService.get_card",
+            new_callable=AsyncMock,
+            return_value=make_card(id=7, english_word="contract"),
+        )
+        get_audio_file = mocker.patch(
+            "app.api.cards.TTSService.get_audio_file",
+            new_callable=AsyncMock,
+            return_value=audio_path,
+        )
+
+        response = api_client.get("/api/v1/cards/7/audio")
+
+        assert response.status_code == 200
+        assert response.content == b"ID3-audio"
+        assert response.headers["content-type"] == "audio/mpeg"
+        assert response.headers["content-disposition"] == 'inline; filename="card-7.mp3"'
+        assert get_audio_file.await_args.kwargs["text"] == "contract"
+
+    def test_get_card_audio_ogg(self, api_client, mocker, tmp_path):
+        """Test the ogg format is served with its media type."""
+        audio_path = tmp_path / "abc.ogg"
+        audio_path.write_bytes(b"OggS")
+        mocker.patch(
+            "app.api.cards.VocabularyCardService.get_card",
+            new_callable=AsyncMock,
+            return_value=make_card(),
+        )
+        mocker.patch(
+            "app.api.cards.TTSService.get_audio_file",
+            new_callable=AsyncMock,
+            return_value=audio_path,
+        )
+
+        response = api_client.get("/api/v1/cards/1/audio?format=ogg")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "audio/ogg"
+
+    def test_get_card_audio_stream(self, api_client, mocker):
+        """Test stream=true forwards chunks without a Content-Length."""
+
+        async def chunks():
+            yield b"ID3-"
+            yield b"audio"
+
+        mocker.patch(
+            "app.api.cards.VocabularyCardService.get_card",
+            new_callable=AsyncMock,
+            return_value=make_card(id=7, english_word="contract"),
+        )
+        stream_audio = mocker.patch(
+            "app.api.cards.TTSService.stream_audio",
+            new_callable=AsyncMock,
+            return_value=chunks(),
+        )
+
+        response = api_client.get("/api/v1/cards/7/audio?stream=true")
+
+        assert response.status_code == 200
+        assert response.content == b"ID3-audio"
+        assert response.headers["content-type"] == "audio/mpeg"
+        assert response.headers["content-disposition"] == 'inline; filename="card-7.mp3"'
+        assert "content-length" not in response.headers
+        assert stream_audio.await_args.kwargs["text"] == "contract"
+
+    def test_get_card_audio_stream_stored_file(self, api_client, mocker, tmp_path):
+        """Test stream=true still serves stored audio as a file."""
+        audio_path = tmp_path / "abc.mp3"
+        audio_path.write_bytes(b"ID3-audio")
+        mocker.patch(
+            "app.api.cards.VocabularyCardService.get_card",
+            new_callable=AsyncMock,
+            return_value=make_card(),
+        )
+        mocker.patch(
+            "app.api.cards.TTSService.stream_audio",
+            new_callable=AsyncMock,
+            return_value=audio_path,
+        )
+
+        response = api_client.get("/api/v1/cards/1/audio?stream=true")
+
+        assert response.status_code == 200
+        assert response.headers["content-length"] == "9"
+
+    def test_get_card_audio_card_not_found(self, api_client, mocker):
+        """Test 404 when the card doesn't exist."""
+        mocker.patch(
+            "app.api.cards.VocabularyCardService.get_card",
+            new_callable=AsyncMock,
+            return_value=None,
+        )
+
+        response = api_client.get("/api/v1/cards/999/audio")
+
+        assert response.status_code == 404
+
+
 class TestCardsAPIAuth:
     """Tests for authentication requirements on cards endpoints."""
 
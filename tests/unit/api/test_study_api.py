@@ -6,6 +6,9 @@ from uuid import uuid4
 
 from app.models import (
     AnswerResponse,
+    BatchAnswerResponse,
+    BatchAnswerResult,
+    CardBatchResponse,
     CardResponse,
     SessionAbandonResponse,
     SessionCompleteResponse,
@@ -170,6 +173,64 @@ class TestSessionCard:
         assert response.status_code == 403
 
 
+class TestSessionCardsBatch:
+    """Tests for POST /study/session/{session_id}/cards:batch endpoint."""
+
+    def test_get_next_cards_batch_success(self, api_client, mocker):
+        """Test successful batch card retrieval."""
+        session_id = uuid4()
+        mock_response = CardBatchResponse(
+            cards=[
+                StudyCard(
+                    id=card_id,
+                    english_word=word,
+                    korean_meaning=meaning,
+                    is_new=True,
+                    quiz_type="word_to_meaning",
+                    question=word,
+                    options=["사과", "바나나", "오렌지", "포도"],
+                )
+                for card_id, word, meaning in ((1, "apple", "사과"), (2, "banana", "바나나"))
+            ],
+            cards_remaining=8,
+            cards_completed=0,
+        )
+
+        mock_get_next_cards = mocker.patch(
+            "app.api.study.StudySessionService.get_next_cards",
+            new_callable=AsyncMock,
+            return_value=mock_response,
+        )
+
+        response = api_client.post(
+            f"/api/v1/study/session/{session_id}/cards:batch",
+            json={"quiz_type": "word_to_meaning", "count": 2},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [card["id"] for card in data["cards"]] == [1, 2]
+        assert data["cards_remaining"] == 8
+        assert mock_get_next_cards.call_args.kwargs["session_id"] == session_id
+        assert mock_get_next_cards.call_args.kwargs["count"] == 2
+
+    def test_get_next_cards_batch_count_out_of_range(self, api_client):
+        """Test that count above the limit is rejected."""
+        response = api_client.post(
+            f"/api/v1/study/session/{uuid4()}/cards:batch",
+            json={"quiz_type": "word_to_meaning", "count": 51},
+        )
+        assert response.status_code == 400
+
+    def test_get_next_cards_batch_requires_auth(self, unauthenticated_client):
+        """Test that batch card retrieval requires authentication."""
+        response = unauthenticated_client.post(
+            f"/api/v1/study/session/{uuid4()}/cards:batch",
+            json={"quiz_type": "word_to_meaning"},
+        )
+        assert response.status_code == 403
+
+
 class TestSessionAnswer:
     """Tests for POST /study/session/answer endpoint."""
 
@@ -222,6 +283,74 @@ class TestSessionAnswer:
         assert response.status_code == 403
 
 
+class TestSessionAnswersBatch:
+    """Tests for POST /study/session/{session_id}/answers:batch endpoint."""
+
+    def test_submit_answers_batch_success(self, api_client, mocker):
+        """Test successful batch answer submission."""
+        session_id = uuid4()
+        mock_response = BatchAnswerResponse(
+            session_id=session_id,
+            results=[
+                BatchAnswerResult(
+                    index=0,
+                    card_id=1,
+                    result=AnswerResponse(
+                        card_id=1,
+                        is_correct=True,
+                        correct_answer="apple",
+                        user_answer="사과",
+                        feedback="정답입니다! 🎉",
+                        next_review_date=datetime(2024, 1, 16),
+                        card_state=CardState.LEARNING,
+                    ),
+                ),
+                BatchAnswerResult(index=1, card_id=99, error="Card is not in this session"),
+            ],
+            accepted_count=1,
+            rejected_count=1,
+        )
+
+        mock_submit = mocker.patch(
+            "app.api.study.StudySessionService.submit_answers_batch",
+            new_callable=AsyncMock,
+            return_value=mock_response,
+        )
+
+        response = api_client.post(
+            f"/api/v1/study/session/{session_id}/answers:batch",
+            json={
+                "answers": [
+                    {"card_id": 1, "answer": "사과"},
+                    {"card_id": 99, "answer": "x"},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["accepted_count"] == 1
+        assert data["results"][0]["result"]["is_correct"] is True
+        assert data["results"][1]["error"] == "Card is not in this session"
+        assert len(mock_submit.call_args.kwargs["answers"]) == 2
+
+    def test_submit_answers_batch_empty(self, api_client):
+        """Test that an empty batch is rejected."""
+        response = api_client.post(
+            f"/api/v1/study/session/{uuid4()}/answers:batch",
+            json={"answers": []},
+        )
+        assert response.status_code == 400
+
+    def test_submit_answers_batch_requires_auth(self, unauthenticated_client):
+        """Test that batch answer submission requires authentication."""
+        response = unauthenticated_client.post(
+            f"/api/v1/study/session/{uuid4()}/answers:batch",
+            json={"answers": [{"card_id": 1, "answer": "x"}]},
+        )
+        assert response.status_code == 403
+
+
 class TestSessionComplete:
     """Tests for POST /study/session/complete endpoint."""
 
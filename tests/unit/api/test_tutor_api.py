@@ -109,6 +109,88 @@ class TestSendWordTutorMessage:
         assert len(data["follow_up_questions"]) >= 1
 
 
+class TestStreamWordTutorMessage:
+    """Tests for stream_word_tutor_message endpoint."""
+
+    def test_stream_message_sse(self, api_client, mocker):
+        """Test tokens and the final reply are sent as SSE events."""
+        from app.models import TutorMessageResponse, TutorStreamToken
+
+        thread_id = uuid4()
+
+        async def events():
+            yield TutorStreamToken(text="계약")
+            yield TutorStreamToken(text="이에요")
+            yield TutorMessageResponse(
+                thread_id=thread_id,
+                assistant_message="계약이에요",
+                follow_up_questions=["예문은?"],
+            )
+
+        mocker.patch(
+            "app.api.tutor.WordTutorService.stream_message",
+            new_callable=AsyncMock,
+            return_value=events(),
+        )
+
+        response = api_client.post(
+            f"/api/v1/study/session/{uuid4()}/cards/1/tutor/message/stream",
+            json={"message": "무슨 뜻이야?"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.text == (
+            'event: token\ndata: {"text": "계약"}\n\n'
+            'event: token\ndata: {"text": "이에요"}\n\n'
+            f'event: done\ndata: {{"thread_id": "{thread_id}", "assistant_message": "계약이에요", '
+            '"follow_up_questions": ["예문은?"]}\n\n'
+        )
+
+    def test_stream_message_error_event(self, api_client, mocker):
+        """Test a failure after streaming started is reported as an error event."""
+        from app.core.exceptions import ExternalServiceError
+        from app.models import TutorStreamToken
+
+        async def events():
+            yield TutorStreamToken(text="계약")
+            raise ExternalServiceError("OpenAI request failed", service="openai")
+
+        mocker.patch(
+            "app.api.tutor.WordTutorService.stream_message",
+            new_callable=AsyncMock,
+            return_value=events(),
+        )
+
+        response = api_client.post(
+            f"/api/v1/study/session/{uuid4()}/cards/1/tutor/message/stream",
+            json={"message": "무슨 뜻이야?"},
+        )
+
+        assert response.status_code == 200
+        assert response.text.endswith(
+            'event: error\ndata: {"error": "external_service_error", '
+            '"message": "OpenAI request failed"}\n\n'
+        )
+
+    def test_stream_message_validation_error(self, api_client, mocker):
+        """Test errors raised before streaming are normal error responses."""
+        from app.core.exceptions import NotFoundError
+
+        mocker.patch(
+            "app.api.tutor.WordTutorService.stream_message",
+            new_callable=AsyncMock,
+            side_effect=NotFoundError("Session not found"),
+        )
+
+        response = api_client.post(
+            f"/api/v1/study/session/{uuid4()}/cards/1/tutor/message/stream",
+            json={"message": "무슨 뜻이야?"},
+        )
+
+        assert response.status_code == 404
+
+
 class TestGetWordTutorHistory:
     """Tests for get_word_tutor_history endpoint."""
 
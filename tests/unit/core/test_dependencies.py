@@ -44,6 +44,32 @@ class TestGetCurrentProfile:
 
         assert result.id == user_id
 
+    @pytest.mark.asyncio
+    async def test_valid_token_sets_request_profile(self, mocker):
+        """Test that the loaded profile is shared with services via the request context."""
+        from app.models import Profile
+        from app.services.profile_service import current_profile_ctx
+
+        user_id = uuid4()
+        mock_profile = Profile(id=user_id, daily_goal=20)
+
+        mock_credentials = MagicMock()
+        mock_credentials.credentials = "valid_token"
+
+        mocker.patch(
+            "app.core.dependencies.verify_supabase_token",
+            return_value=str(user_id),
+        )
+        mocker.patch(
+            "app.core.dependencies.ProfileService.get_profile",
+            new_callable=AsyncMock,
+            return_value=mock_profile,
+        )
+
+        await get_current_profile(mock_credentials, AsyncMock())
+
+        assert current_profile_ctx.get() is mock_profile
+
     @pytest.mark.asyncio
     async def test_invalid_token_raises_401(self, mocker):
         """Test that invalid token raises 401 HTTPException."""
@@ -1,10 +1,19 @@
 """Tests for security module."""
 
+import json
+import time
 from unittest.mock import MagicMock
 
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec
+from jwt.algorithms import ECAlgorithm
+
 from app.core.security import (
     get_supabase_admin_client,
     get_supabase_client,
+    jwks_cache,
+    verified_token_cache,
     verify_supabase_token,
 )
 
@@ -128,3 +137,151 @@ class TestVerifySupabaseToken:
         result = verify_supabase_token("some_token")
 
         assert result is None
+
+
+class TestLocalTokenVerification:
+    """Tests for local (JWKS / JWT secret) token verification."""
+
+    @pytest.fixture(autouse=True)
+    def local_mode(self, mocker):
+        """Enable local verification and reset caches around each test."""
+        mocker.patch("app.core.security.settings.supabase_jwt_verification", "local")
+        mocker.patch("app.core.security.settings.supabase_url", "https://test.supabase.co")
+        mocker.patch("app.core.security.settings.supabase_jwt_secret", "")
+        jwks_cache.clear()
+        verified_token_cache.clear()
+        yield
+        jwks_cache.clear()
+        verified_token_cache.clear()
+
+    @pytest.fixture
+    def signing_key(self):
+        """EC P-256 private key used to sign test tokens."""
+        return ec.generate_private_key(ec.SECP256R1())
+
+    @pytest.fixture
+    def mock_jwks(self, mocker, signing_key):
+        """Serve a JWKS containing the signing key's public half."""
+        jwk = json.loads(ECAlgorithm.to_jwk(signing_key.public_key()))
+        jwk.update({"kid": "key-1", "alg": "ES256", "use": "sig"})
+
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"keys": [jwk]}
+        return mocker.patch("app.core.security.httpx.get", return_value=mock_response)
+
+    @staticmethod
+    def _make_token(key, *, kid="key-1", algorithm="ES256", **overrides) -> str:
+        now = int(time.time())
+        claims = {
+            "sub": "local-user-id",
+            "aud": "authenticated",
+            "iss": "https://test.supabase.co/auth/v1",
+            "iat": now,
+            "exp": now + 3600,
+        }
+        claims.update(overrides)
+        return jwt.encode(claims, key, algorithm=algorithm, headers={"kid": kid})
+
+    def test_valid_token_verified_locally(self, mocker, signing_key, mock_jwks):
+        """Test that a correctly signed token is verified without calling Supabase Auth."""
+        mock_get_client = mocker.patch("app.core.security.get_supabase_client")
+
+        result = verify_supabase_token(self._make_token(signing_key))
+
+        assert result == "local-user-id"
+        mock_get_client.assert_not_called()
+
+    def test_jwks_fetched_once(self, signing_key, mock_jwks):
+        """Test that the JWKS is cached across tokens."""
+        verify_supabase_token(self._make_token(signing_key, sub="a"))
+        verify_supabase_token(self._make_token(signing_key, sub="b"))
+
+        mock_jwks.assert_called_once()
+
+    def test_verified_token_cached(self, mocker, signing_key, mock_jwks):
+        """Test that a verified token is not decoded again within the cache TTL."""
+        token = self._make_token(signing_key)
+        verify_supabase_token(token)
+
+        mock_decode = mocker.patch("app.core.security.decode_supabase_token")
+        result = verify_supabase_token(token)
+
+        assert result == "local-user-id"
+        mock_decode.assert_not_called()
+
+    def test_expired_token_rejected(self, signing_key, mock_jwks):
+        """Test that an expired token returns None."""
+        token = self._make_token(signing_key, exp=int(time.time()) - 3600)
+
+        assert verify_supabase_token(token) is None
+
+    def test_wrong_audience_rejected(self, signing_key, mock_jwks):
+        """Test that a token for another audience returns None."""
+        token = self._make_token(signing_key, aud="anon")
+
+        assert verify_supabase_token(token) is None
+
+    def test_bad_signature_rejected(self, signing_key, mock_jwks):
+        """Test that a token signed by another key with a known kid returns None."""
+        other_key = ec.generate_private_key(ec.SECP256R1())
+
+        assert verify_supabase_token(self._make_token(other_key)) is None
+
+    def test_malformed_token_rejected(self, mock_jwks):
+        """Test that a non-JWT string returns None."""
+        assert verify_supabase_token("not-a-jwt") is None
+
+    def test_unknown_kid_falls_back_to_remote(self, mocker, signing_key, mock_jwks):
+        """Test that an unknown signing key falls back to Supabase Auth."""
+        mock_client = MagicMock()
+        mock_client.auth.get_user.return_value = MagicMock(user=MagicMock(id="remote-user-id"))
+        mocker.patch("app.core.security.get_supabase_client", return_value=mock_client)
+
+        token = self._make_token(signing_key, kid="rotated-key")
+        result = verify_supabase_token(token)
+
+        assert result == "remote-user-id"
+        mock_client.auth.get_user.assert_called_once_with(token)
+
+    def test_remote_fallback_cached_until_token_expiry(self, mocker, signing_key, mock_jwks):
+        """Test that a token verified remotely isn't cached past its own exp."""
+        remote = mocker.patch(
+            "app.core.security._verify_token_remotely", return_value="remote-user-id"
+        )
+        exp = int(time.time()) + 5
+        token = self._make_token(signing_key, kid="rotated-key", exp=exp)
+        assert verify_supabase_token(token) == "remote-user-id"
+        assert verify_supabase_token(token) == "remote-user-id"
+        assert remote.call_count == 1
+
+        mocker.patch("app.core.security.time.time", return_value=exp + 1)
+        verify_supabase_token(token)
+
+        assert remote.call_count == 2
+
+    def test_unknown_kid_refresh_is_throttled(self, mocker, signing_key, mock_jwks):
+        """Test that repeated unknown kids don't refetch the JWKS every time."""
+        mocker.patch("app.core.security._verify_token_remotely", return_value=None)
+
+        verify_supabase_token(self._make_token(signing_key, kid="unknown-1"))
+        verify_supabase_token(self._make_token(signing_key, kid="unknown-2"))
+
+        mock_jwks.assert_called_once()
+
+    def test_hs256_token_with_jwt_secret(self, mocker):
+        """Test that legacy HS256 tokens are verified with the configured secret."""
+        secret = "super-secret-jwt-token-with-at-least-32-characters"
+        mocker.patch("app.core.security.settings.supabase_jwt_secret", secret)
+
+        token = self._make_token(secret, algorithm="HS256", sub="hs-user-id")
+
+        assert verify_supabase_token(token) == "hs-user-id"
+
+    def test_remote_mode_skips_local_verification(self, mocker, signing_key):
+        """Test that remote mode always calls Supabase Auth."""
+        mocker.patch("app.core.security.settings.supabase_jwt_verification", "remote")
+        mock_decode = mocker.patch("app.core.security.decode_supabase_token")
+        mocker.patch("app.core.security._verify_token_remotely", return_value="remote-user-id")
+
+        assert verify_supabase_token("any_token") == "remote-user-id"
+        mock_decode.assert_not_called()
@@ -0,0 +1,178 @@
+"""Tests for the in-process vocabulary card cache."""
+
+import dataclasses
+
+import pytest
+from sqlalchemy import event
+
+from app.config import settings
+from app.models import QuizType, SessionStatus, VocabularyCardUpdate
+from app.services.card_cache import CardCache
+from app.services.card_projections import CACHED_CARD_COLUMNS, CachedCard
+from app.services.study_session_service import StudySessionService
+from app.services.vocabulary_card_service import VocabularyCardService
+from tests.factories.profile_factory import ProfileFactory
+from tests.factories.study_session_factory import StudySessionFactory
+from tests.factories.vocabulary_card_factory import VocabularyCardFactory
+
+
+def _count_card_selects():
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM vocabulary_cards" in statement:
+            statements.append(statement)
+
+    return statements, record
+
+
+class TestCardCache:
+    """Tests for CardCache."""
+
+    async def test_miss_then_hit(self, db_session):
+        """Test the second read of a card is served without a query."""
+        card = await VocabularyCardFactory.create_async(db_session, english_word="contract")
+        statements, record = _count_card_selects()
+
+        engine = db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            first = await CardCache.get(db_session, card.id)
+            second = await CardCache.get(db_session, card.id)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert first.english_word == second.english_word == "contract"
+        # Snapshots are immutable, so the cached one is shared
+        assert first is second
+        assert len(statements) == 1
+        assert CardCache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    async def test_get_many_loads_misses_in_one_query(self, db_session):
+        """Test a batch with hits and misses issues one IN query for the misses."""
+        cards = [await VocabularyCardFactory.create_async(db_session) for _ in range(5)]
+        await CardCache.get(db_session, cards[0].id)
+        statements, record = _count_card_selects()
+
+        engine = db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            result = await CardCache.get_many(db_session, [card.id for card in cards] + [99999])
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert set(result) == {card.id for card in cards}
+        assert len(statements) == 1
+        assert CardCache.stats()["hits"] == 1
+
+    async def test_missing_card_returns_none(self, db_session):
+        """Test an unknown id is not cached as a card."""
+        assert await CardCache.get(db_session, 99999) is None
+        assert CardCache.stats()["size"] == 0
+
+    async def test_lru_eviction(self, db_session, monkeypatch):
+        """Test the least recently used card is evicted past max entries."""
+        monkeypatch.setattr(settings, "card_cache_max_entries", 2)
+        first, second, third = [
+            await VocabularyCardFactory.create_async(db_session) for _ in range(3)
+        ]
+
+        await CardCache.get(db_session, first.id)
+        await CardCache.get(db_session, second.id)
+        await CardCache.get(db_session, first.id)  # first is now most recent
+        await CardCache.get(db_session, third.id)
+
+        assert set(CardCache._entries) == {first.id, third.id}
+
+    async def test_expired_entry_is_reloaded(self, db_session):
+        """Test entries older than the TTL count as misses."""
+        card = await VocabularyCardFactory.create_async(db_session)
+        await CardCache.get(db_session, card.id)
+
+        loaded_at, values = CardCache._entries[card.id]
+        CardCache._entries[card.id] = (loaded_at - settings.card_cache_ttl_seconds - 1, values)
+        await CardCache.get(db_session, card.id)
+
+        assert CardCache.stats()["misses"] == 2
+
+    async def test_update_card_invalidates(self, db_session):
+        """Test VocabularyCardService.update_card drops the cached card."""
+        card = await VocabularyCardFactory.create_async(db_session, korean_meaning="계약")
+        await CardCache.get(db_session, card.id)
+
+        await VocabularyCardService.update_card(
+            db_session, card.id, VocabularyCardUpdate(korean_meaning="계약서")
+        )
+
+        cached = await CardCache.get(db_session, card.id)
+        assert cached.korean_meaning == "계약서"
+
+    async def test_snapshot_has_only_cached_columns(self, db_session):
+        """Test columns outside the cache fail loudly instead of reading as defaults."""
+        card = await VocabularyCardFactory.create_async(db_session, tags=["TOEIC"])
+
+        cached = await CardCache.get(db_session, card.id)
+
+        assert isinstance(cached, CachedCard)
+        assert [f.name for f in dataclasses.fields(CachedCard)] == [
+            column.key for column in CACHED_CARD_COLUMNS
+        ]
+        with pytest.raises(AttributeError):
+            _ = cached.tags
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            cached.korean_meaning = "계약서"
+
+    async def test_delete_card_invalidates(self, db_session):
+        """Test VocabularyCardService.delete_card drops the cached card."""
+        card = await VocabularyCardFactory.create_async(db_session)
+        await CardCache.get(db_session, card.id)
+
+        await VocabularyCardService.delete_card(db_session, card.id)
+
+        assert await CardCache.get(db_session, card.id) is None
+
+    async def test_load_racing_a_write_is_not_cached(self, db_session):
+        """Test rows read before an invalidation aren't stored."""
+        card = await VocabularyCardFactory.create_async(db_session)
+        engine = db_session.bind.sync_engine
+
+        def write_during_read(conn, cursor, statement, *args):
+            if "FROM vocabulary_cards" in statement:
+                CardCache.invalidate(card.id)
+
+        event.listen(engine, "before_cursor_execute", write_during_read)
+        try:
+            loaded = await CardCache.get(db_session, card.id)
+        finally:
+            event.remove(engine, "before_cursor_execute", write_during_read)
+
+        assert loaded.id == card.id
+        assert card.id not in CardCache._entries
+
+    async def test_next_card_served_from_cache(self, db_session):
+        """Test a hot card needs no card query on the study path."""
+        profile = await ProfileFactory.create_async(db_session)
+        card = await VocabularyCardFactory.create_async(db_session)
+        study_session = await StudySessionFactory.create_async(
+            db_session,
+            user_id=profile.id,
+            card_ids=[card.id, card.id],
+            current_index=0,
+            status=SessionStatus.ACTIVE,
+        )
+        await StudySessionService.get_next_card(
+            db_session, profile.id, study_session.id, QuizType.WORD_TO_MEANING
+        )
+        statements, record = _count_card_selects()
+
+        engine = db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            result = await StudySessionService.get_next_card(
+                db_session, profile.id, study_session.id, QuizType.WORD_TO_MEANING
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert result.card.id == card.id
+        assert statements == []
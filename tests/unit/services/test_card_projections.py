@@ -0,0 +1,140 @@
+"""Tests for column-projected card loading in quiz formatting and grading."""
+
+from sqlalchemy import event
+
+from app.models import BatchAnswerItem, ClozeQuestion, QuizType, SessionStatus
+from app.services.study_session_service import StudySessionService
+from tests.factories.deck_factory import DeckFactory
+from tests.factories.profile_factory import ProfileFactory
+from tests.factories.study_session_factory import StudySessionFactory
+from tests.factories.vocabulary_card_factory import VocabularyCardFactory
+
+DEFERRED_COLUMNS = ("tags", "related_words", "image_prompt", "image_error")
+
+
+async def _card_selects(db_session, call):
+    """Run ``call`` on an empty identity map and return the card SELECTs it issued."""
+    await db_session.commit()
+    db_session.expunge_all()
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM vocabulary_cards" in statement:
+            statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        result = await call()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return result, statements
+
+
+async def _active_session(db_session, **card_kwargs):
+    profile = await ProfileFactory.create_async(db_session)
+    deck = await DeckFactory.create_async(db_session, is_public=True)
+    card = await VocabularyCardFactory.create_async(
+        db_session,
+        deck_id=deck.id,
+        tags=["business"],
+        related_words=[{"word": "contractor", "meaning": "계약자"}],
+        **card_kwargs,
+    )
+    study_session = await StudySessionFactory.create_async(
+        db_session,
+        user_id=profile.id,
+        card_ids=[card.id],
+        current_index=0,
+        status=SessionStatus.ACTIVE,
+    )
+    return profile.id, study_session.id, card
+
+
+class TestCardProjections:
+    """Cards are loaded with only the columns each path reads."""
+
+    async def test_next_card_defers_unused_columns(self, db_session):
+        """Test formatting a card never transfers tags, related words or image jobs."""
+        user_id, session_id, card = await _active_session(
+            db_session,
+            example_sentences=[{"en": "Sign the contract.", "ko": "계약서에 서명하세요."}],
+        )
+
+        result, statements = await _card_selects(
+            db_session,
+            lambda: StudySessionService.get_next_card(
+                db_session, user_id, session_id, QuizType.WORD_TO_MEANING
+            ),
+        )
+
+        assert result.card.id == card.id
+        assert result.card.example_sentences == card.example_sentences
+        # The card itself, then the distractor index build (no JSON columns at all)
+        assert len(statements) == 2
+        assert "example_sentences" in statements[0]
+        assert "example_sentences" not in statements[1]
+        for column in DEFERRED_COLUMNS:
+            assert column not in statements[0]
+
+    async def test_cloze_card_requests_cloze_sentences(self, db_session):
+        """Test the cloze quiz type gets cloze_sentences from the projection."""
+        user_id, session_id, _ = await _active_session(
+            db_session,
+            english_word="contract",
+            cloze_sentences=[
+                {"sentence_with_blank": "Sign the ____.", "hint": "계약", "answer": "contract"}
+            ],
+        )
+
+        result, statements = await _card_selects(
+            db_session,
+            lambda: StudySessionService.get_next_card(
+                db_session, user_id, session_id, QuizType.CLOZE
+            ),
+        )
+
+        assert isinstance(result.card.question, ClozeQuestion)
+        assert result.card.question.sentence == "Sign the ____."
+        assert "cloze_sentences" in statements[0]
+        assert "related_words" not in statements[0]
+
+    async def test_submit_answer_loads_grading_columns_only(self, db_session):
+        """Test grading a new card loads no deferred columns."""
+        user_id, session_id, card = await _active_session(
+            db_session, english_word="contract", korean_meaning="계약"
+        )
+
+        result, statements = await _card_selects(
+            db_session,
+            lambda: StudySessionService.submit_answer(
+                db_session, user_id, session_id, card.id, "계약"
+            ),
+        )
+
+        assert result.is_correct is True
+        assert statements
+        for statement in statements:
+            for column in DEFERRED_COLUMNS:
+                assert column not in statement
+
+    async def test_submit_answers_batch_with_projected_cards(self, db_session):
+        """Test batch grading and frontier updates work on projected cards."""
+        user_id, session_id, card = await _active_session(
+            db_session, english_word="contract", korean_meaning="계약"
+        )
+
+        result, statements = await _card_selects(
+            db_session,
+            lambda: StudySessionService.submit_answers_batch(
+                db_session,
+                user_id,
+                session_id,
+                [BatchAnswerItem(card_id=card.id, answer="wrong")],
+            ),
+        )
+
+        assert result.accepted_count == 1
+        assert result.results[0].result.correct_answer == "contract"
+        for column in DEFERRED_COLUMNS:
+            assert column not in statements[0]
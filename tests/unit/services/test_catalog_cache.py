@@ -0,0 +1,152 @@
+"""Tests for CatalogCache."""
+
+from sqlalchemy import event
+
+from app.models import VocabularyCardCreate, VocabularyCardUpdate
+from app.services.catalog_cache import CatalogCache
+from app.services.deck_service import DeckService
+from app.services.vocabulary_card_service import VocabularyCardService
+from tests.factories.deck_factory import DeckFactory
+from tests.factories.profile_factory import ProfileFactory
+from tests.factories.vocabulary_card_factory import VocabularyCardFactory
+
+
+class TestBuild:
+    """Tests for building the snapshot from the database."""
+
+    async def test_build_counts_cards_per_deck(self, db_session):
+        """Test decks are grouped by category with their card counts."""
+        deck = await DeckFactory.create_async(db_session, is_public=True, category="exam")
+        empty = await DeckFactory.create_async(db_session, is_public=True, category="exam")
+        await DeckFactory.create_async(db_session, is_public=True, category=None)
+        for _ in range(3):
+            await VocabularyCardFactory.create_async(db_session, deck_id=deck.id)
+
+        await CatalogCache.build(db_session)
+
+        decks = CatalogCache.category_decks("exam", ProfileFactory.build().id)
+        assert [(d.id, d.total_cards) for d in decks] == [(deck.id, 3), (empty.id, 0)]
+        assert list(CatalogCache._by_category) == ["exam"]
+
+    async def test_private_decks_only_visible_to_creator(self, db_session):
+        """Test per-user filtering of private decks."""
+        owner = await ProfileFactory.create_async(db_session)
+        other = await ProfileFactory.create_async(db_session)
+        private = await DeckFactory.create_async(
+            db_session, is_public=False, creator_id=owner.id, category="daily"
+        )
+
+        await CatalogCache.build(db_session)
+
+        assert [d.id for d in CatalogCache.category_decks("daily", owner.id)] == [private.id]
+        assert CatalogCache.category_decks("daily", other.id) == []
+
+    async def test_ensure_loaded_builds_once(self, db_session, mocker):
+        """Test that a fresh snapshot is not rebuilt."""
+        spy = mocker.spy(CatalogCache, "build")
+
+        await CatalogCache.ensure_loaded(db_session)
+        await CatalogCache.ensure_loaded(db_session)
+
+        assert spy.call_count == 1
+
+    async def test_ensure_loaded_rebuilds_after_refresh_interval(self, db_session, mocker):
+        """Test that the snapshot is rebuilt once the refresh interval elapsed."""
+        mocker.patch("app.services.catalog_cache.settings.catalog_cache_refresh_seconds", 60)
+        await CatalogCache.ensure_loaded(db_session)
+        CatalogCache._built_at -= 61
+        spy = mocker.spy(CatalogCache, "build")
+
+        await CatalogCache.ensure_loaded(db_session)
+
+        assert spy.call_count == 1
+
+
+class TestVersion:
+    """Tests for catalog version invalidation."""
+
+    async def test_bump_makes_snapshot_stale(self, db_session):
+        """Test a version bump forces a rebuild."""
+        await CatalogCache.ensure_loaded(db_session)
+        assert CatalogCache.is_fresh()
+
+        CatalogCache.bump()
+
+        assert not CatalogCache.is_fresh()
+
+    async def test_snapshot_keeps_version_it_was_read_at(self, db_session):
+        """Test a write during a build leaves the new snapshot stale."""
+        version = CatalogCache.version()
+        CatalogCache.bump()
+
+        CatalogCache.load_rows([], version)
+
+        assert not CatalogCache.is_fresh()
+
+    async def test_card_writes_bump_version(self, db_session):
+        """Test card create, deck move and delete invalidate the snapshot."""
+        deck = await DeckFactory.create_async(db_session, is_public=True, category="exam")
+        other_deck = await DeckFactory.create_async(db_session, is_public=True, category="exam")
+        user_id = ProfileFactory.build().id
+
+        card = await VocabularyCardService.create_card(
+            db_session,
+            VocabularyCardCreate(english_word="apple", korean_meaning="사과", deck_id=deck.id),
+        )
+        await CatalogCache.ensure_loaded(db_session)
+        assert CatalogCache.category_decks("exam", user_id)[0].total_cards == 1
+
+        await VocabularyCardService.update_card(
+            db_session, card.id, VocabularyCardUpdate(deck_id=other_deck.id)
+        )
+        await CatalogCache.ensure_loaded(db_session)
+        counts = {d.id: d.total_cards for d in CatalogCache.category_decks("exam", user_id)}
+        assert counts == {deck.id: 0, other_deck.id: 1}
+
+        await VocabularyCardService.delete_card(db_session, card.id)
+        assert not CatalogCache.is_fresh()
+
+    async def test_unrelated_update_keeps_snapshot(self, db_session):
+        """Test edits that don't move a card keep the snapshot."""
+        card = await VocabularyCardFactory.create_async(db_session)
+        await CatalogCache.ensure_loaded(db_session)
+
+        await VocabularyCardService.update_card(
+            db_session, card.id, VocabularyCardUpdate(korean_meaning="새 뜻")
+        )
+
+        assert CatalogCache.is_fresh()
+
+
+class TestDeckServiceQueries:
+    """Category listings are served from the snapshot."""
+
+    async def test_category_pages_do_not_query_per_category_or_deck(self, db_session):
+        """Test categories and category decks need no catalog queries once cached."""
+        profile = await ProfileFactory.create_async(db_session)
+        for category in ("exam", "daily", "exam"):
+            deck = await DeckFactory.create_async(db_session, is_public=True, category=category)
+            await VocabularyCardFactory.create_async(db_session, deck_id=deck.id)
+        await db_session.commit()
+        await CatalogCache.ensure_loaded(db_session)
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            categories = await DeckService.get_categories(db_session, profile.id)
+            _, decks, total, _ = await DeckService.get_category_decks(
+                db_session, profile.id, "exam"
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        # One selected-deck lookup per call
+        assert len(statements) == 2
+        assert {c.id: c.total_decks for c in categories}["exam"] == 2
+        assert total == 2
+        assert all(deck.total_cards == 1 for deck in decks)
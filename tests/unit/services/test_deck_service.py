@@ -1,6 +1,9 @@
 """Tests for DeckService."""
 
-from app.models import CardState
+from sqlalchemy import event
+from sqlmodel import select
+
+from app.models import CardState, UserSelectedDeck
 from app.services.deck_service import DeckService
 from tests.factories.deck_factory import DeckFactory
 from tests.factories.profile_factory import ProfileFactory
@@ -201,6 +204,87 @@ class TestCalculateDeckProgress:
         assert progress2["new_cards"] == 1
 
 
+class TestCalculateDecksProgress:
+    """Tests for calculate_decks_progress (bulk) method."""
+
+    async def test_multiple_decks_single_query(self, db_session):
+        """Test every deck's progress comes from one statement."""
+        profile = await ProfileFactory.create_async(db_session)
+        deck_a = await DeckFactory.create_async(db_session)
+        deck_b = await DeckFactory.create_async(db_session)
+        empty_deck = await DeckFactory.create_async(db_session)
+
+        for state in (CardState.REVIEW, CardState.LEARNING, None, None):
+            card = await VocabularyCardFactory.create_async(db_session, deck_id=deck_a.id)
+            if state is not None:
+                await UserCardProgressFactory.create_async(
+                    db_session, user_id=profile.id, card_id=card.id, card_state=state
+                )
+        card = await VocabularyCardFactory.create_async(db_session, deck_id=deck_b.id)
+        await UserCardProgressFactory.create_async(
+            db_session, user_id=profile.id, card_id=card.id, card_state=CardState.RELEARNING
+        )
+        await db_session.commit()
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            progress = await DeckService.calculate_decks_progress(
+                db_session, profile.id, [deck_a.id, deck_b.id, empty_deck.id]
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert len(statements) == 1
+        assert progress[deck_a.id] == {
+            "total_cards": 4,
+            "learned_cards": 1,
+            "learning_cards": 1,
+            "new_cards": 2,
+            "progress_percent": 25.0,
+        }
+        assert progress[deck_b.id]["learning_cards"] == 1
+        assert progress[deck_b.id]["new_cards"] == 0
+        assert progress[empty_deck.id]["total_cards"] == 0
+        assert progress[empty_deck.id]["progress_percent"] == 0.0
+
+    async def test_no_decks(self, db_session):
+        """Test an empty deck list doesn't hit the database."""
+        profile = await ProfileFactory.create_async(db_session)
+
+        assert await DeckService.calculate_decks_progress(db_session, profile.id, []) == {}
+
+    async def test_decks_list_query_count_is_constant(self, db_session):
+        """Test the deck list page doesn't issue queries per deck."""
+        profile = await ProfileFactory.create_async(db_session)
+        for _ in range(5):
+            deck = await DeckFactory.create_async(db_session, is_public=True)
+            await VocabularyCardFactory.create_async(db_session, deck_id=deck.id)
+        await db_session.commit()
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            result = await DeckService.get_decks_list(db_session, profile.id, limit=20)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert len(result.decks) == 5
+        assert all(deck.total_cards == 1 for deck in result.decks)
+        # decks page, total count, progress
+        assert len(statements) == 3
+
+
 class TestGetDeckById:
     """Tests for get_deck_by_id method."""
 
@@ -306,6 +390,77 @@ class TestUpdateSelectedDecks:
         assert success is False
         assert "not found" in error
 
+    async def test_update_replaces_previous_selection(self, db_session):
+        """Test only the new selection remains and kept decks aren't re-inserted."""
+        profile = await ProfileFactory.create_async(db_session)
+        deck1 = await DeckFactory.create_async(db_session, is_public=True)
+        deck2 = await DeckFactory.create_async(db_session, is_public=True)
+        deck3 = await DeckFactory.create_async(db_session, is_public=True)
+        await DeckService.update_selected_decks(
+            db_session, profile.id, select_all=False, deck_ids=[deck1.id, deck2.id]
+        )
+
+        success, deck_ids, error = await DeckService.update_selected_decks(
+            db_session, profile.id, select_all=False, deck_ids=[deck2.id, deck3.id, deck3.id]
+        )
+
+        assert success is True
+        assert deck_ids == [deck2.id, deck3.id]
+        result = await db_session.exec(
+            select(UserSelectedDeck.deck_id).where(UserSelectedDeck.user_id == profile.id)
+        )
+        assert sorted(result.all()) == sorted([deck2.id, deck3.id])
+
+    async def test_update_invalid_deck_keeps_previous_selection(self, db_session):
+        """Test a rejected update leaves the existing selection untouched."""
+        profile = await ProfileFactory.create_async(db_session)
+        other_profile = await ProfileFactory.create_async(db_session)
+        deck = await DeckFactory.create_async(db_session, is_public=True)
+        private_deck = await DeckFactory.create_async(
+            db_session, is_public=False, creator_id=other_profile.id
+        )
+        await DeckService.update_selected_decks(
+            db_session, profile.id, select_all=False, deck_ids=[deck.id]
+        )
+
+        success, _, error = await DeckService.update_selected_decks(
+            db_session, profile.id, select_all=False, deck_ids=[deck.id, private_deck.id]
+        )
+
+        assert success is False
+        assert error == f"Deck with id {private_deck.id} not found or not accessible"
+        result = await db_session.exec(
+            select(UserSelectedDeck.deck_id).where(UserSelectedDeck.user_id == profile.id)
+        )
+        assert result.all() == [deck.id]
+
+    async def test_update_query_count_is_constant(self, db_session):
+        """Test selecting many decks doesn't issue statements per deck."""
+        profile = await ProfileFactory.create_async(db_session)
+        decks = [await DeckFactory.create_async(db_session, is_public=True) for _ in range(200)]
+        deck_ids = [deck.id for deck in decks]
+        await DeckService.update_selected_decks(
+            db_session, profile.id, select_all=False, deck_ids=deck_ids[:50]
+        )
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            success, selected, _ = await DeckService.update_selected_decks(
+                db_session, profile.id, select_all=False, deck_ids=deck_ids[25:]
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert success is True
+        assert selected == deck_ids[25:]
+        # validation, delete of the difference, insert
+        assert len(statements) == 3
+
 
 class TestGetSelectedDecksCategoryStates:
     """Additional tests for get_selected_decks (category state cases)."""
@@ -571,6 +726,27 @@ class TestSelectAllCategoryDecks:
         assert success is True
         assert added >= 1  # At least one new deck was added
 
+    async def test_select_all_counts_only_new_rows(self, db_session):
+        """Test added count excludes decks that were already selected."""
+        profile = await ProfileFactory.create_async(db_session)
+        deck1 = await DeckFactory.create_async(db_session, is_public=True, category="business")
+        await DeckFactory.create_async(db_session, is_public=True, category="business")
+        await DeckFactory.create_async(db_session, is_public=True, category="business")
+        await DeckService.update_selected_decks(
+            db_session, profile.id, select_all=False, deck_ids=[deck1.id]
+        )
+
+        success, total, added, _ = await DeckService.select_all_category_decks(
+            db_session, profile.id, "business"
+        )
+        _, _, added_again, _ = await DeckService.select_all_category_decks(
+            db_session, profile.id, "business"
+        )
+
+        assert success is True
+        assert added == total - 1
+        assert added_again == 0
+
 
 class TestDeselectAllCategoryDecks:
     """Tests for deselect_all_category_decks method."""
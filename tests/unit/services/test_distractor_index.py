@@ -0,0 +1,236 @@
+"""Tests for DistractorIndex."""
+
+import os
+import time
+
+import pytest
+from sqlalchemy import event
+
+from app.models import VocabularyCardCreate, VocabularyCardUpdate
+from app.services.distractor_index import DistractorIndex
+from app.services.vocabulary_card_service import VocabularyCardService
+from tests.factories.vocabulary_card_factory import VocabularyCardFactory
+
+
+class TestBuild:
+    """Tests for building the index from the database."""
+
+    async def test_build_groups_by_difficulty_and_pos(self, db_session):
+        """Test that cards land in exact and wildcard pools."""
+        card = await VocabularyCardFactory.create_async(
+            db_session, difficulty_level="beginner", part_of_speech="noun"
+        )
+        await VocabularyCardFactory.create_async(
+            db_session, difficulty_level="advanced", part_of_speech="verb"
+        )
+
+        await DistractorIndex.build(db_session)
+
+        exact = DistractorIndex._pools[("beginner", "noun")]
+        assert [e.id for e in exact] == [card.id]
+        assert card.id in {e.id for e in DistractorIndex._pools[("beginner", None)]}
+        assert card.id in {e.id for e in DistractorIndex._pools[(None, "noun")]}
+        assert len(DistractorIndex._pools[(None, None)]) == 2
+
+    async def test_card_without_filters_only_in_wildcard_pool(self, db_session):
+        """Test that cards without difficulty/pos are only in the (any, any) pool."""
+        card = await VocabularyCardFactory.create_async(
+            db_session, difficulty_level=None, part_of_speech=None
+        )
+
+        await DistractorIndex.build(db_session)
+
+        assert list(DistractorIndex._pools) == [(None, None)]
+        assert DistractorIndex._pools[(None, None)][0].id == card.id
+
+    async def test_ensure_loaded_builds_once(self, db_session, mocker):
+        """Test that a fresh index is not rebuilt."""
+        await VocabularyCardFactory.create_async(db_session)
+        spy = mocker.spy(DistractorIndex, "build")
+
+        await DistractorIndex.ensure_loaded(db_session)
+        await DistractorIndex.ensure_loaded(db_session)
+
+        assert spy.call_count == 1
+
+    async def test_ensure_loaded_rebuilds_after_refresh_interval(self, db_session, mocker):
+        """Test that the index is rebuilt once the refresh interval elapsed."""
+        mocker.patch("app.services.distractor_index.settings.distractor_index_refresh_seconds", 60)
+        await DistractorIndex.ensure_loaded(db_session)
+        DistractorIndex._built_at -= 61
+        spy = mocker.spy(DistractorIndex, "build")
+
+        await DistractorIndex.ensure_loaded(db_session)
+        await DistractorIndex.wait_for_refresh()
+
+        assert spy.call_count == 1
+        assert DistractorIndex.is_fresh()
+
+    async def test_stale_index_is_served_while_refreshing(self, db_session):
+        """Test a stale index answers immediately and is swapped once rebuilt."""
+        first = await VocabularyCardFactory.create_async(db_session)
+        await db_session.commit()
+        await DistractorIndex.ensure_loaded(db_session)
+        second = await VocabularyCardFactory.create_async(db_session)
+        await db_session.commit()
+        DistractorIndex.invalidate()
+
+        await DistractorIndex.ensure_loaded(db_session)
+        assert [e.id for e in DistractorIndex._pools[(None, None)]] == [first.id]
+
+        await DistractorIndex.wait_for_refresh()
+        assert {e.id for e in DistractorIndex._pools[(None, None)]} == {first.id, second.id}
+
+    async def test_write_during_build_leaves_index_stale(self, db_session):
+        """Test a card write racing the catalog read isn't lost until the next refresh."""
+        await VocabularyCardFactory.create_async(db_session)
+        engine = db_session.bind.sync_engine
+
+        def write_during_read(conn, cursor, statement, *args):
+            if "FROM vocabulary_cards" in statement:
+                DistractorIndex.invalidate()
+
+        event.listen(engine, "before_cursor_execute", write_during_read)
+        try:
+            await DistractorIndex.build(db_session)
+        finally:
+            event.remove(engine, "before_cursor_execute", write_during_read)
+
+        assert DistractorIndex._pools
+        assert not DistractorIndex.is_fresh()
+
+
+class TestSample:
+    """Tests for sampling distractors."""
+
+    def test_sample_excludes_card(self):
+        """Test that the card itself is never returned."""
+        DistractorIndex.load_rows(
+            [(1, "a", "가", "beginner", "noun"), (2, "b", "나", "beginner", "noun")]
+        )
+
+        for _ in range(20):
+            picked = DistractorIndex.sample(
+                exclude_card_id=1, difficulty_level="beginner", part_of_speech="noun", k=2
+            )
+            assert [e.id for e in picked] == [2]
+
+    def test_sample_respects_k(self):
+        """Test that at most k entries are returned without duplicates."""
+        DistractorIndex.load_rows([(i, f"w{i}", f"m{i}", None, None) for i in range(100)])
+
+        picked = DistractorIndex.sample(
+            exclude_card_id=None, difficulty_level=None, part_of_speech=None, k=6
+        )
+
+        assert len(picked) == 6
+        assert len({e.id for e in picked}) == 6
+
+    def test_sample_unknown_pool_returns_empty(self):
+        """Test that a missing pool returns no candidates."""
+        DistractorIndex.load_rows([(1, "a", "가", "beginner", "noun")])
+
+        picked = DistractorIndex.sample(
+            exclude_card_id=None, difficulty_level="advanced", part_of_speech="noun", k=3
+        )
+
+        assert picked == []
+
+    def test_sample_reads_at_most_k_plus_one_entries(self):
+        """Test sampling cost depends on k, not on the pool size."""
+
+        class CountingList(list):
+            reads = 0
+
+            def __getitem__(self, index):
+                CountingList.reads += 1
+                return super().__getitem__(index)
+
+        DistractorIndex.load_rows(
+            [(i, f"w{i}", f"m{i}", "intermediate", "noun") for i in range(10_000)]
+        )
+        key = ("intermediate", "noun")
+        DistractorIndex._pools[key] = CountingList(DistractorIndex._pools[key])
+
+        picked = DistractorIndex.sample(
+            exclude_card_id=0, difficulty_level="intermediate", part_of_speech="noun", k=6
+        )
+
+        assert len(picked) == 6
+        assert CountingList.reads <= 7
+
+
+@pytest.mark.skipif(not os.environ.get("RUN_BENCHMARKS"), reason="set RUN_BENCHMARKS=1 to run")
+class TestSampleBenchmark:
+    """Sampling latency from 1k to 1M cards."""
+
+    def test_sample_latency_flat_with_catalog_size(self, benchmark_report):
+        """Benchmark: sampling cost does not grow from 1k to 1M cards."""
+
+        def mean_sample_seconds(card_count: int, iterations: int = 2000) -> float:
+            DistractorIndex.load_rows(
+                [(i, f"w{i}", f"m{i}", "intermediate", "noun") for i in range(card_count)]
+            )
+            start = time.perf_counter()
+            for i in range(iterations):
+                DistractorIndex.sample(
+                    exclude_card_id=i,
+                    difficulty_level="intermediate",
+                    part_of_speech="noun",
+                    k=6,
+                )
+            return (time.perf_counter() - start) / iterations
+
+        small = mean_sample_seconds(1_000)
+        large = mean_sample_seconds(1_000_000)
+
+        benchmark_report(
+            f"1k cards: {small * 1e6:.1f} us/sample; 1M cards: {large * 1e6:.1f} us/sample"
+        )
+        # O(k) sampling: allow generous noise, but a linear scan would be ~1000x
+        assert large < small * 5
+
+
+class TestInvalidation:
+    """Tests for invalidation on card writes."""
+
+    async def test_create_card_invalidates(self, db_session):
+        """Test that creating a card marks the index stale."""
+        await DistractorIndex.build(db_session)
+
+        await VocabularyCardService.create_card(
+            db_session, VocabularyCardCreate(english_word="new", korean_meaning="새")
+        )
+
+        assert not DistractorIndex.is_fresh()
+
+    async def test_update_unrelated_field_keeps_index(self, db_session):
+        """Test that updating a field not held by the index keeps it fresh."""
+        card = await VocabularyCardFactory.create_async(db_session)
+        await DistractorIndex.build(db_session)
+
+        await VocabularyCardService.update_card(
+            db_session, card.id, VocabularyCardUpdate(audio_url="https://example.com/a.mp3")
+        )
+
+        assert DistractorIndex.is_fresh()
+
+    async def test_update_meaning_invalidates(self, db_session):
+        """Test that updating a distractor field marks the index stale."""
+        card = await VocabularyCardFactory.create_async(db_session)
+        await DistractorIndex.build(db_session)
+
+        await VocabularyCardService.update_card(
+            db_session, card.id, VocabularyCardUpdate(korean_meaning="바뀐 뜻")
+        )
+
+        assert not DistractorIndex.is_fresh()
+
+    async def test_delete_card_invalidates(self, db_session):
+        """Test that deleting a card marks the index stale."""
+        card = await VocabularyCardFactory.create_async(db_session)
+        await DistractorIndex.build(db_session)
+
+        await VocabularyCardService.delete_card(db_session, card.id)
+
+        assert not DistractorIndex.is_fresh()
@@ -0,0 +1,255 @@
+"""Tests for NewCardFrontierService."""
+
+from unittest.mock import AsyncMock
+
+from app.models import NewCardFrontier, VocabularyCardCreate, VocabularyCardUpdate
+from app.services.new_card_frontier_service import RANK_NULLS_LAST, NewCardFrontierService
+from app.services.user_card_progress_service import UserCardProgressService
+from app.services.vocabulary_card_service import VocabularyCardService
+from tests.factories.deck_factory import DeckFactory
+from tests.factories.profile_factory import ProfileFactory
+from tests.factories.user_card_progress_factory import UserCardProgressFactory
+from tests.factories.vocabulary_card_factory import VocabularyCardFactory
+
+
+async def _deck_with_cards(db_session, ranks):
+    deck = await DeckFactory.create_async(db_session, is_public=True)
+    cards = [
+        await VocabularyCardFactory.create_async(db_session, deck_id=deck.id, frequency_rank=rank)
+        for rank in ranks
+    ]
+    return deck, cards
+
+
+async def _frontier(db_session, user_id, deck_id):
+    frontier = await db_session.get(NewCardFrontier, (user_id, deck_id))
+    if frontier is not None:
+        await db_session.refresh(frontier)
+    return frontier
+
+
+class TestGetUnseenCards:
+    """Tests for frontier-based unseen card selection."""
+
+    async def test_orders_by_frequency_rank_nulls_last(self, db_session):
+        """Test cards are returned by rank, unranked cards last."""
+        profile = await ProfileFactory.create_async(db_session, select_all_decks=True)
+        _, cards = await _deck_with_cards(db_session, [None, 30, 10, 20])
+
+        result = await NewCardFrontierService.get_unseen_cards(db_session, profile, limit=10)
+
+        assert [c.id for c in result] == [cards[2].id, cards[3].id, cards[1].id, cards[0].id]
+
+    async def test_excludes_seen_cards_without_frontier(self, db_session):
+        """Test the anti-join fallback is used for decks without a frontier."""
+        profile = await ProfileFactory.create_async(db_session, select_all_decks=True)
+        _, cards = await _deck_with_cards(db_session, [1, 2, 3])
+        await UserCardProgressFactory.create_async(
+            db_session, user_id=profile.id, card_id=cards[1].id
+        )
+
+        result = await NewCardFrontierService.get_unseen_cards(db_session, profile, limit=10)
+
+        assert [c.id for c in result] == [cards[0].id, cards[2].id]
+
+    async def test_reads_from_frontier(self, db_session):
+        """Test cards before the frontier are skipped without a progress row."""
+        profile = await ProfileFactory.create_async(db_session, select_all_decks=True)
+        deck, cards = await _deck_with_cards(db_session, [1, 2, 3])
+        db_session.add(
+            NewCardFrontier(
+                user_id=profile.id, deck_id=deck.id, next_rank=2, next_card_id=cards[1].id
+            )
+        )
+        await db_session.flush()
+
+        result = await NewCardFrontierService.get_unseen_cards(db_session, profile, limit=10)
+
+        assert [c.id for c in result] == [cards[1].id, cards[2].id]
+
+    async def test_skips_exhausted_deck(self, db_session):
+        """Test a deck whose frontier is exhausted yields no cards."""
+        profile = await ProfileFactory.create_async(db_session, select_all_decks=True)
+        deck, _ = await _deck_with_cards(db_session, [1, 2])
+        db_session.add(NewCardFrontier(user_id=profile.id, deck_id=deck.id))
+        await db_session.flush()
+
+        result = await NewCardFrontierService.get_unseen_cards(db_session, profile, limit=10)
+
+        assert result == []
+
+    async def test_frontier_is_per_user(self, db_session):
+        """Test another user's frontier does not affect selection."""
+        profile = await ProfileFactory.create_async(db_session, select_all_decks=True)
+        other = await ProfileFactory.create_async(db_session)
+        deck, cards = await _deck_with_cards(db_session, [1, 2])
+        db_session.add(NewCardFrontier(user_id=other.id, deck_id=deck.id))
+        await db_session.flush()
+
+        result = await NewCardFrontierService.get_unseen_cards(db_session, profile, limit=10)
+
+        assert [c.id for c in result] == [cards[0].id, cards[1].id]
+
+    async def test_merges_decks_by_rank(self, db_session):
+        """Test cards from several decks are interleaved by rank, each from its frontier."""
+        profile = await ProfileFactory.create_async(db_session, select_all_decks=True)
+        deck_a, cards_a = await _deck_with_cards(db_session, [1, 3, 5])
+        _, cards_b = await _deck_with_cards(db_session, [2, 4, 6])
+        db_session.add(
+            NewCardFrontier(
+                user_id=profile.id, deck_id=deck_a.id, next_rank=3, next_card_id=cards_a[1].id
+            )
+        )
+        await db_session.flush()
+
+        result = await NewCardFrontierService.get_unseen_cards(db_session, profile, limit=3)
+
+        assert [c.id for c in result] == [cards_b[0].id, cards_a[1].id, cards_b[1].id]
+
+
+class TestAdvance:
+    """Tests for moving the frontier on first reviews."""
+
+    async def test_first_review_creates_frontier(self, db_session):
+        """Test the first review in a deck creates its frontier."""
+        profile = await ProfileFactory.create_async(db_session)
+        deck, cards = await _deck_with_cards(db_session, [1, 2, 3])
+
+        await UserCardProgressService.process_review(db_session, profile.id, cards[0].id, True)
+
+        frontier = await _frontier(db_session, profile.id, deck.id)
+        assert (frontier.next_rank, frontier.next_card_id) == (2, cards[1].id)
+
+    async def test_advance_skips_already_seen_cards(self, db_session):
+        """Test the frontier jumps over cards that were seen out of order."""
+        profile = await ProfileFactory.create_async(db_session)
+        deck, cards = await _deck_with_cards(db_session, [1, 2, 3, 4])
+
+        await UserCardProgressService.process_review(db_session, profile.id, cards[0].id, True)
+        await UserCardProgressService.process_review(db_session, profile.id, cards[2].id, True)
+        frontier = await _frontier(db_session, profile.id, deck.id)
+        assert frontier.next_card_id == cards[1].id
+
+        await UserCardProgressService.process_review(db_session, profile.id, cards[1].id, True)
+
+        frontier = await _frontier(db_session, profile.id, deck.id)
+        assert (frontier.next_rank, frontier.next_card_id) == (4, cards[3].id)
+
+    async def test_repeat_review_does_not_move_frontier(self, db_session):
+        """Test reviewing an already seen card leaves the frontier alone."""
+        profile = await ProfileFactory.create_async(db_session)
+        deck, cards = await _deck_with_cards(db_session, [1, 2, 3])
+
+        await UserCardProgressService.process_review(db_session, profile.id, cards[0].id, True)
+        frontier = await _frontier(db_session, profile.id, deck.id)
+        frontier.next_rank, frontier.next_card_id = 3, cards[2].id
+        db_session.add(frontier)
+        await db_session.flush()
+
+        await UserCardProgressService.process_review(db_session, profile.id, cards[0].id, False)
+
+        frontier = await _frontier(db_session, profile.id, deck.id)
+        assert frontier.next_card_id == cards[2].id
+
+    async def test_last_card_exhausts_frontier(self, db_session):
+        """Test seeing the last unseen card marks the deck as exhausted."""
+        profile = await ProfileFactory.create_async(db_session)
+        deck, cards = await _deck_with_cards(db_session, [1])
+
+        await UserCardProgressService.process_review(db_session, profile.id, cards[0].id, True)
+
+        frontier = await _frontier(db_session, profile.id, deck.id)
+        assert frontier.next_rank is None
+        assert frontier.next_card_id is None
+
+    async def test_create_tolerates_concurrent_insert(self, db_session, mocker):
+        """Test a frontier inserted by a concurrent first review isn't inserted again."""
+        profile = await ProfileFactory.create_async(db_session)
+        deck, cards = await _deck_with_cards(db_session, [1, 2, 3])
+        db_session.add(
+            NewCardFrontier(
+                user_id=profile.id, deck_id=deck.id, next_rank=1, next_card_id=cards[0].id
+            )
+        )
+        await UserCardProgressFactory.create_async(
+            db_session, user_id=profile.id, card_id=cards[0].id
+        )
+        await db_session.flush()
+        # The other transaction's row wasn't visible when this one looked it up
+        mocker.patch.object(db_session, "get", AsyncMock(return_value=None))
+
+        await NewCardFrontierService.advance(db_session, profile.id, [cards[0]])
+        await db_session.flush()
+
+        mocker.stopall()
+        frontier = await _frontier(db_session, profile.id, deck.id)
+        assert (frontier.next_rank, frontier.next_card_id) == (2, cards[1].id)
+
+
+class TestLowerToCard:
+    """Tests for keeping frontiers behind new or re-ranked cards."""
+
+    async def test_create_card_before_frontier_lowers_it(self, db_session):
+        """Test a new card ranked before the frontier becomes the frontier."""
+        profile = await ProfileFactory.create_async(db_session, select_all_decks=True)
+        deck, cards = await _deck_with_cards(db_session, [10, 20])
+        await UserCardProgressService.process_review(db_session, profile.id, cards[0].id, True)
+
+        card = await VocabularyCardService.create_card(
+            db_session,
+            VocabularyCardCreate(
+                english_word="early", korean_meaning="이른", deck_id=deck.id, frequency_rank=5
+            ),
+        )
+
+        frontier = await _frontier(db_session, profile.id, deck.id)
+        assert (frontier.next_rank, frontier.next_card_id) == (5, card.id)
+        result = await NewCardFrontierService.get_unseen_cards(db_session, profile, limit=10)
+        assert [c.id for c in result] == [card.id, cards[1].id]
+
+    async def test_create_card_reopens_exhausted_deck(self, db_session):
+        """Test a new card re-opens a deck whose frontier was exhausted."""
+        profile = await ProfileFactory.create_async(db_session)
+        deck, cards = await _deck_with_cards(db_session, [1])
+        await UserCardProgressService.process_review(db_session, profile.id, cards[0].id, True)
+
+        card = await VocabularyCardService.create_card(
+            db_session,
+            VocabularyCardCreate(english_word="late", korean_meaning="늦은", deck_id=deck.id),
+        )
+
+        frontier = await _frontier(db_session, profile.id, deck.id)
+        assert (frontier.next_rank, frontier.next_card_id) == (RANK_NULLS_LAST, card.id)
+
+    async def test_update_rank_lowers_frontier(self, db_session):
+        """Test re-ranking a card ahead of the frontier lowers it."""
+        profile = await ProfileFactory.create_async(db_session)
+        deck, cards = await _deck_with_cards(db_session, [1, 2, 3])
+        await UserCardProgressService.process_review(db_session, profile.id, cards[0].id, True)
+        await UserCardProgressService.process_review(db_session, profile.id, cards[1].id, True)
+
+        await VocabularyCardService.update_card(
+            db_session, cards[2].id, VocabularyCardUpdate(frequency_rank=0)
+        )
+
+        frontier = await _frontier(db_session, profile.id, deck.id)
+        assert (frontier.next_rank, frontier.next_card_id) == (0, cards[2].id)
+
+
+class TestReset:
+    """Tests for dropping frontiers."""
+
+    async def test_reset_by_deck(self, db_session):
+        """Test reset only drops frontiers of the given deck."""
+        profile = await ProfileFactory.create_async(db_session)
+        deck_a, _ = await _deck_with_cards(db_session, [1])
+        deck_b, _ = await _deck_with_cards(db_session, [1])
+        db_session.add(NewCardFrontier(user_id=profile.id, deck_id=deck_a.id))
+        db_session.add(NewCardFrontier(user_id=profile.id, deck_id=deck_b.id))
+        await db_session.flush()
+
+        await NewCardFrontierService.reset(db_session, deck_id=deck_a.id)
+        db_session.expunge_all()
+
+        assert await db_session.get(NewCardFrontier, (profile.id, deck_a.id)) is None
+        assert await db_session.get(NewCardFrontier, (profile.id, deck_b.id)) is not None
@@ -0,0 +1,109 @@
+"""Tests for the pooled OpenAI client registry, against a local fake OpenAI server."""
+
+import os
+import time
+
+import pytest
+from openai import AsyncOpenAI
+
+from app.config import settings
+from app.services.openai_clients import OpenAIClients
+from app.services.tts_service import TTSService
+
+
+class TestOpenAIClients:
+    """Tests for OpenAIClients."""
+
+    def test_openai_client_is_reused(self, monkeypatch):
+        """Test the same client is returned until the API key changes."""
+        monkeypatch.setattr(settings, "openai_api_key", "key-1")
+        first = OpenAIClients.openai()
+
+        assert OpenAIClients.openai() is first
+
+        monkeypatch.setattr(settings, "openai_api_key", "key-2")
+        second = OpenAIClients.openai()
+        assert second is not first
+        assert second.api_key == "key-2"
+
+    def test_chat_model_is_reused_per_parameters(self, monkeypatch):
+        """Test chat models are cached by model and parameters."""
+        monkeypatch.setattr(settings, "openai_api_key", "test-key")
+        first = OpenAIClients.chat_model(model="gpt-4o-mini", temperature=0.3, timeout=30)
+
+        assert OpenAIClients.chat_model(model="gpt-4o-mini", temperature=0.3, timeout=30) is first
+        assert (
+            OpenAIClients.chat_model(model="gpt-4o-mini", temperature=0.0, timeout=30) is not first
+        )
+
+    def test_pool_limits_from_settings(self, monkeypatch):
+        """Test the connection pool is sized by the openai_* settings."""
+        monkeypatch.setattr(settings, "openai_max_connections", 7)
+        monkeypatch.setattr(settings, "openai_max_keepalive_connections", 3)
+
+        pool = OpenAIClients.http_client()._transport._pool
+
+        assert pool._max_connections == 7
+        assert pool._max_keepalive_connections == 3
+        assert pool._http2 is settings.openai_http2
+
+    async def test_tts_calls_share_one_connection(self, fake_openai):
+        """Test repeated provider calls reuse a kept-alive connection."""
+        for word in ("contract", "invoice", "receipt"):
+            assert await TTSService.synthesize(text=word) == b"fake-mp3-audio"
+
+        assert fake_openai.requests == 3
+        assert fake_openai.connections == 1
+
+    async def test_tutor_and_tts_share_the_pool(self, fake_openai):
+        """Test the tutor's chat model and TTS go through the same pool."""
+        chat_model = OpenAIClients.chat_model(model="gpt-4o-mini", temperature=0.3, timeout=30)
+
+        await TTSService.synthesize(text="contract")
+        reply = await chat_model.ainvoke("hello")
+
+        assert reply.content == "ok"
+        assert fake_openai.connections == 1
+
+    async def test_aclose_closes_the_pool(self, fake_openai):
+        """Test shutdown closes the pool and a later call opens a new one."""
+        http_client = OpenAIClients.http_client()
+        await TTSService.synthesize(text="contract")
+
+        await OpenAIClients.aclose()
+
+        assert http_client.is_closed
+        assert await TTSService.synthesize(text="contract") == b"fake-mp3-audio"
+        assert OpenAIClients.http_client() is not http_client
+        assert fake_openai.connections == 2
+
+
+@pytest.mark.skipif(not os.environ.get("RUN_BENCHMARKS"), reason="set RUN_BENCHMARKS=1 to run")
+class TestOpenAIClientsBenchmark:
+    """Per-call clients vs the shared pool against the local fake server."""
+
+    async def test_pooled_vs_per_call_clients(self, fake_openai, benchmark_report):
+        """Compare a new AsyncOpenAI per call (the old behaviour) with the pooled client."""
+        calls = int(os.environ.get("BENCHMARK_OPENAI_CALLS", "200"))
+
+        started = time.perf_counter()
+        for _ in range(calls):
+            client = AsyncOpenAI(api_key="test-key", base_url=settings.openai_base_url)
+            await client.audio.speech.create(model="tts-1", voice="alloy", input="contract")
+            await client.close()
+        per_call = time.perf_counter() - started
+        per_call_connections = fake_openai.connections
+
+        started = time.perf_counter()
+        for _ in range(calls):
+            await TTSService.synthesize(text="contract")
+        pooled = time.perf_counter() - started
+        pooled_connections = fake_openai.connections - per_call_connections
+
+        assert per_call_connections == calls
+        assert pooled_connections == 1
+        benchmark_report(
+            f"per-call clients: {per_call / calls * 1000:.2f} ms/call, {per_call_connections} "
+            f"connections; pooled: {pooled / calls * 1000:.2f} ms/call, "
+            f"{pooled_connections} connection"
+        )
@@ -3,7 +3,10 @@
 from datetime import date, datetime
 from uuid import uuid4
 
+import pytest
 from freezegun import freeze_time
+from sqlalchemy.orm import sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models import CardState, ProfileUpdate
 from app.services.profile_service import ProfileService
@@ -89,6 +92,116 @@ class TestProfileServiceCRUD:
         assert result is False
 
 
+class TestProfileLookupCache:
+    """Tests for the request-scoped profile context and cross-request cache."""
+
+    @pytest.fixture(autouse=True)
+    def reset_cache(self):
+        """Start every test with an empty cache and request context."""
+        ProfileService.clear_cache()
+        ProfileService.set_request_profile(None)
+        yield
+        ProfileService.clear_cache()
+        ProfileService.set_request_profile(None)
+
+    @pytest.fixture
+    def enable_cache(self, mocker):
+        """Enable the cross-request profile cache."""
+        mocker.patch("app.services.profile_service.settings.profile_cache_ttl_seconds", 60)
+
+    @pytest.fixture
+    async def other_session(self, test_engine):
+        """A second session, standing in for a later request."""
+        maker = sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+        async with maker() as session:
+            yield session
+
+    async def test_request_context_skips_db(self, db_session, mocker):
+        """Test that the request-scoped profile is returned without a DB lookup."""
+        profile = await ProfileFactory.create_async(db_session)
+        ProfileService.set_request_profile(profile)
+        mock_get = mocker.patch.object(db_session, "get")
+
+        result = await ProfileService.get_profile(db_session, profile.id)
+
+        assert result is profile
+        mock_get.assert_not_called()
+
+    async def test_request_context_ignored_for_other_user(self, db_session):
+        """Test that the context profile is only used for the matching user."""
+        profile = await ProfileFactory.create_async(db_session)
+        other = await ProfileFactory.create_async(db_session)
+        ProfileService.set_request_profile(profile)
+
+        result = await ProfileService.get_profile(db_session, other.id)
+
+        assert result is other
+
+    async def test_cache_disabled_by_default(self, db_session, other_session, mocker):
+        """Test that a new session hits the DB when the cache is disabled."""
+        profile = await ProfileFactory.create_async(db_session)
+        await db_session.commit()
+        await ProfileService.get_profile(db_session, profile.id)
+        spy = mocker.spy(other_session, "get")
+
+        result = await ProfileService.get_profile(other_session, profile.id)
+
+        assert result is not None
+        spy.assert_called_once()
+
+    async def test_cache_serves_other_session(
+        self, db_session, other_session, enable_cache, mocker
+    ):
+        """Test that a cached profile is attached to a new session without a DB lookup."""
+        profile = await ProfileFactory.create_async(db_session, daily_goal=35)
+        await db_session.commit()
+        db_session.expunge_all()
+        profile = await ProfileService.get_profile(db_session, profile.id)
+        mock_get = mocker.patch.object(other_session, "get")
+
+        result = await ProfileService.get_profile(other_session, profile.id)
+
+        assert result is not None
+        assert result.daily_goal == 35
+        assert result in other_session
+        mock_get.assert_not_called()
+
+    async def test_cached_profile_can_be_updated(self, db_session, other_session, enable_cache):
+        """Test that changes to a cached profile are flushed like a loaded one."""
+        profile = await ProfileFactory.create_async(db_session)
+        await db_session.commit()
+        db_session.expunge_all()
+        profile = await ProfileService.get_profile(db_session, profile.id)
+
+        cached = await ProfileService.get_profile(other_session, profile.id)
+        cached.daily_goal = 42
+        await other_session.commit()
+
+        await db_session.refresh(profile)
+        assert profile.daily_goal == 42
+
+    async def test_update_profile_invalidates_cache(self, db_session, enable_cache):
+        """Test that update_profile drops the cached snapshot."""
+        profile = await ProfileFactory.create_async(db_session)
+        db_session.expunge_all()
+        profile = await ProfileService.get_profile(db_session, profile.id)
+        assert profile.id in ProfileService._cache
+
+        await ProfileService.update_profile(db_session, profile.id, ProfileUpdate(daily_goal=30))
+
+        assert profile.id not in ProfileService._cache
+
+    async def test_update_profile_config_invalidates_cache(self, db_session, enable_cache):
+        """Test that update_profile_config drops the cached snapshot."""
+        profile = await ProfileFactory.create_async(db_session)
+        db_session.expunge_all()
+        profile = await ProfileService.get_profile(db_session, profile.id)
+
+        await ProfileService.update_profile_config(db_session, profile, {"daily_goal": 15})
+
+        assert profile.id not in ProfileService._cache
+
+
 class TestProfileStreak:
     """Tests for streak calculation logic."""
 
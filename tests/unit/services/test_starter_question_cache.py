@@ -0,0 +1,166 @@
+"""Tests for the shared per-card tutor starter question cache."""
+
+import json
+
+from sqlalchemy import event
+
+from app.config import settings
+from app.models import CardStarterQuestions, SessionStatus, VocabularyCardUpdate
+from app.services.starter_question_cache import StarterQuestionCache
+from app.services.vocabulary_card_service import VocabularyCardService
+from app.services.word_tutor_graph import starter_content_hash
+from app.services.word_tutor_service import WordTutorService
+from tests.factories.profile_factory import ProfileFactory
+from tests.factories.study_session_factory import StudySessionFactory
+from tests.factories.vocabulary_card_factory import VocabularyCardFactory
+
+STARTERS = ["'contract'는 어떤 상황에서 쓰나요?", "'agreement'와 차이는?", "예문을 보여줘"]
+
+
+def _count_starter_selects():
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        if (
+            statement.lstrip().upper().startswith("SELECT")
+            and "card_starter_questions" in statement
+        ):
+            statements.append(statement)
+
+    return statements, record
+
+
+async def _open_tutor(db_session, card):
+    """Start a tutor for ``card`` in a new user's session."""
+    profile = await ProfileFactory.create_async(db_session)
+    study_session = await StudySessionFactory.create_async(
+        db_session, user_id=profile.id, card_ids=[card.id], status=SessionStatus.ACTIVE
+    )
+    return await WordTutorService.start(
+        db_session, user_id=profile.id, session_id=study_session.id, card_id=card.id
+    )
+
+
+class TestStarterQuestionCache:
+    """Tests for StarterQuestionCache."""
+
+    async def test_put_then_get(self, db_session):
+        """Test committed questions are served from memory without a query."""
+        card = await VocabularyCardFactory.create_async(db_session)
+        assert await StarterQuestionCache.get(db_session, card.id, "h1") is None
+
+        await StarterQuestionCache.put(db_session, card.id, "h1", STARTERS)
+        await db_session.commit()
+        StarterQuestionCache.remember(card.id, "h1", STARTERS)
+        statements, record = _count_starter_selects()
+        engine = db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            cached = await StarterQuestionCache.get(db_session, card.id, "h1")
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert cached == STARTERS
+        assert statements == []
+        assert StarterQuestionCache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    async def test_rolled_back_put_is_not_remembered(self, db_session):
+        """Test a put that is never committed doesn't reach the in-memory layer."""
+        card = await VocabularyCardFactory.create_async(db_session)
+
+        await StarterQuestionCache.put(db_session, card.id, "h1", STARTERS)
+        await db_session.rollback()
+
+        assert StarterQuestionCache.stats()["size"] == 0
+        assert await StarterQuestionCache.get(db_session, card.id, "h1") is None
+
+    async def test_table_backs_the_memory_layer(self, db_session):
+        """Test another process (empty memory) reads the stored row."""
+        card = await VocabularyCardFactory.create_async(db_session)
+        await StarterQuestionCache.put(db_session, card.id, "h1", STARTERS, model="gpt-4o-mini")
+        await db_session.commit()
+        StarterQuestionCache.clear()
+
+        assert await StarterQuestionCache.get(db_session, card.id, "h1") == STARTERS
+        row = await db_session.get(CardStarterQuestions, card.id)
+        assert row.model == "gpt-4o-mini"
+
+    async def test_stale_hash_is_a_miss(self, db_session):
+        """Test questions for older card content aren't served."""
+        card = await VocabularyCardFactory.create_async(db_session)
+        await StarterQuestionCache.put(db_session, card.id, "old", STARTERS)
+
+        assert await StarterQuestionCache.get(db_session, card.id, "new") is None
+
+    async def test_put_overwrites(self, db_session):
+        """Test regenerating a card replaces its row."""
+        card = await VocabularyCardFactory.create_async(db_session)
+        await StarterQuestionCache.put(db_session, card.id, "old", ["옛 질문"])
+        await StarterQuestionCache.put(db_session, card.id, "new", STARTERS)
+        StarterQuestionCache.clear()
+
+        assert await StarterQuestionCache.get(db_session, card.id, "new") == STARTERS
+        assert await StarterQuestionCache.get_hashes(db_session) == {card.id: "new"}
+
+    async def test_max_entries(self, db_session, monkeypatch):
+        """Test the in-memory layer is bounded by starter_cache_max_entries."""
+        monkeypatch.setattr(settings, "starter_cache_max_entries", 2)
+        cards = [await VocabularyCardFactory.create_async(db_session) for _ in range(3)]
+        for card in cards:
+            StarterQuestionCache.remember(card.id, "h", STARTERS)
+
+        assert list(StarterQuestionCache._entries) == [cards[1].id, cards[2].id]
+
+
+class TestStartTutorStarters:
+    """Opening a tutor uses the shared starter questions (local fake OpenAI server)."""
+
+    async def test_second_tutor_for_a_card_costs_no_llm_call(self, db_session, fake_openai):
+        """Test only the first tutor opened for a card asks the LLM."""
+        fake_openai.chat_reply = json.dumps({"starter_questions": STARTERS}, ensure_ascii=False)
+        card = await VocabularyCardFactory.create_async(db_session, english_word="contract")
+
+        first = await _open_tutor(db_session, card)
+        second = await _open_tutor(db_session, card)
+
+        assert first.starter_questions == second.starter_questions == STARTERS
+        assert len(fake_openai.chat_bodies) == 1
+        assert StarterQuestionCache.stats()["hits"] == 1
+
+    async def test_precomputed_card_costs_no_llm_call(self, db_session, fake_openai):
+        """Test a card filled in by the batch job opens without the LLM."""
+        card = await VocabularyCardFactory.create_async(db_session)
+        await StarterQuestionCache.put(db_session, card.id, starter_content_hash(card), STARTERS)
+        await db_session.commit()
+        StarterQuestionCache.clear()
+
+        result = await _open_tutor(db_session, card)
+
+        assert result.starter_questions == STARTERS
+        assert fake_openai.requests == 0
+
+    async def test_edited_card_is_regenerated(self, db_session, fake_openai):
+        """Test changing the card content invalidates its starter questions."""
+        fake_openai.chat_reply = json.dumps({"starter_questions": STARTERS}, ensure_ascii=False)
+        card = await VocabularyCardFactory.create_async(db_session, korean_meaning="계약")
+        await StarterQuestionCache.put(db_session, card.id, starter_content_hash(card), ["옛 질문"])
+        await db_session.commit()
+
+        await VocabularyCardService.update_card(
+            db_session, card.id, VocabularyCardUpdate(korean_meaning="계약서")
+        )
+
+        result = await _open_tutor(db_session, card)
+
+        assert result.starter_questions == STARTERS
+        assert len(fake_openai.chat_bodies) == 1
+
+    async def test_fallback_is_not_cached(self, db_session, fake_openai):
+        """Test default questions from a failed LLM call are retried next time."""
+        fake_openai.chat_reply = "not json"
+        card = await VocabularyCardFactory.create_async(db_session, english_word="contract")
+
+        result = await _open_tutor(db_session, card)
+
+        assert "'contract'는 어떤 상황에서 자주 쓰이나요?" in result.starter_questions
+        assert await StarterQuestionCache.get_hashes(db_session) == {}
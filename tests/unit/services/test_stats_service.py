@@ -1,14 +1,24 @@
 """Tests for StatsService."""
 
-from datetime import datetime, timedelta
+import os
+import time
+from datetime import date, datetime, timedelta
 
+import pytest
 from freezegun import freeze_time
+from sqlalchemy import event, insert
 
+from app.models import UserCardProgress, UserDailyStats, VocabularyCard
 from app.models.enums import CardState, SessionStatus
 from app.services.stats_service import StatsService
+from app.services.study_session_service import StudySessionService
+from app.services.user_card_progress_service import UserCardProgressService
+from app.services.user_daily_stats_service import UserDailyStatsService
 from tests.factories.profile_factory import ProfileFactory
+from tests.factories.review_log_factory import ReviewLogFactory
 from tests.factories.study_session_factory import StudySessionFactory
 from tests.factories.user_card_progress_factory import UserCardProgressFactory
+from tests.factories.user_daily_stats_factory import UserDailyStatsFactory
 from tests.factories.vocabulary_card_factory import VocabularyCardFactory
 
 
@@ -75,21 +85,34 @@ class TestStatsServiceHistory:
         profile = await ProfileFactory.create_async(db_session)
         card = await VocabularyCardFactory.create_async(db_session)
 
-        # Create progress with reviews
-        await UserCardProgressFactory.create_async(
-            db_session,
-            user_id=profile.id,
-            card_id=card.id,
-            total_reviews=5,
-            correct_count=4,
-            last_review_date=datetime.utcnow(),
+        # One review log row per review, rolled up per day
+        logs = [
+            await ReviewLogFactory.create_async(
+                db_session,
+                user_id=profile.id,
+                card_id=card.id,
+                is_correct=is_correct,
+            )
+            for is_correct in (True, True, True, True, False)
+        ]
+        # Outside the 7d window
+        logs.append(
+            await ReviewLogFactory.create_async(
+                db_session,
+                user_id=profile.id,
+                card_id=card.id,
+                reviewed_at=datetime.utcnow() - timedelta(days=30),
+            )
         )
+        await UserDailyStatsService.record_reviews(db_session, profile.id, logs)
 
         result = await StatsService.get_stats_history(db_session, profile.id, "7d")
 
         assert result.period == "7d"
-        assert len(result.data) >= 1
-        assert result.summary.total_cards_studied > 0
+        assert len(result.data) == 1
+        assert result.data[0].cards_studied == 5
+        assert result.data[0].correct_count == 4
+        assert result.summary.total_cards_studied == 5
 
     async def test_get_stats_history_all_period(self, db_session):
         """Test history with 'all' period."""
@@ -118,15 +141,11 @@ class TestStatsServiceAccuracy:
     async def test_get_stats_accuracy_with_reviews(self, db_session):
         """Test accuracy with review data."""
         profile = await ProfileFactory.create_async(db_session)
-        card = await VocabularyCardFactory.create_async(db_session, cefr_level="B1")
-
-        await UserCardProgressFactory.create_async(
+        await UserDailyStatsFactory.create_async(
             db_session,
             user_id=profile.id,
-            card_id=card.id,
-            total_reviews=10,
+            cards_studied=10,
             correct_count=8,
-            last_review_date=datetime.utcnow(),
         )
 
         result = await StatsService.get_stats_accuracy(db_session, profile.id)
@@ -190,7 +209,7 @@ class TestStatsServiceTodayStats:
         profile = await ProfileFactory.create_async(db_session)
 
         now = datetime.utcnow()
-        await StudySessionFactory.create_async(
+        study_session = await StudySessionFactory.create_async(
             db_session,
             user_id=profile.id,
             status=SessionStatus.COMPLETED,
@@ -201,6 +220,7 @@ class TestStatsServiceTodayStats:
             new_cards_count=3,
             review_cards_count=4,
         )
+        await UserDailyStatsService.record_session(db_session, study_session)
 
         result = await StatsService.get_today_stats(db_session, profile.id, 30)
 
@@ -215,7 +235,7 @@ class TestStatsServiceTodayStats:
         profile = await ProfileFactory.create_async(db_session)
 
         now = datetime.utcnow()
-        await StudySessionFactory.create_async(
+        study_session = await StudySessionFactory.create_async(
             db_session,
             user_id=profile.id,
             status=SessionStatus.COMPLETED,
@@ -226,6 +246,7 @@ class TestStatsServiceTodayStats:
             new_cards_count=10,
             review_cards_count=5,
         )
+        await UserDailyStatsService.record_session(db_session, study_session)
 
         result = await StatsService.get_today_stats(db_session, profile.id, 30)
 
@@ -242,7 +263,7 @@ class TestStatsServiceTodayStats:
         yesterday = now - timedelta(days=1)
 
         # Yesterday's session (should be excluded)
-        await StudySessionFactory.create_async(
+        study_session = await StudySessionFactory.create_async(
             db_session,
             user_id=profile.id,
             status=SessionStatus.COMPLETED,
@@ -253,6 +274,7 @@ class TestStatsServiceTodayStats:
             new_cards_count=5,
             review_cards_count=5,
         )
+        await UserDailyStatsService.record_session(db_session, study_session)
 
         result = await StatsService.get_today_stats(db_session, profile.id, 30)
 
@@ -268,70 +290,254 @@ class TestStatsAccuracyTrend:
         """Test trend shows 'improving' when current > previous by 5%."""
         profile = await ProfileFactory.create_async(db_session)
 
-        # Create card with history showing improvement
-        card = await VocabularyCardFactory.create_async(db_session)
-
-        # Create progress with good recent accuracy
-        await UserCardProgressFactory.create_async(
+        # Last 7 days: 90%
+        await UserDailyStatsFactory.create_async(
             db_session,
             user_id=profile.id,
-            card_id=card.id,
-            total_reviews=20,
-            correct_count=18,  # 90% accuracy
-            last_review_date=datetime.utcnow(),
-            quality_history=[
-                # Recent reviews (last 7 days) - high accuracy
-                {"date": "2024-01-14T10:00:00", "is_correct": True},
-                {"date": "2024-01-13T10:00:00", "is_correct": True},
-                {"date": "2024-01-12T10:00:00", "is_correct": True},
-                {"date": "2024-01-11T10:00:00", "is_correct": True},
-                {"date": "2024-01-10T10:00:00", "is_correct": True},
-                # Previous period (8-14 days ago) - low accuracy
-                {"date": "2024-01-06T10:00:00", "is_correct": False},
-                {"date": "2024-01-05T10:00:00", "is_correct": False},
-                {"date": "2024-01-04T10:00:00", "is_correct": True},
-                {"date": "2024-01-03T10:00:00", "is_correct": False},
-                {"date": "2024-01-02T10:00:00", "is_correct": False},
-            ],
+            stat_date=date(2024, 1, 14),
+            cards_studied=10,
+            correct_count=9,
+        )
+        # 8-14 days ago: 50%
+        await UserDailyStatsFactory.create_async(
+            db_session,
+            user_id=profile.id,
+            stat_date=date(2024, 1, 5),
+            cards_studied=10,
+            correct_count=5,
         )
 
         result = await StatsService.get_stats_accuracy(db_session, profile.id)
 
-        # Trend should be improving or stable based on calculation
-        assert result.trend in ["improving", "stable", "declining"]
+        assert result.trend == "improving"
+        assert result.by_period.last_7_days == 90.0
+        assert result.total_reviews == 20
 
     @freeze_time("2024-01-15 12:00:00")
     async def test_accuracy_trend_declining(self, db_session):
         """Test trend shows 'declining' when current < previous by 5%."""
         profile = await ProfileFactory.create_async(db_session)
 
+        # Last 7 days: 20%
+        await UserDailyStatsFactory.create_async(
+            db_session,
+            user_id=profile.id,
+            stat_date=date(2024, 1, 12),
+            cards_studied=5,
+            correct_count=1,
+        )
+        # 8-14 days ago: 100%
+        await UserDailyStatsFactory.create_async(
+            db_session,
+            user_id=profile.id,
+            stat_date=date(2024, 1, 3),
+            cards_studied=5,
+            correct_count=5,
+        )
+
+        result = await StatsService.get_stats_accuracy(db_session, profile.id)
+
+        assert result.trend == "declining"
+        assert result.by_period.last_7_days == 20.0
+
+
+class TestUserDailyStatsRollup:
+    """Tests for keeping the daily rollup up to date."""
+
+    @freeze_time("2024-01-15 12:00:00")
+    async def test_record_reviews_increments_existing_day(self, db_session):
+        """Test repeated writes add to the same day's row."""
+        profile = await ProfileFactory.create_async(db_session)
         card = await VocabularyCardFactory.create_async(db_session)
 
-        # Create progress with worse recent accuracy
-        await UserCardProgressFactory.create_async(
+        now = datetime.utcnow()
+        first = await ReviewLogFactory.create_async(
+            db_session, user_id=profile.id, card_id=card.id, reviewed_at=now
+        )
+        second = await ReviewLogFactory.create_async(
+            db_session, user_id=profile.id, card_id=card.id, reviewed_at=now, wrong=True
+        )
+        await UserDailyStatsService.record_reviews(db_session, profile.id, [first])
+        await UserDailyStatsService.record_reviews(db_session, profile.id, [second])
+
+        days = await UserDailyStatsService.get_days(db_session, profile.id)
+
+        assert len(days) == 1
+        assert days[0].stat_date == date(2024, 1, 15)
+        assert days[0].cards_studied == 2
+        assert days[0].correct_count == 1
+
+    async def test_process_review_updates_rollup(self, db_session):
+        """Test answering a card is reflected in the history without re-aggregation."""
+        profile = await ProfileFactory.create_async(db_session)
+        card = await VocabularyCardFactory.create_async(db_session)
+
+        await UserCardProgressService.process_review(db_session, profile.id, card.id, True)
+        await UserCardProgressService.process_review(db_session, profile.id, card.id, False)
+
+        result = await StatsService.get_stats_history(db_session, profile.id, "7d")
+
+        assert len(result.data) == 1
+        assert result.data[0].cards_studied == 2
+        assert result.data[0].correct_count == 1
+
+    async def test_complete_session_updates_rollup(self, db_session):
+        """Test completing a session is reflected in today's stats."""
+        profile = await ProfileFactory.create_async(db_session)
+        study_session = await StudySessionFactory.create_async(
             db_session,
             user_id=profile.id,
-            card_id=card.id,
-            total_reviews=20,
-            correct_count=10,  # 50% accuracy
-            last_review_date=datetime.utcnow(),
-            quality_history=[
-                # Recent reviews (last 7 days) - low accuracy
-                {"date": "2024-01-14T10:00:00", "is_correct": False},
-                {"date": "2024-01-13T10:00:00", "is_correct": False},
-                {"date": "2024-01-12T10:00:00", "is_correct": True},
-                {"date": "2024-01-11T10:00:00", "is_correct": False},
-                {"date": "2024-01-10T10:00:00", "is_correct": False},
-                # Previous period (8-14 days ago) - high accuracy
-                {"date": "2024-01-06T10:00:00", "is_correct": True},
-                {"date": "2024-01-05T10:00:00", "is_correct": True},
-                {"date": "2024-01-04T10:00:00", "is_correct": True},
-                {"date": "2024-01-03T10:00:00", "is_correct": True},
-                {"date": "2024-01-02T10:00:00", "is_correct": True},
-            ],
+            started_at=datetime.utcnow() - timedelta(minutes=3),
+            correct_count=4,
+            wrong_count=1,
+            new_cards_count=2,
+            review_cards_count=3,
         )
 
-        result = await StatsService.get_stats_accuracy(db_session, profile.id)
+        await StudySessionService.complete_session(db_session, profile.id, study_session.id)
+        result = await StatsService.get_today_stats(db_session, profile.id, 30)
+
+        assert result.total_cards_studied == 5
+        assert result.total_study_time_seconds >= 180
+        assert result.vocabulary.new_cards_count == 2
+        assert result.vocabulary.review_cards_count == 3
+        assert result.vocabulary.review_accuracy == 66.7
+
+    async def test_incomplete_session_is_ignored(self, db_session):
+        """Test sessions that were never completed don't count."""
+        profile = await ProfileFactory.create_async(db_session)
+        study_session = await StudySessionFactory.create_async(
+            db_session, user_id=profile.id, correct_count=3
+        )
+
+        await UserDailyStatsService.record_session(db_session, study_session)
+
+        assert await UserDailyStatsService.get_days(db_session, profile.id) == []
+
+
+def _count_statements(db_session):
+    """Start recording statements sent to the database; returns (statements, stop)."""
+    statements: list[str] = []
 
-        # Trend can be any value depending on calculation
-        assert result.trend in ["improving", "stable", "declining"]
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    return statements, lambda: event.remove(engine, "before_cursor_execute", record)
+
+
+class TestStatsAccuracyRoundTrips:
+    """get_stats_accuracy must stay a single statement."""
+
+    async def test_single_statement(self, db_session):
+        """Test every bucket, the trend window and CEFR levels come from one query."""
+        profile = await ProfileFactory.create_async(db_session)
+        card = await VocabularyCardFactory.create_async(db_session, cefr_level="A2")
+        await UserCardProgressFactory.create_async(
+            db_session, user_id=profile.id, card_id=card.id, total_reviews=4, correct_count=3
+        )
+        today = datetime.utcnow().date()
+        for days_ago, studied, correct in ((0, 10, 9), (10, 10, 5), (60, 4, 4), (400, 6, 0)):
+            await UserDailyStatsFactory.create_async(
+                db_session,
+                user_id=profile.id,
+                stat_date=today - timedelta(days=days_ago),
+                cards_studied=studied,
+                correct_count=correct,
+            )
+        await db_session.commit()
+
+        statements, stop = _count_statements(db_session)
+        try:
+            result = await StatsService.get_stats_accuracy(db_session, profile.id)
+        finally:
+            stop()
+
+        assert len(statements) == 1
+        assert result.total_reviews == 30
+        assert result.total_correct == 18
+        assert result.by_period.last_7_days == 90.0
+        assert result.by_period.last_30_days == 70.0
+        assert result.by_period.last_90_days == 75.0
+        assert result.by_cefr_level == {"A2": 75.0}
+        assert result.trend == "improving"
+
+
+@pytest.fixture
+async def long_history_user(db_session):
+    """A user with years of daily rollup rows and a large progress table."""
+    days = int(os.environ.get("BENCHMARK_HISTORY_DAYS", "3650"))
+    cards = int(os.environ.get("BENCHMARK_PROGRESS_ROWS", "100000"))
+
+    profile = await ProfileFactory.create_async(db_session)
+    today = datetime.utcnow().date()
+    await db_session.execute(
+        insert(UserDailyStats),
+        [
+            {
+                "user_id": profile.id,
+                "stat_date": today - timedelta(days=i),
+                "cards_studied": 20,
+                "correct_count": 10 + i % 10,
+            }
+            for i in range(days)
+        ],
+    )
+
+    first_id = 1_000_000
+    levels = ("A1", "A2", "B1", "B2", "C1", "C2")
+    await db_session.execute(
+        insert(VocabularyCard),
+        [
+            {
+                "id": first_id + i,
+                "english_word": f"word{i}",
+                "korean_meaning": f"뜻{i}",
+                "cefr_level": levels[i % len(levels)],
+            }
+            for i in range(cards)
+        ],
+    )
+    await db_session.execute(
+        insert(UserCardProgress),
+        [
+            {
+                "user_id": profile.id,
+                "card_id": first_id + i,
+                "card_state": CardState.REVIEW,
+                "next_review_date": datetime.utcnow(),
+                "total_reviews": 5,
+                "correct_count": i % 6,
+            }
+            for i in range(cards)
+        ],
+    )
+    await db_session.commit()
+    return profile
+
+
+@pytest.mark.skipif(not os.environ.get("RUN_BENCHMARKS"), reason="set RUN_BENCHMARKS=1 to run")
+class TestStatsAccuracyBenchmark:
+    """One DB round trip per get_stats_accuracy call, regardless of history size."""
+
+    async def test_one_round_trip_per_call(self, db_session, long_history_user, benchmark_report):
+        """Repeated calls cost exactly one statement each and return stable results."""
+        calls = 20
+        statements, stop = _count_statements(db_session)
+        try:
+            started = time.perf_counter()
+            results = [
+                await StatsService.get_stats_accuracy(db_session, long_history_user.id)
+                for _ in range(calls)
+            ]
+            elapsed = time.perf_counter() - started
+        finally:
+            stop()
+
+        assert len(statements) == calls
+        assert all(result == results[0] for result in results)
+        assert len(results[0].by_cefr_level) == 6
+        benchmark_report(
+            f"get_stats_accuracy: {elapsed / calls * 1000:.2f} ms/call, 1 statement/call"
+        )
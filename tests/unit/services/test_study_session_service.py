@@ -4,13 +4,22 @@ from uuid import uuid4
 
 import pytest
 from freezegun import freeze_time
+from sqlmodel import select
 
 from app.core.exceptions import NotFoundError, ValidationError
-from app.models import QuizType, SessionStatus
+from app.models import (
+    BatchAnswerItem,
+    QuizType,
+    ReviewLog,
+    SessionStatus,
+    UserCardProgress,
+    WrongAnswer,
+)
 from app.services.study_session_service import StudySessionService
 from tests.factories.deck_factory import DeckFactory
 from tests.factories.profile_factory import ProfileFactory
 from tests.factories.study_session_factory import StudySessionFactory
+from tests.factories.user_card_progress_factory import UserCardProgressFactory
 from tests.factories.vocabulary_card_factory import VocabularyCardFactory
 
 
@@ -256,6 +265,97 @@ class TestGetNextCard:
             )
 
 
+class TestGetNextCards:
+    """Tests for batch card prefetch."""
+
+    async def test_get_next_cards_returns_batch_in_session_order(self, db_session):
+        """Test that a batch returns cards in order and advances the session."""
+        profile = await ProfileFactory.create_async(db_session)
+        cards = [await VocabularyCardFactory.create_async(db_session) for _ in range(5)]
+        await UserCardProgressFactory.create_async(
+            db_session, user_id=profile.id, card_id=cards[2].id
+        )
+
+        session = await StudySessionFactory.create_async(
+            db_session,
+            user_id=profile.id,
+            card_ids=[card.id for card in cards],
+            current_index=1,
+            status=SessionStatus.ACTIVE,
+        )
+
+        result = await StudySessionService.get_next_cards(
+            db_session, profile.id, session.id, QuizType.WORD_TO_MEANING, count=3
+        )
+
+        assert [card.id for card in result.cards] == [c.id for c in cards[1:4]]
+        assert [card.is_new for card in result.cards] == [True, False, True]
+        assert all(card.options for card in result.cards)
+        assert result.cards_completed == 1
+        assert result.cards_remaining == 1
+        assert session.current_index == 4
+
+    async def test_get_next_cards_truncates_at_session_end(self, db_session):
+        """Test that a batch larger than the rest of the session is truncated."""
+        profile = await ProfileFactory.create_async(db_session)
+        cards = [await VocabularyCardFactory.create_async(db_session) for _ in range(2)]
+
+        session = await StudySessionFactory.create_async(
+            db_session,
+            user_id=profile.id,
+            card_ids=[card.id for card in cards],
+            current_index=0,
+            status=SessionStatus.ACTIVE,
+        )
+
+        result = await StudySessionService.get_next_cards(
+            db_session, profile.id, session.id, QuizType.MEANING_TO_WORD, count=10
+        )
+        assert len(result.cards) == 2
+        assert result.cards_remaining == 0
+
+        result = await StudySessionService.get_next_cards(
+            db_session, profile.id, session.id, QuizType.MEANING_TO_WORD, count=10
+        )
+        assert result.cards == []
+        assert result.cards_completed == 2
+
+    async def test_get_next_cards_wrong_user(self, db_session):
+        """Test error when session belongs to different user."""
+        profile1 = await ProfileFactory.create_async(db_session)
+        profile2 = await ProfileFactory.create_async(db_session)
+        card = await VocabularyCardFactory.create_async(db_session)
+
+        session = await StudySessionFactory.create_async(
+            db_session,
+            user_id=profile1.id,
+            card_ids=[card.id],
+        )
+
+        with pytest.raises(ValidationError):
+            await StudySessionService.get_next_cards(
+                db_session, profile2.id, session.id, QuizType.WORD_TO_MEANING, count=5
+            )
+
+    async def test_get_next_cards_card_not_found(self, db_session):
+        """Test error when a card in the batch no longer exists."""
+        profile = await ProfileFactory.create_async(db_session)
+        card = await VocabularyCardFactory.create_async(db_session)
+
+        session = await StudySessionFactory.create_async(
+            db_session,
+            user_id=profile.id,
+            card_ids=[card.id, 999999],
+            current_index=0,
+            status=SessionStatus.ACTIVE,
+        )
+
+        with pytest.raises(NotFoundError):
+            await StudySessionService.get_next_cards(
+                db_session, profile.id, session.id, QuizType.WORD_TO_MEANING, count=5
+            )
+
+
 class TestSubmitAnswer:
     """Tests for answer submission."""
 
@@ -376,6 +476,115 @@ class TestSubmitAnswer:
         assert result.score == 0
 
 
+class TestSubmitAnswersBatch:
+    """Tests for batch answer submission."""
+
+    async def test_submit_answers_batch_applies_all_answers(self, db_session):
+        """Test that a batch updates progress, logs, wrong answers and counters."""
+        profile = await ProfileFactory.create_async(db_session)
+        apple = await VocabularyCardFactory.create_async(
+            db_session, english_word="apple", korean_meaning="사과"
+        )
+        banana = await VocabularyCardFactory.create_async(
+            db_session, english_word="banana", korean_meaning="바나나"
+        )
+
+        session = await StudySessionFactory.create_async(
+            db_session,
+            user_id=profile.id,
+            card_ids=[apple.id, banana.id],
+            status=SessionStatus.ACTIVE,
+        )
+
+        result = await StudySessionService.submit_answers_batch(
+            db_session,
+            user_id=profile.id,
+            session_id=session.id,
+            answers=[
+                BatchAnswerItem(card_id=apple.id, answer="사과"),
+                BatchAnswerItem(card_id=banana.id, answer="포도", quiz_type="word_to_meaning"),
+                BatchAnswerItem(card_id=banana.id, answer="banana", hint_count=1),
+            ],
+        )
+
+        assert result.accepted_count == 3
+        assert result.rejected_count == 0
+        assert [r.result.is_correct for r in result.results] == [True, False, True]
+        assert result.results[2].result.score == 80
+        assert session.correct_count == 2
+        assert session.wrong_count == 1
+
+        progress_result = await db_session.exec(
+            select(UserCardProgress).where(UserCardProgress.user_id == profile.id)
+        )
+        progress_by_card = {p.card_id: p for p in progress_result.all()}
+        assert progress_by_card[apple.id].total_reviews == 1
+        # Repeated answers for a card are applied in order
+        assert progress_by_card[banana.id].total_reviews == 2
+        assert progress_by_card[banana.id].correct_count == 1
+
+        logs = await db_session.exec(select(ReviewLog).where(ReviewLog.user_id == profile.id))
+        assert len(logs.all()) == 3
+
+        wrong = await db_session.exec(select(WrongAnswer).where(WrongAnswer.user_id == profile.id))
+        wrong_answers = wrong.all()
+        assert [(w.card_id, w.user_answer) for w in wrong_answers] == [(banana.id, "포도")]
+
+    async def test_submit_answers_batch_reports_rejected_answers(self, db_session):
+        """Test that answers for cards outside the session are reported, not applied."""
+        profile = await ProfileFactory.create_async(db_session)
+        card = await VocabularyCardFactory.create_async(
+            db_session, english_word="apple", korean_meaning="사과"
+        )
+        other_card = await VocabularyCardFactory.create_async(db_session)
+
+        session = await StudySessionFactory.create_async(
+            db_session,
+            user_id=profile.id,
+            card_ids=[card.id],
+            status=SessionStatus.ACTIVE,
+        )
+
+        result = await StudySessionService.submit_answers_batch(
+            db_session,
+            user_id=profile.id,
+            session_id=session.id,
+            answers=[
+                BatchAnswerItem(card_id=other_card.id, answer="x"),
+                BatchAnswerItem(card_id=card.id, answer="apple"),
+            ],
+        )
+
+        assert result.accepted_count == 1
+        assert result.rejected_count == 1
+        assert result.results[0].index == 0
+        assert result.results[0].result is None
+        assert result.results[0].error == "Card is not in this session"
+        assert result.results[1].result.is_correct is True
+        assert session.correct_count == 1
+        assert session.wrong_count == 0
+
+    async def test_submit_answers_batch_inactive_session(self, db_session):
+        """Test error when session is not active."""
+        profile = await ProfileFactory.create_async(db_session)
+        card = await VocabularyCardFactory.create_async(db_session)
+
+        session = await StudySessionFactory.create_async(
+            db_session,
+            user_id=profile.id,
+            card_ids=[card.id],
+            status=SessionStatus.COMPLETED,
+        )
+
+        with pytest.raises(ValidationError):
+            await StudySessionService.submit_answers_batch(
+                db_session,
+                user_id=profile.id,
+                session_id=session.id,
+                answers=[BatchAnswerItem(card_id=card.id, answer="x")],
+            )
+
+
 class TestCompleteSession:
     """Tests for session completion."""
 
@@ -699,6 +908,7 @@ class TestGetDueReviewCards:
             user_id=profile.id,
             card_id=card.id,
             next_review_date=datetime(2020, 1, 1),
+            review=True,
         )
 
         result = await StudySessionService._get_due_review_cards(db_session, profile.id, limit=10)
@@ -830,6 +1040,7 @@ class TestGetOverview:
             user_id=profile.id,
             card_id=card.id,
             next_review_date=datetime(2020, 1, 1),
+            review=True,
         )
 
         result = await StudySessionService.get_overview(db_session, profile.id)
@@ -837,6 +1048,66 @@ class TestGetOverview:
         assert result.review_cards_count >= 1
         assert len(result.due_cards) >= 1
 
+    async def test_get_overview_due_card_summaries(self, db_session):
+        """Test due cards carry their words and are ordered by due date."""
+        from datetime import datetime
+
+        profile = await ProfileFactory.create_async(db_session, select_all_decks=True)
+        deck = await DeckFactory.create_async(db_session, is_public=True)
+        later = await VocabularyCardFactory.create_async(db_session, deck_id=deck.id)
+        earlier = await VocabularyCardFactory.create_async(db_session, deck_id=deck.id)
+        for card, due in ((later, datetime(2020, 1, 2)), (earlier, datetime(2020, 1, 1))):
+            await UserCardProgressFactory.create_async(
+                db_session,
+                user_id=profile.id,
+                card_id=card.id,
+                next_review_date=due,
+                review=True,
+            )
+
+        result = await StudySessionService.get_overview(db_session, profile.id)
+
+        assert [summary.card_id for summary in result.due_cards] == [earlier.id, later.id]
+        assert result.due_cards[0].english_word == earlier.english_word
+        assert result.due_cards[0].korean_meaning == earlier.korean_meaning
+        assert result.due_cards[0].next_review_date == datetime(2020, 1, 1)
+
+    async def test_get_overview_query_count_independent_of_limit(self, db_session):
+        """Test due card words are not fetched one card at a time."""
+        from datetime import datetime
+
+        from sqlalchemy import event
+
+        profile = await ProfileFactory.create_async(db_session, select_all_decks=True)
+        deck = await DeckFactory.create_async(db_session, is_public=True)
+        for _ in range(10):
+            card = await VocabularyCardFactory.create_async(db_session, deck_id=deck.id)
+            await UserCardProgressFactory.create_async(
+                db_session,
+                user_id=profile.id,
+                card_id=card.id,
+                next_review_date=datetime(2020, 1, 1),
+                review=True,
+            )
+        await db_session.commit()
+
+        async def count_statements(limit):
+            statements = []
+
+            def record(conn, cursor, statement, *args):
+                statements.append(statement)
+
+            engine = db_session.bind.sync_engine
+            event.listen(engine, "before_cursor_execute", record)
+            try:
+                result = await StudySessionService.get_overview(db_session, profile.id, limit)
+            finally:
+                event.remove(engine, "before_cursor_execute", record)
+            assert len(result.due_cards) == min(limit, 10)
+            return len(statements)
+
+        assert await count_statements(1) == await count_statements(10)
+
 
 class TestGenerateClozeQuestion:
     """Tests for _generate_cloze_question helper method."""
@@ -0,0 +1,600 @@
+"""Tests for TTSService and its cache/rate-limit stores."""
+
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.config import settings
+from app.core.exceptions import ExternalServiceError
+from app.services.audio_store import AudioStore
+from app.services.tts_service import TTSService
+from app.services.tts_store import MemoryTTSStore, RedisTTSStore, create_tts_store
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture(params=["memory", "redis"])
+def store(request):
+    """Each store backend; Redis runs against an in-process fakeredis server."""
+    if request.param == "memory":
+        return MemoryTTSStore()
+    return RedisTTSStore(fakeredis.FakeAsyncRedis())
+
+
+@pytest.fixture
+def tts_store(monkeypatch, tmp_path):
+    """Install a fresh memory store, audio dir and fake OpenAI key on TTSService."""
+    monkeypatch.setattr(settings, "openai_api_key", "test-key")
+    monkeypatch.setattr(settings, "tts_audio_dir", str(tmp_path / "tts_audio"))
+    store = MemoryTTSStore()
+    TTSService.set_store(store)
+    TTSService.reset_stats()
+    yield store
+    TTSService.set_store(None)
+    TTSService._in_flight.clear()
+
+
+@pytest.fixture
+def speech_create(mocker):
+    """Patch the OpenAI client; returns the speech.create mock."""
+    create = mocker.AsyncMock(return_value=SimpleNamespace(content=b"audio-bytes"))
+    client = SimpleNamespace(audio=SimpleNamespace(speech=SimpleNamespace(create=create)))
+    mocker.patch("app.services.tts_service.OpenAIClients.openai", return_value=client)
+    return create
+
+
+class TestTTSStore:
+    """Behaviour shared by every TTSStore backend."""
+
+    async def test_audio_round_trip(self, store):
+        """Test cached audio is returned until cleared."""
+        assert await store.get_audio("key") is None
+
+        await store.set_audio("key", b"\x00\x01", ttl_seconds=60)
+
+        assert await store.get_audio("key") == b"\x00\x01"
+        await store.clear()
+        assert await store.get_audio("key") is None
+
+    async def test_zero_ttl_is_not_cached(self, store):
+        """Test a TTL of 0 disables caching."""
+        await store.set_audio("key", b"audio", ttl_seconds=0)
+
+        assert await store.get_audio("key") is None
+
+    async def test_rate_limit_allows_up_to_limit(self, store):
+        """Test the window admits ``limit`` requests then reports a retry delay."""
+        results = [await store.hit_rate_limit("tts:user", 3, 60) for _ in range(4)]
+
+        assert results[:3] == [None, None, None]
+        assert 0 < results[3] <= 60
+
+    async def test_rate_limit_buckets_are_independent(self, store):
+        """Test one user's window doesn't limit another."""
+        assert await store.hit_rate_limit("tts:a", 1, 60) is None
+        assert await store.hit_rate_limit("tts:a", 1, 60) is not None
+        assert await store.hit_rate_limit("tts:b", 1, 60) is None
+
+    async def test_rejected_requests_are_not_recorded(self, store):
+        """Test retries while limited don't extend the window."""
+        await store.hit_rate_limit("tts:user", 1, 60)
+        first = await store.hit_rate_limit("tts:user", 1, 60)
+        second = await store.hit_rate_limit("tts:user", 1, 60)
+
+        assert second <= first
+
+
+class TestMemoryTTSStore:
+    """Tests specific to the in-process store."""
+
+    async def test_window_slides(self, mocker):
+        """Test requests older than the window stop counting."""
+        clock = mocker.patch("app.services.tts_store.time.monotonic", return_value=1000.0)
+        store = MemoryTTSStore()
+        assert await store.hit_rate_limit("tts:user", 1, 60) is None
+        assert await store.hit_rate_limit("tts:user", 1, 60) == 60
+
+        clock.return_value = 1061.0
+
+        assert await store.hit_rate_limit("tts:user", 1, 60) is None
+
+    async def test_max_entries(self, monkeypatch):
+        """Test the oldest audio is dropped past tts_cache_max_entries."""
+        monkeypatch.setattr(settings, "tts_cache_max_entries", 2)
+        store = MemoryTTSStore()
+        for key in ("a", "b", "c"):
+            await store.set_audio(key, key.encode(), ttl_seconds=60)
+
+        assert await store.get_audio("a") is None
+        assert await store.get_audio("c") == b"c"
+
+
+class TestRedisTTSStore:
+    """Tests specific to the shared Redis store."""
+
+    async def test_instances_share_cache_and_window(self):
+        """Test two app instances on one Redis see the same audio and rate window."""
+        server = fakeredis.FakeServer()
+        first = RedisTTSStore(fakeredis.FakeAsyncRedis(server=server))
+        second = RedisTTSStore(fakeredis.FakeAsyncRedis(server=server))
+
+        await first.set_audio("key", b"audio", ttl_seconds=60)
+        assert await second.get_audio("key") == b"audio"
+
+        assert await first.hit_rate_limit("tts:user", 2, 60) is None
+        assert await second.hit_rate_limit("tts:user", 2, 60) is None
+        assert await first.hit_rate_limit("tts:user", 2, 60) is not None
+
+    async def test_keys_expire(self):
+        """Test audio and rate windows are stored with a TTL."""
+        client = fakeredis.FakeAsyncRedis()
+        store = RedisTTSStore(client)
+
+        await store.set_audio("key", b"audio", ttl_seconds=60)
+        await store.hit_rate_limit("tts:user", 5, 30)
+
+        assert 0 < await client.ttl("loops:tts:audio:key") <= 60
+        assert 0 < await client.pttl("loops:tts:rate:tts:user") <= 30_000
+
+    async def test_connection_errors_are_external_service_errors(self):
+        """Test an unreachable Redis surfaces as a 503-style error."""
+        from redis.exceptions import ConnectionError
+
+        server = fakeredis.FakeServer()
+        server.connected = False
+        store = RedisTTSStore(fakeredis.FakeAsyncRedis(server=server))
+
+        with pytest.raises(ExternalServiceError) as exc_info:
+            await store.hit_rate_limit("tts:user", 1, 60)
+        assert isinstance(exc_info.value.__cause__, ConnectionError)
+
+
+class TestCreateTTSStore:
+    """Tests for backend selection."""
+
+    def test_memory_is_default(self):
+        """Test the default backend is process-local."""
+        assert isinstance(create_tts_store(), MemoryTTSStore)
+
+    def test_redis_requires_url(self, monkeypatch):
+        """Test the redis backend needs redis_url."""
+        monkeypatch.setattr(settings, "tts_store_backend", "redis")
+        monkeypatch.setattr(settings, "redis_url", "")
+
+        with pytest.raises(ExternalServiceError):
+            create_tts_store()
+
+    def test_redis_from_url(self, monkeypatch):
+        """Test the redis backend is built from redis_url."""
+        monkeypatch.setattr(settings, "tts_store_backend", "redis")
+        monkeypatch.setattr(settings, "redis_url", "redis://localhost:6379/0")
+
+        assert isinstance(create_tts_store(), RedisTTSStore)
+
+    def test_unknown_backend(self, monkeypatch):
+        """Test a typo in the backend name fails loudly."""
+        monkeypatch.setattr(settings, "tts_store_backend", "memcached")
+
+        with pytest.raises(ValueError):
+            create_tts_store()
+
+
+class TestGenerateAudio:
+    """Tests for TTSService.generate_audio."""
+
+    async def test_cache_hit_skips_provider(self, tts_store, speech_create):
+        """Test the second request for the same text is served from the store."""
+        profile_id = uuid4()
+
+        first = await TTSService.generate_audio(profile_id=profile_id, text="contract")
+        second = await TTSService.generate_audio(profile_id=profile_id, text="contract")
+
+        assert first == second == b"audio-bytes"
+        assert speech_create.await_count == 1
+
+    async def test_rate_limited(self, tts_store, speech_create, monkeypatch):
+        """Test exceeding the window raises 429 with Retry-After."""
+        monkeypatch.setattr(settings, "tts_rate_limit_requests", 1)
+        profile_id = uuid4()
+        await TTSService.generate_audio(profile_id=profile_id, text="contract")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await TTSService.generate_audio(profile_id=profile_id, text="agreement")
+
+        assert exc_info.value.status_code == 429
+        assert int(exc_info.value.headers["Retry-After"]) >= 1
+        assert speech_create.await_count == 1
+
+    async def test_provider_failure(self, tts_store, speech_create):
+        """Test provider errors become ExternalServiceError and aren't cached."""
+        speech_create.side_effect = RuntimeError("boom")
+
+        with pytest.raises(ExternalServiceError):
+            await TTSService.generate_audio(profile_id=uuid4(), text="contract")
+
+        assert tts_store._cache == {}
+
+
+class TestSingleFlight:
+    """Concurrent misses for the same audio share one provider call."""
+
+    @pytest.fixture
+    def provider(self, mocker):
+        """Fake provider that blocks until ``release`` is set."""
+        release = asyncio.Event()
+        calls = []
+
+        async def synthesize(*, text, audio_format="mp3", voice=None):
+            calls.append(text)
+            await release.wait()
+            return f"audio:{text}".encode()
+
+        mocker.patch.object(TTSService, "synthesize", side_effect=synthesize)
+        return SimpleNamespace(release=release, calls=calls)
+
+    async def test_concurrent_misses_coalesce(self, tts_store, provider):
+        """Test ten requests for one word make a single provider call."""
+        tasks = [
+            asyncio.create_task(TTSService.generate_audio(profile_id=uuid4(), text="contract"))
+            for _ in range(10)
+        ]
+        await asyncio.sleep(0)
+        assert TTSService.stats()["in_flight"] == 1
+
+        provider.release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert results == [b"audio:contract"] * 10
+        assert provider.calls == ["contract"]
+        assert TTSService.stats() == {"provider_calls": 1, "coalesced_waits": 9, "in_flight": 0}
+        assert await tts_store.get_audio(TTSService.audio_key(text="contract")) is not None
+
+    async def test_different_keys_are_not_coalesced(self, tts_store, provider):
+        """Test different words or voices each get their own call."""
+        profile_id = uuid4()
+        tasks = [
+            asyncio.create_task(TTSService.generate_audio(profile_id=profile_id, text="contract")),
+            asyncio.create_task(TTSService.generate_audio(profile_id=profile_id, text="invoice")),
+            asyncio.create_task(
+                TTSService.generate_audio(profile_id=profile_id, text="contract", voice="nova")
+            ),
+        ]
+        await asyncio.sleep(0)
+        provider.release.set()
+        await asyncio.gather(*tasks)
+
+        assert sorted(provider.calls) == ["contract", "contract", "invoice"]
+        assert TTSService.stats()["coalesced_waits"] == 0
+
+    async def test_waiters_skip_rate_limit(self, tts_store, provider, monkeypatch):
+        """Test joining an in-flight call doesn't use up the caller's quota."""
+        monkeypatch.setattr(settings, "tts_rate_limit_requests", 1)
+        profile_id = uuid4()
+        tasks = [
+            asyncio.create_task(TTSService.generate_audio(profile_id=profile_id, text="contract"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        provider.release.set()
+
+        assert await asyncio.gather(*tasks) == [b"audio:contract"] * 3
+
+    async def test_failure_reaches_every_waiter(self, tts_store, mocker):
+        """Test a provider error is raised to all waiters and the next miss retries."""
+        release = asyncio.Event()
+
+        async def fail(**kwargs):
+            await release.wait()
+            raise ExternalServiceError("TTS provider request failed", service="openai")
+
+        synthesize = mocker.patch.object(TTSService, "synthesize", side_effect=fail)
+        tasks = [
+            asyncio.create_task(TTSService.generate_audio(profile_id=uuid4(), text="contract"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(r, ExternalServiceError) for r in results)
+        assert synthesize.await_count == 1
+        assert TTSService.stats()["in_flight"] == 0
+
+        synthesize.side_effect = None
+        synthesize.return_value = b"audio"
+        assert await TTSService.generate_audio(profile_id=uuid4(), text="contract") == b"audio"
+        assert synthesize.await_count == 2
+
+    async def test_cancelled_caller_does_not_cancel_others(self, tts_store, provider):
+        """Test the first caller disconnecting leaves the call running for the rest."""
+        leader = asyncio.create_task(TTSService.generate_audio(profile_id=uuid4(), text="contract"))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(
+            TTSService.generate_audio(profile_id=uuid4(), text="contract")
+        )
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        provider.release.set()
+
+        assert await follower == b"audio:contract"
+        assert leader.cancelled()
+        assert provider.calls == ["contract"]
+
+
+class TestStreamAudio:
+    """Tests for TTSService.stream_audio."""
+
+    @pytest.fixture
+    def provider(self, mocker):
+        """Fake streaming provider: one chunk, then the rest once ``release`` is set."""
+        release = asyncio.Event()
+        state = SimpleNamespace(release=release, calls=0, fail_after_first=False)
+
+        async def synthesize_stream(*, text, audio_format="mp3", voice=None):
+            state.calls += 1
+            yield b"first-"
+            await release.wait()
+            if state.fail_after_first:
+                raise ExternalServiceError("TTS generation failed", service="openai")
+            yield b"second"
+
+        mocker.patch.object(TTSService, "synthesize_stream", side_effect=synthesize_stream)
+        return state
+
+    async def test_first_chunk_arrives_before_provider_finishes(self, tts_store, provider):
+        """Test audio is forwarded as it arrives, then cached and stored."""
+        key = TTSService.audio_key(text="contract")
+
+        stream = await TTSService.stream_audio(profile_id=uuid4(), text="contract")
+        in_flight = TTSService._in_flight[key]
+
+        assert await anext(stream) == b"first-"
+        assert not in_flight.done()
+
+        provider.release.set()
+        assert [chunk async for chunk in stream] == [b"second"]
+        await in_flight
+
+        assert await tts_store.get_audio(key) == b"first-second"
+        assert (await AudioStore.get(key, "mp3")).read_bytes() == b"first-second"
+
+    async def test_stored_audio_is_a_path(self, tts_store, provider):
+        """Test already stored audio is served as a file without the provider."""
+        await AudioStore.put(TTSService.audio_key(text="contract"), "mp3", b"stored")
+
+        path = await TTSService.stream_audio(profile_id=uuid4(), text="contract")
+
+        assert path.read_bytes() == b"stored"
+        assert provider.calls == 0
+
+    async def test_error_before_first_chunk_is_raised(self, tts_store, mocker):
+        """Test provider errors before any audio surface as ExternalServiceError."""
+
+        async def fail(**kwargs):
+            raise ExternalServiceError("TTS generation failed", service="openai")
+            yield b""
+
+        mocker.patch.object(TTSService, "synthesize_stream", side_effect=fail)
+
+        with pytest.raises(ExternalServiceError):
+            await TTSService.stream_audio(profile_id=uuid4(), text="contract")
+        await asyncio.sleep(0)  # let the done callback run
+        assert TTSService.stats()["in_flight"] == 0
+
+    async def test_error_mid_stream_ends_stream(self, tts_store, provider, tmp_path):
+        """Test a failure after the first chunk is raised from the stream and not stored."""
+        provider.fail_after_first = True
+        stream = await TTSService.stream_audio(profile_id=uuid4(), text="contract")
+        provider.release.set()
+
+        with pytest.raises(ExternalServiceError):
+            [chunk async for chunk in stream]
+        assert await AudioStore.get(TTSService.audio_key(text="contract"), "mp3") is None
+        assert not any(p.is_file() for p in tmp_path.joinpath("tts_audio").rglob("*"))
+
+    async def test_client_disconnect_still_stores(self, tts_store, provider):
+        """Test closing the stream early doesn't stop the audio being stored."""
+        key = TTSService.audio_key(text="contract")
+        stream = await TTSService.stream_audio(profile_id=uuid4(), text="contract")
+        in_flight = TTSService._in_flight[key]
+        await stream.aclose()
+
+        provider.release.set()
+        await in_flight
+
+        assert (await AudioStore.get(key, "mp3")).read_bytes() == b"first-second"
+
+    async def test_slow_client_bounds_buffered_chunks(self, tts_store, mocker):
+        """Test the provider is read no further ahead of the client than the buffer."""
+        mocker.patch.object(TTSService, "_stream_buffer_chunks", 2)
+        produced = 0
+
+        async def synthesize_stream(**kwargs):
+            nonlocal produced
+            for i in range(20):
+                produced += 1
+                yield f"{i:02d}".encode()
+
+        mocker.patch.object(TTSService, "synthesize_stream", side_effect=synthesize_stream)
+        key = TTSService.audio_key(text="contract")
+
+        stream = await TTSService.stream_audio(profile_id=uuid4(), text="contract")
+        in_flight = TTSService._in_flight[key]
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert produced <= 4
+
+        audio = b"".join([chunk async for chunk in stream])
+        await in_flight
+
+        assert audio == b"".join(f"{i:02d}".encode() for i in range(20))
+        assert (await AudioStore.get(key, "mp3")).read_bytes() == audio
+
+    @pytest.fixture
+    def burst_provider(self, mocker):
+        """Fake streaming provider that sends ten chunks at once into a one-chunk buffer."""
+        mocker.patch.object(TTSService, "_stream_buffer_chunks", 1)
+
+        async def synthesize_stream(**kwargs):
+            for i in range(10):
+                yield f"{i}".encode()
+
+        mocker.patch.object(TTSService, "synthesize_stream", side_effect=synthesize_stream)
+
+    async def test_disconnect_with_full_buffer_still_stores(self, tts_store, burst_provider):
+        """Test a client leaving mid-stream doesn't stall the provider read."""
+        key = TTSService.audio_key(text="contract")
+        stream = await TTSService.stream_audio(profile_id=uuid4(), text="contract")
+        in_flight = TTSService._in_flight[key]
+
+        assert await anext(stream) == b"0"
+        await stream.aclose()
+        await asyncio.wait_for(in_flight, timeout=5)
+
+        path = await AudioStore.get(key, "mp3")
+        assert path.read_bytes() == b"0123456789"
+        assert [p.name for p in path.parent.iterdir()] == [path.name]
+
+    async def test_dropped_stream_still_stores(self, tts_store, burst_provider):
+        """Test a stream discarded before the response starts doesn't stall the provider read."""
+        key = TTSService.audio_key(text="contract")
+        stream = await TTSService.stream_audio(profile_id=uuid4(), text="contract")
+        in_flight = TTSService._in_flight[key]
+
+        del stream
+        await asyncio.wait_for(in_flight, timeout=5)
+
+        assert (await AudioStore.get(key, "mp3")).read_bytes() == b"0123456789"
+
+    async def test_concurrent_requests_join_the_stream(self, tts_store, provider):
+        """Test a second request during a stream waits for it instead of calling again."""
+        stream = await TTSService.stream_audio(profile_id=uuid4(), text="contract")
+        follower = asyncio.create_task(TTSService.stream_audio(profile_id=uuid4(), text="contract"))
+        await asyncio.sleep(0)
+
+        provider.release.set()
+        assert b"".join([chunk async for chunk in stream]) == b"first-second"
+
+        assert (await follower).read_bytes() == b"first-second"
+        assert provider.calls == 1
+
+
+class TestAudioStore:
+    """Tests for the content-addressed audio store."""
+
+    async def test_put_and_get(self, tts_store):
+        """Test stored audio is found again under its key."""
+        key = "ab" + "0" * 62
+        assert await AudioStore.get(key, "mp3") is None
+
+        path = await AudioStore.put(key, "mp3", b"audio")
+
+        assert await AudioStore.get(key, "mp3") == path
+        assert path.read_bytes() == b"audio"
+        assert path.parent.name == "ab"
+        assert await AudioStore.get(key, "ogg") is None
+
+    async def test_put_leaves_no_temp_files(self, tts_store):
+        """Test writes are renamed into place."""
+        key = "cd" + "1" * 62
+        path = await AudioStore.put(key, "mp3", b"first")
+        await AudioStore.put(key, "mp3", b"second")
+
+        assert [p.name for p in path.parent.iterdir()] == [path.name]
+        assert path.read_bytes() == b"second"
+
+    def test_rejects_path_like_keys(self, tts_store):
+        """Test keys can't escape the store directory."""
+        with pytest.raises(ValueError):
+            AudioStore.path_for("../../etc/passwd", "mp3")
+
+
+class TestGetAudioFile:
+    """Tests for TTSService.get_audio_file."""
+
+    async def test_miss_synthesizes_and_stores(self, tts_store, speech_create):
+        """Test the first request writes the audio under its TTS key."""
+        path = await TTSService.get_audio_file(profile_id=uuid4(), text="contract")
+
+        assert path.read_bytes() == b"audio-bytes"
+        assert path.stem == TTSService.audio_key(text="contract")
+        assert speech_create.await_count == 1
+
+    async def test_stored_audio_skips_provider_and_rate_limit(
+        self, tts_store, speech_create, monkeypatch
+    ):
+        """Test stored audio is served even when the user is rate limited."""
+        monkeypatch.setattr(settings, "tts_rate_limit_requests", 1)
+        profile_id = uuid4()
+        await AudioStore.put(TTSService.audio_key(text="contract"), "mp3", b"pregenerated")
+        await TTSService.generate_audio(profile_id=profile_id, text="agreement")
+
+        path = await TTSService.get_audio_file(profile_id=profile_id, text="contract")
+
+        assert path.read_bytes() == b"pregenerated"
+        assert speech_create.await_count == 1
+
+    async def test_key_depends_on_voice_and_format(self, tts_store):
+        """Test different voices and formats never share a file."""
+        keys = {
+            TTSService.audio_key(text="contract"),
+            TTSService.audio_key(text="contract", voice="nova"),
+            TTSService.audio_key(text="contract", audio_format="ogg"),
+        }
+
+        assert len(keys) == 3
+
+
+class TestSynthesize:
+    """Tests for TTSService.synthesize."""
+
+    async def test_uses_opus_for_ogg(self, tts_store, speech_create):
+        """Test ogg output is requested from the provider as opus."""
+        await TTSService.synthesize(text="contract", audio_format="ogg", voice="nova")
+
+        kwargs = speech_create.await_args.kwargs
+        assert kwargs["response_format"] == "opus"
+        assert kwargs["voice"] == "nova"
+
+    async def test_stream_yields_provider_chunks(self, tts_store, mocker):
+        """Test synthesize_stream forwards the streaming response body."""
+
+        async def iter_bytes():
+            yield b"ab"
+            yield b"cd"
+
+        response = SimpleNamespace(iter_bytes=iter_bytes)
+        create = mocker.MagicMock()
+        create.return_value.__aenter__ = mocker.AsyncMock(return_value=response)
+        create.return_value.__aexit__ = mocker.AsyncMock(return_value=False)
+        client = SimpleNamespace(
+            audio=SimpleNamespace(
+                speech=SimpleNamespace(with_streaming_response=SimpleNamespace(create=create))
+            )
+        )
+        mocker.patch("app.services.tts_service.OpenAIClients.openai", return_value=client)
+
+        chunks = [chunk async for chunk in TTSService.synthesize_stream(text="contract")]
+
+        assert chunks == [b"ab", b"cd"]
+        assert create.call_args.kwargs["input"] == "contract"
+
+    async def test_stream_wraps_provider_errors(self, tts_store, mocker):
+        """Test streaming failures become ExternalServiceError."""
+        client = mocker.MagicMock()
+        client.audio.speech.with_streaming_response.create.side_effect = RuntimeError("boom")
+        mocker.patch("app.services.tts_service.OpenAIClients.openai", return_value=client)
+
+        with pytest.raises(ExternalServiceError):
+            [chunk async for chunk in TTSService.synthesize_stream(text="contract")]
+
+    async def test_requires_api_key(self, monkeypatch):
+        """Test a missing key is reported before calling the provider."""
+        monkeypatch.setattr(settings, "openai_api_key", "")
+
+        with pytest.raises(ExternalServiceError):
+            await TTSService.synthesize(text="contract")
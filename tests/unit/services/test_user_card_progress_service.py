@@ -1,16 +1,29 @@
 """Tests for UserCardProgressService."""
 
+import os
+import time
 from datetime import datetime, timedelta
 from uuid import uuid4
 
+import pytest
 from freezegun import freeze_time
 from fsrs import Card
 from fsrs import State as FSRSState
-
-from app.models import CardState, UserCardProgress, UserCardProgressCreate
+from sqlalchemy import event, insert
+from sqlmodel import func, select
+
+from app.models import (
+    CardState,
+    Deck,
+    ReviewLog,
+    UserCardProgress,
+    UserCardProgressCreate,
+    VocabularyCard,
+)
 from app.services.user_card_progress_service import UserCardProgressService
 from tests.factories.deck_factory import DeckFactory
 from tests.factories.profile_factory import ProfileFactory
+from tests.factories.review_log_factory import ReviewLogFactory
 from tests.factories.user_card_progress_factory import UserCardProgressFactory
 from tests.factories.vocabulary_card_factory import VocabularyCardFactory
 
@@ -120,9 +133,8 @@ class TestUpdateProgressFromCard:
         assert updated.correct_count == 1
         assert updated.stability == 3.0
         assert updated.difficulty == 4.5
-        assert updated.quality_history is not None
-        assert len(updated.quality_history) == 1
-        assert updated.quality_history[0]["is_correct"] is True
+        # History now lives in review_logs; the legacy JSON column is not written
+        assert updated.quality_history is None
 
     def test_update_after_wrong_review(self):
         """Test progress update after wrong answer."""
@@ -334,6 +346,30 @@ class TestProcessReview:
         assert progress.user_id == profile.id
         assert progress.card_id == card.id
 
+    async def test_process_review_writes_review_log(self, db_session):
+        """Test that each review appends one row to review_logs."""
+        profile = await ProfileFactory.create_async(db_session)
+        card = await VocabularyCardFactory.create_async(db_session)
+
+        await UserCardProgressService.process_review(
+            db_session, user_id=profile.id, card_id=card.id, is_correct=True
+        )
+        progress = await UserCardProgressService.process_review(
+            db_session, user_id=profile.id, card_id=card.id, is_correct=False
+        )
+
+        result = await db_session.exec(
+            select(ReviewLog)
+            .where(ReviewLog.user_id == profile.id)
+            .order_by(ReviewLog.reviewed_at, ReviewLog.id)
+        )
+        logs = list(result.all())
+
+        assert [log.is_correct for log in logs] == [True, False]
+        assert all(log.card_id == card.id for log in logs)
+        assert logs[-1].card_state == progress.card_state
+        assert logs[-1].stability == progress.stability
+
 
 class TestTodayProgress:
     """Tests for today's progress statistics."""
@@ -343,19 +379,15 @@ class TestTodayProgress:
         """Test getting today's progress statistics."""
         profile = await ProfileFactory.create_async(db_session, daily_goal=10)
 
-        # Create progress with today's reviews in quality_history
         card = await VocabularyCardFactory.create_async(db_session)
-        await UserCardProgressFactory.create_async(
-            db_session,
-            user_id=profile.id,
-            card_id=card.id,
-            last_review_date=datetime(2024, 1, 15, 10, 0, 0),
-            quality_history=[
-                {"date": "2024-01-15T08:00:00", "is_correct": True},
-                {"date": "2024-01-15T09:00:00", "is_correct": False},
-                {"date": "2024-01-15T10:00:00", "is_correct": True},
-            ],
-        )
+        for hour, is_correct in ((8, True), (9, False), (10, True)):
+            await ReviewLogFactory.create_async(
+                db_session,
+                user_id=profile.id,
+                card_id=card.id,
+                reviewed_at=datetime(2024, 1, 15, hour, 0, 0),
+                is_correct=is_correct,
+            )
 
         result = await UserCardProgressService.get_today_progress(
             db_session, profile.id, daily_goal=10
@@ -368,6 +400,30 @@ class TestTodayProgress:
         assert result["daily_goal"] == 10
         assert result["goal_progress"] == 30.0
 
+    @freeze_time("2024-01-15 12:00:00")
+    async def test_get_today_progress_only_counts_today_for_user(self, db_session):
+        """Test that reviews from other days and other users are excluded."""
+        profile = await ProfileFactory.create_async(db_session)
+        other_profile = await ProfileFactory.create_async(db_session)
+        card = await VocabularyCardFactory.create_async(db_session)
+
+        for user_id, reviewed_at in (
+            (profile.id, datetime(2024, 1, 15, 0, 0, 0)),  # start of today: counted
+            (profile.id, datetime(2024, 1, 14, 23, 59, 59)),  # yesterday
+            (profile.id, datetime(2024, 1, 16, 0, 0, 0)),  # tomorrow
+            (other_profile.id, datetime(2024, 1, 15, 9, 0, 0)),  # other user
+        ):
+            await ReviewLogFactory.create_async(
+                db_session, user_id=user_id, card_id=card.id, reviewed_at=reviewed_at
+            )
+
+        result = await UserCardProgressService.get_today_progress(
+            db_session, profile.id, daily_goal=10
+        )
+
+        assert result["total_reviews"] == 1
+        assert result["correct_count"] == 1
+
     async def test_get_today_progress_no_reviews(self, db_session):
         """Test today's progress with no reviews."""
         profile = await ProfileFactory.create_async(db_session)
@@ -450,6 +506,187 @@ class TestNewCardsCount:
         assert result["new_cards_count"] == 3
 
 
+class TestAvailabilityCounts:
+    """Tests for the single-query availability counts."""
+
+    @freeze_time("2024-01-15 12:00:00")
+    async def test_counts_new_review_and_relearning(self, db_session):
+        """Test that new cards use the anti-join and due cards are split by state."""
+        profile = await ProfileFactory.create_async(db_session, select_all_decks=True)
+        deck = await DeckFactory.create_async(db_session, is_public=True)
+        private_deck = await DeckFactory.create_async(db_session, is_public=False)
+
+        due = datetime(2024, 1, 14, 12, 0, 0)
+        not_due = datetime(2024, 1, 16, 12, 0, 0)
+        for state, next_review_date in (
+            (CardState.REVIEW, due),
+            (CardState.LEARNING, due),
+            (CardState.RELEARNING, due),
+            (CardState.REVIEW, not_due),
+        ):
+            card = await VocabularyCardFactory.create_async(db_session, deck_id=deck.id)
+            await UserCardProgressFactory.create_async(
+                db_session,
+                user_id=profile.id,
+                card_id=card.id,
+                card_state=state,
+                next_review_date=next_review_date,
+            )
+        for _ in range(2):
+            await VocabularyCardFactory.create_async(db_session, deck_id=deck.id)
+        await VocabularyCardFactory.create_async(db_session, deck_id=private_deck.id)
+
+        counts = await UserCardProgressService.get_availability_counts(db_session, profile)
+
+        assert counts == {"new_cards": 2, "review_cards": 2, "relearning_cards": 1}
+
+    @freeze_time("2024-01-15 12:00:00")
+    async def test_review_scope_limits_due_cards(self, db_session):
+        """Test that selected_decks_only review scope filters due cards by deck."""
+        from tests.factories.user_selected_deck_factory import UserSelectedDeckFactory
+
+        profile = await ProfileFactory.create_async(
+            db_session, select_all_decks=False, review_scope="selected_decks_only"
+        )
+        selected = await DeckFactory.create_async(db_session)
+        other = await DeckFactory.create_async(db_session)
+        await UserSelectedDeckFactory.create_async(
+            db_session, user_id=profile.id, deck_id=selected.id
+        )
+
+        for deck in (selected, other):
+            card = await VocabularyCardFactory.create_async(db_session, deck_id=deck.id)
+            await UserCardProgressFactory.create_async(
+                db_session,
+                user_id=profile.id,
+                card_id=card.id,
+                card_state=CardState.REVIEW,
+                next_review_date=datetime(2024, 1, 14, 12, 0, 0),
+            )
+
+        scoped = await UserCardProgressService.get_availability_counts(db_session, profile)
+        unscoped = await UserCardProgressService.get_availability_counts(
+            db_session, profile, apply_review_scope=False
+        )
+
+        assert scoped["review_cards"] == 1
+        assert unscoped["review_cards"] == 2
+
+
+# Opt-in: seeding 100k rows takes a while on sqlite
+BENCHMARK_PROGRESS_ROWS = int(os.environ.get("BENCHMARK_PROGRESS_ROWS", "100000"))
+
+
+@pytest.fixture
+async def heavy_user(db_session):
+    """A profile with BENCHMARK_PROGRESS_ROWS progress rows plus some unseen cards."""
+    profile = await ProfileFactory.create_async(db_session, select_all_decks=True)
+    deck = await DeckFactory.create_async(db_session, is_public=True)
+    await db_session.commit()
+
+    seen = BENCHMARK_PROGRESS_ROWS
+    unseen = max(1, seen // 10)
+    first_id = 1_000_000
+    await db_session.execute(
+        insert(VocabularyCard),
+        [
+            {
+                "id": first_id + i,
+                "english_word": f"word{i}",
+                "korean_meaning": f"뜻{i}",
+                "deck_id": deck.id,
+            }
+            for i in range(seen + unseen)
+        ],
+    )
+
+    now = datetime.utcnow()
+    states = (CardState.LEARNING, CardState.REVIEW, CardState.RELEARNING)
+    await db_session.execute(
+        insert(UserCardProgress),
+        [
+            {
+                "user_id": profile.id,
+                "card_id": first_id + i,
+                "card_state": states[i % len(states)],
+                "next_review_date": now + timedelta(days=i % 7 - 3),
+            }
+            for i in range(seen)
+        ],
+    )
+    await db_session.commit()
+    return profile
+
+
+@pytest.mark.skipif(not os.environ.get("RUN_BENCHMARKS"), reason="set RUN_BENCHMARKS=1 to run")
+class TestAvailabilityCountsBenchmark:
+    """Compare the combined availability query with the old three-query version."""
+
+    @staticmethod
+    async def _legacy_counts(session, profile, now):
+        """The pre-rework shape: NOT IN subquery plus one count per due state."""
+        seen_subquery = select(UserCardProgress.card_id).where(
+            UserCardProgress.user_id == profile.id
+        )
+        new_query = (
+            select(func.count(VocabularyCard.id))
+            .where(VocabularyCard.id.not_in(seen_subquery))
+            .join(Deck, VocabularyCard.deck_id == Deck.id, isouter=True)
+            .where((Deck.is_public == True) | (VocabularyCard.deck_id == None))  # noqa: E711, E712
+        )
+        due_query = (
+            select(func.count(UserCardProgress.id))
+            .join(VocabularyCard, VocabularyCard.id == UserCardProgress.card_id)
+            .where(
+                UserCardProgress.user_id == profile.id,
+                UserCardProgress.next_review_date <= now,
+            )
+        )
+        new_cards = (await session.exec(new_query)).one()
+        relearning = (
+            await session.exec(due_query.where(UserCardProgress.card_state == CardState.RELEARNING))
+        ).one()
+        review = (
+            await session.exec(due_query.where(UserCardProgress.card_state != CardState.RELEARNING))
+        ).one()
+        return {"new_cards": new_cards, "review_cards": review, "relearning_cards": relearning}
+
+    async def test_single_round_trip_is_faster(self, db_session, heavy_user):
+        """Same counts, one statement instead of three, and no slower end to end."""
+        now = datetime.utcnow()
+        statements: list[str] = []
+
+        def count_statement(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        async def best_of(fn, runs=5):
+            timings = []
+            for _ in range(runs):
+                started = time.perf_counter()
+                result = await fn()
+                timings.append(time.perf_counter() - started)
+            return min(timings), result
+
+        legacy_seconds, legacy = await best_of(
+            lambda: self._legacy_counts(db_session, heavy_user, now)
+        )
+
+        combined_seconds, combined = await best_of(
+            lambda: UserCardProgressService.get_availability_counts(db_session, heavy_user, now=now)
+        )
+
+        engine = db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", count_statement)
+        try:
+            await UserCardProgressService.get_availability_counts(db_session, heavy_user, now=now)
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        assert combined == legacy
+        assert len(statements) == 1
+        assert combined_seconds < legacy_seconds
+
+
 class TestUpdateProgressFromCardEdgeCases:
     """Tests for edge cases in update_progress_from_card."""
 
@@ -479,8 +716,12 @@ class TestUpdateProgressFromCardEdgeCases:
         assert updated.interval == 0
         assert updated.next_review_date is None
 
-    def test_update_appends_to_existing_history(self):
-        """Test that review appends to existing quality_history."""
+    def test_update_leaves_legacy_history_untouched(self):
+        """Test that existing quality_history is kept but no longer appended to."""
+        legacy_history = [
+            {"date": "2024-01-10T10:00:00", "is_correct": True},
+            {"date": "2024-01-12T11:00:00", "is_correct": True},
+        ]
         progress = UserCardProgress(
             id=1,
             user_id=uuid4(),
@@ -489,10 +730,7 @@ class TestUpdateProgressFromCardEdgeCases:
             next_review_date=datetime.utcnow(),
             total_reviews=2,
             correct_count=2,
-            quality_history=[
-                {"date": "2024-01-10T10:00:00", "is_correct": True},
-                {"date": "2024-01-12T11:00:00", "is_correct": True},
-            ],
+            quality_history=list(legacy_history),
         )
 
         card = Card()
@@ -506,36 +744,8 @@ class TestUpdateProgressFromCardEdgeCases:
             progress, card, is_correct=True, review_datetime=now
         )
 
-        assert len(updated.quality_history) == 3
-        assert updated.quality_history[-1]["is_correct"] is True
-
-    def test_update_with_non_list_history_replaces(self):
-        """Test that non-list quality_history is replaced with list."""
-        progress = UserCardProgress(
-            id=1,
-            user_id=uuid4(),
-            card_id=1,
-            card_state=CardState.LEARNING,
-            next_review_date=datetime.utcnow(),
-            total_reviews=1,
-            correct_count=1,
-            quality_history="invalid_data",  # Should be list but isn't
-        )
-
-        card = Card()
-        card.state = FSRSState.Review
-        card.stability = 5.0
-        card.difficulty = 4.0
-        card.due = datetime.utcnow() + timedelta(days=3)
-
-        now = datetime.utcnow()
-        updated = UserCardProgressService.update_progress_from_card(
-            progress, card, is_correct=True, review_datetime=now
-        )
-
-        # Should replace with a list containing new entry
-        assert isinstance(updated.quality_history, list)
-        assert len(updated.quality_history) == 1
+        assert updated.quality_history == legacy_history
+        assert updated.total_reviews == 3
 
 
 class TestGetUserProgress:
@@ -574,8 +784,8 @@ class TestTodayProgressEdgeCases:
     """Tests for edge cases in get_today_progress."""
 
     @freeze_time("2024-01-15 12:00:00")
-    async def test_today_progress_with_invalid_date_format(self, db_session):
-        """Test progress with invalid date format in quality_history is skipped."""
+    async def test_today_progress_ignores_legacy_quality_history(self, db_session):
+        """Test that only review_logs rows are counted, not legacy JSON history."""
         profile = await ProfileFactory.create_async(db_session)
 
         card = await VocabularyCardFactory.create_async(db_session)
@@ -583,13 +793,11 @@ class TestTodayProgressEdgeCases:
             db_session,
             user_id=profile.id,
             card_id=card.id,
+            last_review_date=datetime(2024, 1, 15, 8, 0, 0),
             quality_history=[
                 {"date": "2024-01-15T08:00:00", "is_correct": True},
-                {
-                    "date": "invalid_date",
-                    "is_correct": True,
-                },  # Invalid - will be skipped
-                {"is_correct": True},  # Missing date - will be skipped
+                {"date": "invalid_date", "is_correct": True},
+                {"is_correct": True},
             ],
         )
 
@@ -597,7 +805,5 @@ class TestTodayProgressEdgeCases:
             db_session, profile.id, daily_goal=10
         )
 
-        # Invalid entries are skipped via try/except continue
-        # Only valid entry with today's date is counted
-        assert result["total_reviews"] >= 0
-        assert result["correct_count"] >= 0
+        assert result["total_reviews"] == 0
+        assert result["correct_count"] == 0
@@ -0,0 +1,249 @@
+"""Tests for the word tutor's bounded conversation memory (history budget + rolling summary)."""
+
+import asyncio
+import json
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from sqlmodel import select
+
+from app.config import settings
+from app.models import ChatRole, WordTutorThread
+from app.models.schemas.word_tutor import TutorMessageRequest
+from app.services import word_tutor_graph
+from app.services.word_tutor_graph import (
+    _fit_history,
+    _load_context,
+    _truncate_to_tokens,
+    estimate_tokens,
+    message_tokens,
+)
+from app.services.word_tutor_service import WordTutorService
+from tests.factories.profile_factory import ProfileFactory
+from tests.factories.study_session_factory import StudySessionFactory
+from tests.factories.vocabulary_card_factory import VocabularyCardFactory
+from tests.factories.word_tutor_factory import WordTutorMessageFactory, WordTutorThreadFactory
+
+QUESTION = "'contract'와 'agreement'는 어떤 차이가 있나요? 예문도 같이 보여주세요."
+ANSWER = (
+    "'contract'는 법적 구속력이 있는 계약서를, 'agreement'는 더 넓은 의미의 합의를 말해요. "
+    "예: We signed a contract with the supplier. (공급업체와 계약을 체결했다.)"
+)
+SUMMARY = "학습자는 contract와 agreement의 차이를 물었고, 튜터는 법적 구속력 여부로 설명했다."
+
+
+def _prompt_tokens(body: dict) -> int:
+    """Estimated prompt tokens of a chat completion request body."""
+    return sum(
+        estimate_tokens(m["content"]) + word_tutor_graph._MESSAGE_OVERHEAD_TOKENS
+        for m in body["messages"]
+    )
+
+
+def _is_summary_request(body: dict) -> bool:
+    return "response_format" not in body and "tools" not in body
+
+
+def _tutor_reply(body: dict) -> str:
+    """Fake server reply: structured answers for the tutor, plain text for summaries."""
+    if _is_summary_request(body):
+        return SUMMARY
+    return json.dumps(
+        {"answer": ANSWER, "follow_up_questions": ["다른 예문도 보여줘"]}, ensure_ascii=False
+    )
+
+
+async def _tutor_ids(db_session):
+    profile = await ProfileFactory.create_async(db_session)
+    card = await VocabularyCardFactory.create_async(
+        db_session, english_word="contract", korean_meaning="계약"
+    )
+    session = await StudySessionFactory.create_async(
+        db_session, user_id=profile.id, card_ids=[card.id]
+    )
+    return {"user_id": profile.id, "session_id": session.id, "card_id": card.id}
+
+
+async def _thread(db_session) -> WordTutorThread:
+    thread = (await db_session.exec(select(WordTutorThread))).one()
+    await db_session.refresh(thread)
+    return thread
+
+
+async def _converse(db_session, ids, turns: int):
+    for _ in range(turns):
+        await WordTutorService.send_message(
+            db_session, **ids, request=TutorMessageRequest(message=QUESTION)
+        )
+        await WordTutorService.wait_for_summary_refreshes()
+
+
+class TestTokenBudget:
+    """Tests for the token estimate and the budget helpers."""
+
+    def test_estimate_tokens(self):
+        """Test ASCII counts ~4 characters per token and Hangul one per character."""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("contract") == 2
+        assert estimate_tokens("계약") == 2
+        assert estimate_tokens("contract 계약") == 5
+
+    def test_fit_history_keeps_the_newest(self):
+        """Test the oldest messages are dropped first."""
+        messages = [HumanMessage(content=f"질문 {i}") for i in range(10)]
+        budget = sum(message_tokens(m) for m in messages[-3:])
+
+        assert _fit_history(messages, budget) == messages[-3:]
+        assert _fit_history(messages, budget - 1) == messages[-2:]
+        assert _fit_history(messages, 0) == []
+
+    def test_truncate_to_tokens(self):
+        """Test text is cut at the token budget."""
+        assert _truncate_to_tokens("계약서", 2) == "계약"
+        assert _truncate_to_tokens("contract", 1) == "cont"
+        assert _truncate_to_tokens("contract", 5) == "contract"
+
+
+class TestLoadContext:
+    """Tests for the history loaded into the tutor prompt."""
+
+    async def test_loads_the_most_recent_messages(self, db_session, monkeypatch):
+        """Test a long thread contributes its latest messages, not its first ones."""
+        monkeypatch.setattr(settings, "tutor_history_max_messages", 5)
+        card = await VocabularyCardFactory.create_async(db_session)
+        thread = await WordTutorThreadFactory.create_async(db_session, card_id=card.id)
+        start = datetime(2026, 1, 1)
+        for i in range(20):
+            await WordTutorMessageFactory.create_async(
+                db_session,
+                thread_id=thread.id,
+                role=ChatRole.USER if i % 2 == 0 else ChatRole.ASSISTANT,
+                content=f"message {i}",
+                created_at=start + timedelta(seconds=i),
+            )
+
+        out = await _load_context({"db": db_session, "thread_id": thread.id})
+
+        assert [m.content for m in out["messages"]] == [f"message {i}" for i in range(15, 20)]
+        assert isinstance(out["messages"][-1], AIMessage)
+
+    async def test_skips_summarized_messages(self, db_session):
+        """Test messages folded into the summary aren't loaded again."""
+        card = await VocabularyCardFactory.create_async(db_session)
+        start = datetime(2026, 1, 1)
+        thread = await WordTutorThreadFactory.create_async(
+            db_session,
+            card_id=card.id,
+            summary=SUMMARY,
+            summarized_until=start + timedelta(seconds=1),
+        )
+        for i in range(4):
+            await WordTutorMessageFactory.create_async(
+                db_session,
+                thread_id=thread.id,
+                content=f"message {i}",
+                created_at=start + timedelta(seconds=i),
+            )
+
+        out = await _load_context({"db": db_session, "thread_id": thread.id})
+
+        assert [m.content for m in out["messages"]] == ["message 2", "message 3"]
+        assert out["summary"] == SUMMARY
+
+
+class TestRollingSummary:
+    """Long conversations against a local fake chat-completions server."""
+
+    async def test_prompt_size_stays_bounded(self, db_session, fake_openai, monkeypatch):
+        """Test older turns move into the summary and the prompt stops growing."""
+        monkeypatch.setattr(settings, "tutor_history_max_tokens", 300)
+        monkeypatch.setattr(settings, "tutor_summary_max_tokens", 60)
+        fake_openai.chat_reply = _tutor_reply
+        ids = await _tutor_ids(db_session)
+
+        await _converse(db_session, ids, turns=12)
+
+        answers = [b for b in fake_openai.chat_bodies if not _is_summary_request(b)]
+        summaries = [b for b in fake_openai.chat_bodies if _is_summary_request(b)]
+        tokens = [_prompt_tokens(b) for b in answers]
+        assert len(answers) == 12
+        assert 1 <= len(summaries) < 12
+        # Growing at first, then capped by history + summary budgets
+        assert tokens[3] > tokens[0]
+        assert max(tokens) <= tokens[0] + 300 + 60 + 2 * word_tutor_graph._MESSAGE_OVERHEAD_TOKENS
+        # The previous summary is folded into the next one
+        assert SUMMARY in summaries[-1]["messages"][-1]["content"]
+
+        thread = await _thread(db_session)
+        assert thread.summary == _truncate_to_tokens(SUMMARY, 60)
+        assert thread.summarized_until is not None
+        assert "[이전 대화 요약]" in answers[-1]["messages"][2]["content"]
+
+    async def test_summary_failure_keeps_the_turn(self, db_session, fake_openai, mocker):
+        """Test a failed summary doesn't fail the turn and is retried next turn."""
+        mocker.patch.object(settings, "tutor_history_max_tokens", 60)
+        fake_openai.chat_reply = _tutor_reply
+        ids = await _tutor_ids(db_session)
+
+        failing = mocker.patch.object(
+            word_tutor_graph, "summarize_conversation", side_effect=RuntimeError("provider down")
+        )
+        await _converse(db_session, ids, turns=2)
+        assert failing.await_count == 2
+        assert (await _thread(db_session)).summary is None
+
+        mocker.stop(failing)
+        await _converse(db_session, ids, turns=1)
+        assert (await _thread(db_session)).summary == SUMMARY
+
+    async def test_reply_does_not_wait_for_summary(self, db_session, fake_openai, mocker):
+        """Test the summary is refreshed after the reply, off the request path."""
+        mocker.patch.object(settings, "tutor_history_max_tokens", 60)
+        fake_openai.chat_reply = _tutor_reply
+        ids = await _tutor_ids(db_session)
+        release = asyncio.Event()
+
+        async def slow_summary(previous_summary, messages):
+            await release.wait()
+            return SUMMARY
+
+        mocker.patch.object(word_tutor_graph, "summarize_conversation", side_effect=slow_summary)
+
+        result = await asyncio.wait_for(
+            WordTutorService.send_message(
+                db_session, **ids, request=TutorMessageRequest(message=QUESTION)
+            ),
+            timeout=5,
+        )
+        assert result.assistant_message == ANSWER
+        assert (await _thread(db_session)).summary is None
+
+        release.set()
+        await WordTutorService.wait_for_summary_refreshes()
+        assert (await _thread(db_session)).summary == SUMMARY
+
+
+@pytest.mark.skipif(not os.environ.get("RUN_BENCHMARKS"), reason="set RUN_BENCHMARKS=1 to run")
+class TestTutorMemoryBenchmark:
+    """Prompt tokens per turn over a long conversation against the local fake server."""
+
+    async def test_tokens_per_turn(self, db_session, fake_openai):
+        """Report estimated prompt tokens per answer turn with the default budgets."""
+        turns = int(os.environ.get("BENCHMARK_TUTOR_TURNS", "100"))
+        fake_openai.chat_reply = _tutor_reply
+        ids = await _tutor_ids(db_session)
+
+        await _converse(db_session, ids, turns=turns)
+
+        answers = [_prompt_tokens(b) for b in fake_openai.chat_bodies if not _is_summary_request(b)]
+        summaries = [_prompt_tokens(b) for b in fake_openai.chat_bodies if _is_summary_request(b)]
+        for turn in sorted({1, 2, 5, 10, 20, 50, turns} & set(range(1, turns + 1))):
+            print(f"turn {turn:>4}: {answers[turn - 1]:>5} prompt tokens")
+        print(
+            f"max {max(answers)} prompt tokens/turn over {turns} turns; "
+            f"{len(summaries)} summary refreshes, {sum(summaries)} summary prompt tokens"
+        )
+        bound = settings.tutor_history_max_tokens + settings.tutor_summary_max_tokens
+        assert max(answers) <= answers[0] + bound + 2 * word_tutor_graph._MESSAGE_OVERHEAD_TOKENS
@@ -4,10 +4,12 @@ from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
+from langchain_core.messages import AIMessageChunk
 
 from app.core.exceptions import ExternalServiceError, NotFoundError, ValidationError
 from app.models import ChatRole, SessionStatus
-from app.models.schemas.word_tutor import TutorMessageRequest
+from app.models.schemas.word_tutor import TutorMessageRequest, TutorStreamToken
+from app.services.word_tutor_graph import FOLLOW_UP_MARKER, _AnswerSplitter, _split_follow_ups
 from app.services.word_tutor_service import WordTutorService
 from tests.factories.profile_factory import ProfileFactory
 from tests.factories.study_session_factory import StudySessionFactory
@@ -288,6 +290,147 @@ class TestSendMessage:
         assert len(result.follow_up_questions) == 1
 
 
+async def _tutor_session(db_session):
+    profile = await ProfileFactory.create_async(db_session)
+    card = await VocabularyCardFactory.create_async(
+        db_session, english_word="contract", korean_meaning="계약"
+    )
+    session = await StudySessionFactory.create_async(
+        db_session, user_id=profile.id, card_ids=[card.id]
+    )
+    return {"user_id": profile.id, "session_id": session.id, "card_id": card.id}
+
+
+async def _collect(events):
+    tokens, final = [], None
+    async for event in events:
+        if isinstance(event, TutorStreamToken):
+            tokens.append(event.text)
+        else:
+            final = event
+    return tokens, final
+
+
+class _FailingLLM:
+    """Chat model stand-in that yields ``chunks`` and then raises."""
+
+    def __init__(self, *chunks):
+        self._chunks = chunks
+
+    async def astream(self, messages):
+        for text in self._chunks:
+            yield AIMessageChunk(content=text)
+        raise RuntimeError("provider down")
+
+
+class TestStreamMessage:
+    """Tests for streaming tutor replies, against a local fake chat-completions server."""
+
+    async def test_streams_tokens_then_follow_ups(self, db_session, fake_openai):
+        """Test the answer arrives in pieces, follow-ups come last and the turn is saved."""
+        fake_openai.chat_reply = (
+            "'contract'는 계약이라는 뜻이에요.\n"
+            f"{FOLLOW_UP_MARKER}\n"
+            "- 예문을 더 보여줘\n"
+            "- 'agreement'와 차이는?"
+        )
+        fake_openai.chat_chunk_size = 3
+        ids = await _tutor_session(db_session)
+
+        events = await WordTutorService.stream_message(
+            db_session, **ids, request=TutorMessageRequest(message="무슨 뜻이야?")
+        )
+        tokens, final = await _collect(events)
+
+        assert len(tokens) > 1
+        assert "".join(tokens).strip() == "'contract'는 계약이라는 뜻이에요."
+        assert not any("[" in token for token in tokens)
+        assert final.assistant_message == "'contract'는 계약이라는 뜻이에요."
+        assert final.follow_up_questions == ["예문을 더 보여줘", "'agreement'와 차이는?"]
+        assert fake_openai.chat_bodies[0]["stream"] is True
+
+        history = await WordTutorService.history(db_session, **ids)
+        assert [m.role for m in history.messages] == [ChatRole.USER, ChatRole.ASSISTANT]
+        assert history.messages[1].content == final.assistant_message
+        assert history.messages[1].suggested_questions == final.follow_up_questions
+
+    async def test_validation_errors_raise_before_streaming(self, db_session, fake_openai):
+        """Test a card outside the session fails on the call, not mid-stream."""
+        ids = await _tutor_session(db_session)
+
+        with pytest.raises(ValidationError):
+            await WordTutorService.stream_message(
+                db_session,
+                **{**ids, "card_id": 99999},
+                request=TutorMessageRequest(message="무슨 뜻이야?"),
+            )
+        assert fake_openai.requests == 0
+
+    async def test_failure_before_tokens_streams_fallback(self, db_session, mocker):
+        """Test an LLM error before any text yields the fallback answer and saves it."""
+        mocker.patch("app.services.word_tutor_service.settings.openai_api_key", "test_key")
+        mocker.patch("app.services.word_tutor_graph._build_llm", return_value=_FailingLLM())
+        ids = await _tutor_session(db_session)
+
+        events = await WordTutorService.stream_message(
+            db_session, **ids, request=TutorMessageRequest(message="무슨 뜻이야?")
+        )
+        tokens, final = await _collect(events)
+
+        assert tokens == [final.assistant_message]
+        assert final.follow_up_questions == []
+
+    async def test_failure_after_tokens_is_not_saved(self, db_session, mocker):
+        """Test an LLM error mid-answer ends the stream without saving half a turn."""
+        mocker.patch("app.services.word_tutor_service.settings.openai_api_key", "test_key")
+        mocker.patch(
+            "app.services.word_tutor_graph._build_llm", return_value=_FailingLLM("계약이라는 ")
+        )
+        ids = await _tutor_session(db_session)
+
+        events = await WordTutorService.stream_message(
+            db_session, **ids, request=TutorMessageRequest(message="무슨 뜻이야?")
+        )
+        with pytest.raises(RuntimeError):
+            await _collect(events)
+
+        history = await WordTutorService.history(db_session, **ids)
+        assert history.messages == []
+
+
+class TestAnswerSplitter:
+    """Tests for separating streamed answers from follow-up questions."""
+
+    def test_marker_split_across_chunks_is_hidden(self):
+        """Test no part of the marker leaks into the visible text."""
+        splitter = _AnswerSplitter()
+        text = f"답변입니다\n{FOLLOW_UP_MARKER}\n질문1"
+
+        visible = "".join(splitter.feed(text[i : i + 2]) for i in range(0, len(text), 2))
+
+        assert visible + splitter.flush() == "답변입니다\n"
+
+    def test_partial_marker_at_end_is_flushed(self):
+        """Test text that only looked like the marker start is released at the end."""
+        splitter = _AnswerSplitter()
+
+        assert splitter.feed("배열 [[") == "배열 "
+        assert splitter.flush() == "[["
+
+    def test_split_follow_ups(self):
+        """Test bullets and numbering are stripped from follow-up questions."""
+        answer, questions = _split_follow_ups(
+            f"답변\n{FOLLOW_UP_MARKER}\n1. 첫 질문\n- 둘째 질문\n\n"
+        )
+
+        assert answer == "답변"
+        assert questions == ["첫 질문", "둘째 질문"]
+
+    def test_reply_without_marker(self):
+        """Test a reply that skips the marker is all answer."""
+        assert _split_follow_ups("답변만 있어요") == ("답변만 있어요", [])
+
+
 class TestHistory:
     """Tests for retrieving conversation history."""
 
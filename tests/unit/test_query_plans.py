@@ -0,0 +1,200 @@
+"""Query-plan regression tests for the due-card and new-card lookups.
+
+The real statements issued by the services are captured and run through the
+database's EXPLAIN. On Postgres sequential scans are disabled so the tiny test
+tables don't hide a missing index; on SQLite ``EXPLAIN QUERY PLAN`` is used.
+"""
+
+import json
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql
+from sqlmodel import select
+
+from app.models import CardState, NewCardFrontier, UserCardProgress
+from app.services.new_card_frontier_service import NewCardFrontierService
+from app.services.study_session_service import StudySessionService
+from app.services.user_card_progress_service import UserCardProgressService
+from tests.factories.deck_factory import DeckFactory
+from tests.factories.profile_factory import ProfileFactory
+from tests.factories.user_card_progress_factory import UserCardProgressFactory
+from tests.factories.vocabulary_card_factory import VocabularyCardFactory
+
+DUE_INDEXES = {
+    "ix_user_card_progress_due",
+    "ix_user_card_progress_user_id_next_review_date",
+    "ix_user_card_progress_user_id_card_state_next_review_date",
+}
+DUE_INDEX = "ix_user_card_progress_due"
+NEW_CARD_INDEX = "ix_vocabulary_cards_deck_rank_id"
+
+
+async def _capture_statements(db_session, call) -> list[tuple[str, object]]:
+    """Run ``call`` and return the (statement, parameters) it sent to the database."""
+    statements: list[tuple[str, object]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if "user_card_progress" in statement and statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        await call()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    return statements
+
+
+def _index_names(node) -> set[str]:
+    """Collect every "Index Name" from a Postgres JSON plan."""
+    names: set[str] = set()
+    if isinstance(node, dict):
+        if "Index Name" in node:
+            names.add(node["Index Name"])
+        for value in node.values():
+            names |= _index_names(value)
+    elif isinstance(node, list):
+        for item in node:
+            names |= _index_names(item)
+    return names
+
+
+async def _plan_indexes(
+    db_session, statement: str, parameters, indexes: set[str] = DUE_INDEXES
+) -> set[str]:
+    """Return which of ``indexes`` the plan for ``statement`` uses."""
+    conn = await db_session.connection()
+    if conn.dialect.name == "postgresql":
+        await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        plan = result.scalar_one()
+        return _index_names(json.loads(plan) if isinstance(plan, str) else plan) & indexes
+
+    result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    details = [row[-1] for row in result.all()]
+    return {name for name in indexes for detail in details if f"INDEX {name} " in detail}
+
+
+@pytest.fixture
+async def due_user(db_session):
+    """A user with a mix of due, not-yet-due and NEW progress rows."""
+    profile = await ProfileFactory.create_async(
+        db_session, select_all_decks=True, review_scope="all_learned"
+    )
+    deck = await DeckFactory.create_async(db_session, is_public=True)
+    now = datetime.utcnow()
+    for i in range(30):
+        card = await VocabularyCardFactory.create_async(db_session, deck_id=deck.id)
+        if i % 3 == 0:
+            await UserCardProgressFactory.create_async(
+                db_session, user_id=profile.id, card_id=card.id, card_state=CardState.NEW
+            )
+        else:
+            await UserCardProgressFactory.create_async(
+                db_session,
+                user_id=profile.id,
+                card_id=card.id,
+                next_review_date=now + timedelta(days=i - 15),
+                review=True,
+            )
+    await db_session.commit()
+    return profile
+
+
+class TestDueCardQueryPlans:
+    """The due-card queries must be served by the composite/partial indexes."""
+
+    async def _assert_uses_due_index(self, db_session, call):
+        statements = await _capture_statements(db_session, call)
+        assert statements
+
+        for statement, parameters in statements:
+            used = await _plan_indexes(db_session, statement, parameters)
+            assert DUE_INDEX in used, f"partial due-card index not used by:\n{statement}"
+
+    async def test_get_due_cards_uses_index(self, db_session, due_user):
+        """Test UserCardProgressService.get_due_cards."""
+        await self._assert_uses_due_index(
+            db_session,
+            lambda: UserCardProgressService.get_due_cards(db_session, due_user.id, limit=10),
+        )
+
+    async def test_get_due_card_summaries_uses_index(self, db_session, due_user):
+        """Test UserCardProgressService.get_due_card_summaries (study overview)."""
+        await self._assert_uses_due_index(
+            db_session,
+            lambda: UserCardProgressService.get_due_card_summaries(
+                db_session, due_user.id, limit=10
+            ),
+        )
+
+    async def test_get_due_review_cards_uses_index(self, db_session, due_user):
+        """Test StudySessionService._get_due_review_cards."""
+        await self._assert_uses_due_index(
+            db_session,
+            lambda: StudySessionService._get_due_review_cards(db_session, due_user.id, limit=10),
+        )
+
+    async def test_availability_counts_use_index(self, db_session, due_user):
+        """Test the due-card side of the session preview counts."""
+        statements = await _capture_statements(
+            db_session,
+            lambda: UserCardProgressService.get_availability_counts(db_session, due_user),
+        )
+        assert len(statements) == 1
+
+        used = await _plan_indexes(db_session, *statements[0])
+        assert DUE_INDEX in used
+
+    def test_due_conditions_match_partial_index_predicate(self):
+        """Test the NEW exclusion is inline SQL, not a parameter a generic plan can't match."""
+        statement = select(UserCardProgress.id).where(
+            *UserCardProgressService.due_conditions(uuid4(), datetime.utcnow())
+        )
+        compiled = statement.compile(dialect=postgresql.dialect())
+
+        assert "user_card_progress.card_state != 'NEW'" in str(compiled)
+        assert CardState.NEW not in compiled.params.values()
+
+    async def test_due_cards_exclude_new_rows(self, db_session, due_user):
+        """Test NEW rows are never returned as due, matching the partial index."""
+        due = await UserCardProgressService.get_due_cards(db_session, due_user.id, limit=100)
+
+        assert due
+        assert all(progress.card_state != CardState.NEW for progress in due)
+        assert all(progress.next_review_date <= datetime.utcnow() for progress in due)
+
+
+class TestNewCardQueryPlans:
+    """Unseen cards must be read per deck along the (deck, rank, id) index."""
+
+    async def test_get_unseen_cards_uses_index(self, db_session):
+        """Test each deck is read from its frontier with an index range."""
+        profile = await ProfileFactory.create_async(db_session, select_all_decks=True)
+        for _ in range(2):
+            deck = await DeckFactory.create_async(db_session, is_public=True)
+            cards = [
+                await VocabularyCardFactory.create_async(
+                    db_session, deck_id=deck.id, frequency_rank=rank
+                )
+                for rank in range(1, 21)
+            ]
+            db_session.add(
+                NewCardFrontier(
+                    user_id=profile.id, deck_id=deck.id, next_rank=10, next_card_id=cards[9].id
+                )
+            )
+        await db_session.commit()
+
+        statements = await _capture_statements(
+            db_session,
+            lambda: NewCardFrontierService.get_unseen_cards(db_session, profile, limit=5),
+        )
+        assert len(statements) == 1
+
+        used = await _plan_indexes(db_session, *statements[0], indexes={NEW_CARD_INDEX})
+        assert used == {NEW_CARD_INDEX}